@@ -1,5 +1,6 @@
-from rummikub.game import Game
-
 if __name__ == "__main__":
+    # Imported here so search worker processes, which re-import this module, don't load pygame
+    from rummikub.game import Game
+
     game = Game()
-    game.run()
\ No newline at end of file
+    game.run()
@@ -0,0 +1,64 @@
+"""
+Computer opponents.
+
+A ComputerPlayer hands a snapshot of the table and its rack to a Strategy in a
+worker process; the game screen polls it every frame and plays the best move
+found once the search finishes or its time budget runs out.
+
+The strategies are pygame-free. ComputerPlayer, MoveSearch and MOVE_READY
+need pygame and are only imported on first use, so headless code such as the
+simulator can import this package without it.
+"""
+import importlib
+
+from rummikub.ai.strategy import (
+    Move,
+    Opponent,
+    Strategy,
+    GreedyStrategy,
+    SolverStrategy,
+    STRATEGIES,
+    get_strategy,
+    credited_points,
+    run_search,
+)
+from rummikub.ai.mcts import MCTSStrategy
+from rummikub.ai.pool import WORKERS, get_pool, shutdown_pool
+
+# Difficulty levels offered in the setup menu: (strategy name, seconds per turn, strategy options).
+# Expert players split their search over the whole shared worker pool.
+LEVELS = {
+    'Easy': ('greedy', 0.5, {}),
+    'Normal': ('solver', 1.0, {}),
+    'Hard': ('solver', 3.0, {}),
+    'Expert': ('mcts', 3.0, {'workers': WORKERS}),
+}
+
+# Exports that need pygame, imported from rummikub.ai.player on first access
+_PYGAME_EXPORTS = ('ComputerPlayer', 'MoveSearch', 'MOVE_READY')
+
+
+def __getattr__(name: str):
+    if name in _PYGAME_EXPORTS:
+        return getattr(importlib.import_module('rummikub.ai.player'), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'Move',
+    'Opponent',
+    'Strategy',
+    'GreedyStrategy',
+    'SolverStrategy',
+    'MCTSStrategy',
+    'get_pool',
+    'shutdown_pool',
+    'STRATEGIES',
+    'get_strategy',
+    'credited_points',
+    'run_search',
+    'ComputerPlayer',
+    'MoveSearch',
+    'MOVE_READY',
+    'LEVELS',
+]
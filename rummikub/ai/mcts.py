@@ -0,0 +1,286 @@
+"""
+Information-set Monte Carlo tree search.
+
+Opponents' racks and the deck order are hidden, so every iteration samples a
+determinization: the tiles the player can't see are shuffled and dealt to the
+opponents (at their known rack sizes) and the deck. The candidate moves at the
+root only depend on what the player can see, so they are available in every
+determinization and their statistics are shared across them. Each iteration
+picks a candidate by UCB1, plays it in the sampled world and rolls the game
+out with the greedy policy for every player.
+
+With more than one worker the search is root-parallel: each process runs its
+own iterations with its own random stream and the root statistics are summed.
+The work runs on the process-wide pool from rummikub.ai.pool, so later moves
+and other players don't pay for process startup.
+"""
+import math
+import random
+import time
+from collections import Counter
+from concurrent.futures import as_completed
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from rummikub import rules
+from rummikub.rules import TileSpec
+from rummikub.rules.encoding import COLORS
+from rummikub.ai.pool import get_pool
+from rummikub.ai.strategy import Move, Opponent, Strategy, GreedyStrategy, SolverStrategy, STRATEGIES
+
+# Every tile of a standard set as (number, color, is_joker), two copies each
+FULL_SET = Counter({(number, color, False): 2 for color in COLORS for number in range(1, 14)})
+FULL_SET[(0, "joker", True)] = 2
+
+# Sampled tiles get ids no real tile uses
+SAMPLED_ID_BASE = 1000
+
+
+class _Position(NamedTuple):
+    """Everything the searching player knows, in picklable form."""
+    table_sets: List[List[TileSpec]]
+    rack: List[TileSpec]
+    initial_meld: bool
+    opponents: Tuple[Opponent, ...]
+
+
+def unseen_tiles(position: _Position) -> List[TileSpec]:
+    """
+    List the tiles the player can't see: the opponents' racks and the deck.
+
+    Tiles are matched by number and color, not id, so this works for any deck.
+
+    Returns:
+        List[TileSpec]: One spec per hidden tile, with fresh ids
+    """
+    hidden = Counter(FULL_SET)
+    for tile in [tile for tile_set in position.table_sets for tile in tile_set] + position.rack:
+        key = (0, "joker", True) if rules.is_joker(tile) else (tile.number, tile.color, False)
+        hidden[key] -= 1
+    tiles = []
+    for (number, color, is_joker), count in sorted(hidden.items()):
+        for _ in range(max(count, 0)):
+            tiles.append(TileSpec(SAMPLED_ID_BASE + len(tiles), number, color, is_joker))
+    return tiles
+
+
+def candidate_moves(position: _Position, deadline: Optional[float]) -> List[Optional[Move]]:
+    """
+    Build the moves considered at the root: drawing, plus the distinct moves the
+    solver finds (rack-only first, then rearranging the table) under both objectives.
+
+    Returns:
+        list: Candidate moves, the one playing the most tiles first and None (draw) last
+    """
+    moves = []
+    seen = set()
+    try:
+        for strategy in (SolverStrategy(rules.TILES), SolverStrategy(rules.POINTS)):
+            for move in strategy.search(position.table_sets, position.rack, position.initial_meld, deadline):
+                key = frozenset(tile.id for tile in move.played)
+                if key not in seen:
+                    seen.add(key)
+                    moves.append(move)
+    except TimeoutError:
+        pass  # Search whatever was found in time
+    moves.sort(key=lambda move: len(move.played), reverse=True)
+    return moves + [None]
+
+
+class _Tree:
+    """
+    Root statistics of one search, shared by every determinization.
+
+    Attributes:
+        visits (List[int]): Iterations that tried each candidate
+        rewards (List[float]): Summed rewards of each candidate
+    """
+
+    def __init__(self, position: _Position, candidates: List[Optional[Move]], rng: random.Random,
+                 exploration: float, rollout_rounds: int):
+        self.position = position
+        self.candidates = candidates
+        self.rng = rng
+        self.exploration = exploration
+        self.rollout_rounds = rollout_rounds
+        self.unseen = unseen_tiles(position)
+        self.greedy = GreedyStrategy()
+        self.visits = [0] * len(candidates)
+        self.rewards = [0.0] * len(candidates)
+
+    def select(self) -> int:
+        """Pick the candidate to try next by UCB1, trying each one once first."""
+        total = sum(self.visits)
+        best, best_score = 0, -math.inf
+        for index, (visits, reward) in enumerate(zip(self.visits, self.rewards)):
+            if visits == 0:
+                return index
+            score = reward / visits + self.exploration * math.sqrt(math.log(total) / visits)
+            if score > best_score:
+                best, best_score = index, score
+        return best
+
+    def iterate(self) -> None:
+        """Run one iteration: sample hidden tiles, play a candidate, roll out, back up."""
+        index = self.select()
+        self.visits[index] += 1
+        self.rewards[index] += self.rollout(self.candidates[index])
+
+    def determinize(self) -> Tuple[List[List[TileSpec]], List[TileSpec]]:
+        """Deal the unseen tiles to the opponents and the deck at random."""
+        hidden = list(self.unseen)
+        self.rng.shuffle(hidden)
+        racks = []
+        for opponent in self.position.opponents:
+            racks.append(hidden[:opponent.tiles])
+            hidden = hidden[opponent.tiles:]
+        return racks, hidden
+
+    def rollout(self, first_move: Optional[Move]) -> float:
+        """
+        Play ``first_move`` in a sampled world, then let every player play greedily.
+
+        Returns:
+            float: 1 for a win, 0 for a loss; if nobody has gone out after the
+                rollout horizon, a score between them based on tiles left
+        """
+        opponent_racks, deck = self.determinize()
+        racks = [list(self.position.rack)] + opponent_racks
+        melded = [self.position.initial_meld] + [opponent.initial_meld for opponent in self.position.opponents]
+        table = self.position.table_sets
+
+        seat, passes = 0, 0
+        for turn in range(1 + self.rollout_rounds * len(racks)):
+            if turn == 0:
+                move = first_move
+            else:
+                move = next(self.greedy.search(table, racks[seat], melded[seat], None), None)
+            if move is not None:
+                table = move.melds
+                played = {tile.id for tile in move.played}
+                racks[seat] = [tile for tile in racks[seat] if tile.id not in played]
+                melded[seat] = True
+                passes = 0
+                if not racks[seat]:
+                    return 1.0 if seat == 0 else 0.0
+            elif deck:
+                racks[seat].append(deck.pop())
+                passes = 0
+            else:
+                passes += 1
+                if passes == len(racks):
+                    break
+            seat = (seat + 1) % len(racks)
+
+        ours = len(racks[0])
+        theirs = min((len(rack) for rack in racks[1:]), default=ours)
+        return 0.5 + 0.5 * (theirs - ours) / max(ours, theirs, 1)
+
+    def run(self, iterations: int, deadline: Optional[float]) -> "_Tree":
+        for _ in range(iterations):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            self.iterate()
+        return self
+
+
+def _search_worker(position: _Position, candidates: List[Optional[Move]], seed: int, exploration: float,
+                   rollout_rounds: int, iterations: int, deadline: Optional[float]) -> Tuple[List[int], List[float]]:
+    """Run an independent search in a worker process and return its root statistics."""
+    tree = _Tree(position, candidates, random.Random(seed), exploration, rollout_rounds)
+    tree.run(iterations, deadline)
+    return tree.visits, tree.rewards
+
+
+class MCTSStrategy(Strategy):
+    """
+    Picks among the solver's candidate moves (or drawing) by information-set MCTS.
+
+    The search stops at whichever comes first: ``iterations`` iterations,
+    ``time_limit`` seconds, or the caller's deadline.
+
+    Attributes:
+        iterations (int): Iterations per move, over all workers
+        time_limit (float): Seconds per move, or None to rely on the caller's deadline
+        workers (int): Worker processes to split the iterations over (1 searches in the calling process)
+        exploration (float): UCB1 exploration constant
+        rollout_rounds (int): Rounds each rollout plays before scoring by tiles left
+    """
+
+    name = 'mcts'
+
+    ITERATIONS = 400
+    BATCH = 25  # Iterations between progress reports when searching in-process
+
+    def __init__(self, iterations: int = ITERATIONS, time_limit: Optional[float] = None, workers: int = 1,
+                 exploration: float = 0.7, rollout_rounds: int = 4, seed: Optional[int] = None):
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.workers = workers
+        self.exploration = exploration
+        self.rollout_rounds = rollout_rounds
+        self.rng = random.Random(seed)
+
+    @property
+    def in_pool(self) -> bool:
+        return self.workers > 1
+
+    def search(self, table_sets, rack, initial_meld, deadline, opponents=()):
+        if self.time_limit is not None:
+            limit = time.monotonic() + self.time_limit
+            deadline = limit if deadline is None else min(deadline, limit)
+
+        position = _Position(table_sets, rack, initial_meld, tuple(opponents))
+        if self.workers > 1:
+            # Searching in parallel, so keep the solver's work off the calling process too
+            candidates = get_pool(self.workers).submit(candidate_moves, position, deadline).result()
+        else:
+            candidates = candidate_moves(position, deadline)
+        # Until the search has an opinion, play the most tiles
+        best = candidates[0]
+        yield best
+        if len(candidates) == 1 or not opponents:
+            return
+
+        if self.workers <= 1:
+            tree = _Tree(position, candidates, self.rng, self.exploration, self.rollout_rounds)
+            for done in range(0, self.iterations, self.BATCH):
+                tree.run(min(self.BATCH, self.iterations - done), deadline)
+                move = self._pick(candidates, tree.visits, tree.rewards)
+                if move is not best:
+                    best = move
+                    yield best
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+            return
+
+        visits = [0] * len(candidates)
+        rewards = [0.0] * len(candidates)
+        shares = [self.iterations // self.workers + (i < self.iterations % self.workers)
+                  for i in range(self.workers)]
+        pool = get_pool(self.workers)
+        futures = [pool.submit(_search_worker, position, candidates, self.rng.randrange(2 ** 32),
+                               self.exploration, self.rollout_rounds, share, deadline)
+                   for share in shares if share]
+        try:
+            for future in as_completed(futures):
+                worker_visits, worker_rewards = future.result()
+                visits = [a + b for a, b in zip(visits, worker_visits)]
+                rewards = [a + b for a, b in zip(rewards, worker_rewards)]
+                move = self._pick(candidates, visits, rewards)
+                if move is not best:
+                    best = move
+                    yield best
+        finally:
+            # An abandoned search mustn't leave queued work ahead of the next move
+            for future in futures:
+                future.cancel()
+
+    @staticmethod
+    def _pick(candidates: Sequence[Optional[Move]], visits: Sequence[int], rewards: Sequence[float]) -> Optional[Move]:
+        """The most visited candidate, ties broken by mean reward."""
+        index = max(range(len(candidates)),
+                    key=lambda i: (visits[i], rewards[i] / visits[i] if visits[i] else 0.0))
+        return candidates[index]
+
+
+STRATEGIES[MCTSStrategy.name] = MCTSStrategy
@@ -0,0 +1,159 @@
+import threading
+import time
+from typing import List, Optional, Sequence, Union
+
+import pygame
+
+from rummikub import rules
+from rummikub.player import Player
+from rummikub.ai.pool import get_pool
+from rummikub.ai.strategy import Move, Opponent, Strategy, get_strategy, run_search
+
+# Posted when a search finishes so an idle game loop wakes up to play the move.
+# Registered with pygame on first use, see move_ready_type()
+_move_ready: Optional[int] = None
+
+
+def move_ready_type() -> int:
+    """The MOVE_READY event type, registered with pygame the first time it is needed."""
+    global _move_ready
+    if _move_ready is None:
+        _move_ready = pygame.event.custom_type()
+    return _move_ready
+
+
+def __getattr__(name: str):
+    if name == 'MOVE_READY':
+        return move_ready_type()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class MoveSearch:
+    """
+    Runs a strategy in the background, keeping the best move found so far.
+
+    The search runs in a worker process from the shared pool and its move comes
+    back through a future, so it never holds the game process's GIL. Strategies
+    that already search on the pool (``Strategy.in_pool``) are driven from a
+    thread instead, which only waits on their workers. Either way the search
+    owns plain TileSpecs only, so the game keeps drawing and moving the real
+    tiles while it runs.
+    """
+
+    # Seconds a search may overrun its deadline while its move comes back from the worker
+    GRACE = 0.25
+
+    def __init__(self, strategy: Strategy, table_sets: List[List[rules.TileSpec]],
+                 rack: List[rules.TileSpec], initial_meld: bool, time_budget: float,
+                 opponents: Sequence[Opponent] = ()):
+        """
+        Start searching.
+
+        Args:
+            strategy (Strategy): How to search
+            table_sets: Sets currently on the table
+            rack: The player's tiles
+            initial_meld (bool): Whether the player already made their initial meld
+            time_budget (float): Seconds the search may take
+            opponents (Sequence[Opponent], optional): The other players, next one first
+        """
+        self.deadline = time.monotonic() + time_budget
+        self.best: Optional[Move] = None
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, args=(strategy, table_sets, rack, initial_meld, opponents), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, strategy, table_sets, rack, initial_meld, opponents) -> None:
+        try:
+            for move in self._moves(strategy, table_sets, rack, initial_meld, opponents):
+                with self._lock:
+                    self.best = move
+                if time.monotonic() >= self.deadline:
+                    break
+        except TimeoutError:
+            pass  # Keep whatever was found in time
+        finally:
+            self._finished.set()
+            if pygame.display.get_init():
+                pygame.event.post(pygame.event.Event(move_ready_type()))
+
+    def _moves(self, strategy, table_sets, rack, initial_meld, opponents):
+        """The strategy's moves, searched in a worker process unless it uses the pool itself."""
+        if strategy.in_pool:
+            yield from strategy.search(table_sets, rack, initial_meld, self.deadline, opponents)
+            return
+        future = get_pool().submit(run_search, strategy, table_sets, rack, initial_meld, self.deadline, opponents)
+        yield future.result()
+
+    def done(self) -> bool:
+        """Whether the search finished or its move is overdue."""
+        return self._finished.is_set() or time.monotonic() >= self.deadline + self.GRACE
+
+    def result(self) -> Optional[Move]:
+        """The best move found so far, or None to draw a tile."""
+        with self._lock:
+            return self.best
+
+
+class ComputerPlayer(Player):
+    """
+    A player whose moves come from a Strategy instead of the mouse.
+
+    Attributes:
+        strategy (Strategy): How moves are searched for
+        time_budget (float): Seconds each turn's search may take
+        search (MoveSearch): The running search, or None between turns
+    """
+
+    DEFAULT_TIME_BUDGET = 1.0
+
+    def __init__(self, game, name: str, strategy: Union[str, Strategy] = 'solver',
+                 time_budget: float = DEFAULT_TIME_BUDGET):
+        """
+        Initialize a computer player.
+
+        Args:
+            game: The main game instance
+            name (str): Name shown for the player
+            strategy (str or Strategy, optional): Strategy or its name in STRATEGIES. Defaults to 'solver'.
+            time_budget (float, optional): Seconds per turn. Defaults to DEFAULT_TIME_BUDGET.
+        """
+        super().__init__(game, name)
+        self.strategy = get_strategy(strategy) if isinstance(strategy, str) else strategy
+        self.time_budget = time_budget
+        self.search: Optional[MoveSearch] = None
+
+    def start_turn(self, table_sets, opponents: Sequence[Opponent] = ()) -> None:
+        """
+        Start searching for this turn's move in the background.
+
+        Args:
+            table_sets: Sets of tile-like objects currently on the table
+            opponents (Sequence[Opponent], optional): The other players, next one first
+        """
+        self.search = MoveSearch(
+            self.strategy,
+            [rules.to_specs(tile_set) for tile_set in table_sets],
+            rules.to_specs(self.tiles.values()),
+            self.initial_meld,
+            self.time_budget,
+            opponents,
+        )
+
+    def is_thinking(self) -> bool:
+        """Whether a search was started and its move hasn't been taken yet."""
+        return self.search is not None
+
+    def finish_turn(self) -> Optional[Move]:
+        """
+        Take the move found by the search, ending it.
+
+        Returns:
+            Move: The best move found, or None if the player should draw
+        """
+        move = self.search.result() if self.search is not None else None
+        self.search = None
+        return move
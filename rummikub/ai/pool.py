@@ -0,0 +1,53 @@
+"""
+The process-wide worker pool for computer searches.
+
+Every strategy in a process shares one pool, started on first use and shut
+down when the process exits, including when the process is itself a worker
+(such as a simulator job searching in parallel). Workers are started with
+the 'spawn' method: forking a process that runs pygame and search threads can
+copy locks held by another thread, and spawned workers only import the
+pygame-free search code.
+"""
+import multiprocessing
+import multiprocessing.util
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# Worker processes, leaving a core for the game loop
+WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_pool(workers: int = WORKERS) -> ProcessPoolExecutor:
+    """
+    Get the shared worker pool, starting it on first use.
+
+    Args:
+        workers (int, optional): Workers to start the pool with if it isn't running
+            yet; later calls reuse it whatever they ask for. Defaults to WORKERS.
+
+    Returns:
+        ProcessPoolExecutor: The pool shared by every search in this process
+    """
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=max(1, workers),
+                                        mp_context=multiprocessing.get_context('spawn'))
+            # A worker process joins its children before its atexit handlers run, so the
+            # pool is stopped by a multiprocessing finalizer, ahead of the pool queues' own
+            multiprocessing.util.Finalize(None, shutdown_pool, exitpriority=100)
+        return _pool
+
+
+def shutdown_pool() -> None:
+    """Stop the shared pool's workers; the next get_pool() starts a new one."""
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,198 @@
+"""
+Move strategies for computer players.
+
+Strategies only see TileSpecs, never pygame objects, and pickle cleanly, so
+they can run in a worker process (or in a headless simulation) while the game
+keeps rendering.
+"""
+import time
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+from rummikub import rules
+from rummikub.rules import TileSpec
+
+
+class Opponent(NamedTuple):
+    """
+    What a player can see of an opponent.
+
+    Attributes:
+        tiles (int): Number of tiles on the opponent's rack
+        initial_meld (bool): Whether the opponent made their initial meld
+    """
+    tiles: int
+    initial_meld: bool
+
+
+class Move(NamedTuple):
+    """
+    A complete turn for a computer player.
+
+    Attributes:
+        melds (List[List[TileSpec]]): Every set on the table after the move
+        played (List[TileSpec]): Rack tiles moved to the table
+    """
+    melds: List[List[TileSpec]]
+    played: List[TileSpec]
+
+
+def credited_points(melds: Sequence[Sequence], played: Sequence) -> int:
+    """
+    Work out the points the board credits for the played tiles.
+
+    Jokers are valued the way ``Board.update_sets`` values them: the group's
+    number, or per ``rules.run_joker_values`` in a run.
+
+    Args:
+        melds: Sets on the table after the move
+        played: Tiles played from the rack
+
+    Returns:
+        int: Total value of the played tiles
+    """
+    played_ids = {tile.id for tile in played}
+    total = 0
+    for meld in melds:
+        regular = [tile for tile in meld if not rules.is_joker(tile)]
+        jokers = [tile for tile in meld if rules.is_joker(tile)]
+        joker_values = [0] * len(jokers)
+        if jokers and len(regular) >= 2:
+            kind = rules.meld_kind(meld)
+            if kind & rules.GROUP:
+                joker_values = [regular[0].number] * len(jokers)
+            elif kind & rules.RUN:
+                joker_values = rules.run_joker_values([tile.number for tile in regular], len(jokers))
+        total += sum(tile.number for tile in regular if tile.id in played_ids)
+        total += sum(value for joker, value in zip(jokers, joker_values) if joker.id in played_ids)
+    return total
+
+
+class Strategy:
+    """
+    Base class for the way a computer player picks its move.
+
+    ``search`` is an anytime search: it yields successively better moves and
+    may be abandoned at any point, so the caller always holds the best move
+    found so far.
+    """
+
+    name = None
+
+    # Whether search() already does its heavy work on the shared worker pool,
+    # so it can be driven from the game process instead of run in a worker
+    in_pool = False
+
+    def search(self, table_sets: List[List[TileSpec]], rack: List[TileSpec],
+               initial_meld: bool, deadline: Optional[float],
+               opponents: Sequence[Opponent] = ()) -> Iterator[Optional[Move]]:
+        """
+        Search for moves.
+
+        Args:
+            table_sets: Sets currently on the table
+            rack: The player's tiles
+            initial_meld (bool): Whether the player already made their initial meld
+            deadline (float): ``time.monotonic()`` value to stop searching at, or None
+            opponents (Sequence[Opponent], optional): The other players in turn order,
+                starting with the next one. Defaults to none known.
+
+        Yields:
+            Move: Each move better than the ones before it, or None when drawing
+                a tile looks best so far
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def accept(melds: List[List[TileSpec]], played: List[TileSpec], initial_meld: bool) -> Optional[Move]:
+        """Build a Move, or return None if it plays nothing or misses the initial meld."""
+        if not played:
+            return None
+        if not initial_meld and credited_points(melds, played) < rules.INITIAL_MELD_POINTS:
+            return None
+        return Move(melds, played)
+
+
+class GreedyStrategy(Strategy):
+    """Lays down the best melds from the rack alone and leaves the table as it is."""
+
+    name = 'greedy'
+
+    def search(self, table_sets, rack, initial_meld, deadline, opponents=()):
+        solution = rules.solve([], rack, initial_meld=initial_meld, deadline=deadline)
+        move = self.accept(table_sets + solution.melds, solution.played, initial_meld)
+        if move is not None:
+            yield move
+
+
+class SolverStrategy(GreedyStrategy):
+    """
+    Plays the most tiles possible, rearranging the table if that helps.
+
+    The rack-only move is found first, so there is something to play even if
+    the full search over the table runs out of time.
+    """
+
+    name = 'solver'
+
+    def __init__(self, objective: str = rules.TILES):
+        self.objective = objective
+
+    def search(self, table_sets, rack, initial_meld, deadline, opponents=()):
+        best = 0
+        for move in super().search(table_sets, rack, initial_meld, deadline, opponents):
+            best = len(move.played)
+            yield move
+
+        # Before the initial meld the table can't be touched, which the greedy pass covers
+        if not initial_meld:
+            return
+        table = [tile for tile_set in table_sets for tile in tile_set]
+        solution = rules.solve(table, rack, objective=self.objective, deadline=deadline)
+        if solution is not None and len(solution.played) > best:
+            move = self.accept(solution.melds, solution.played, initial_meld)
+            if move is not None:
+                yield move
+
+
+def run_search(strategy: Strategy, table_sets: List[List[TileSpec]], rack: List[TileSpec],
+               initial_meld: bool, deadline: Optional[float],
+               opponents: Sequence[Opponent] = ()) -> Optional[Move]:
+    """
+    Run a strategy's search to the end or the deadline and keep its best move.
+
+    Module-level so it can be submitted to a worker process.
+
+    Returns:
+        Move: The best move found in time, or None to draw a tile
+    """
+    best = None
+    try:
+        for move in strategy.search(table_sets, rack, initial_meld, deadline, opponents):
+            best = move
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+    except TimeoutError:
+        pass  # Keep whatever was found in time
+    return best
+
+
+STRATEGIES = {strategy.name: strategy for strategy in (GreedyStrategy, SolverStrategy)}
+
+
+def get_strategy(name: str, **options) -> Strategy:
+    """
+    Create a strategy by name.
+
+    Args:
+        name (str): One of the keys of STRATEGIES
+        **options: Passed to the strategy's constructor, e.g. ``workers`` for 'mcts'
+
+    Returns:
+        Strategy: A new strategy instance
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {name}")
+    return STRATEGIES[name](**options)
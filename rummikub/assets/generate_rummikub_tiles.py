@@ -1,6 +1,11 @@
 from PIL import Image, ImageDraw, ImageFont, ImageFilter, ImageOps
+import numpy as np
+import argparse
+import hashlib
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple, Optional
 import math
 
@@ -11,6 +16,22 @@ BORDER_RADIUS = 5
 BORDER_WIDTH = 2
 OUTPUT_DIR = "rummikub_tiles"  # Output directory for the tiles
 
+# Incremental builds: bump GENERATOR_VERSION whenever tile rendering changes
+# so every cached tile is considered stale
+GENERATOR_VERSION = 1
+MANIFEST_NAME = "tiles_manifest.json"
+# Font fallback chains, bold and regular; load_font() and the cache hash both walk these
+FONT_CANDIDATES = {
+    True: ("Arial Bold.ttf", "arialbd.ttf", "DejaVuSans-Bold.ttf", "Arial.ttf"),
+    False: ("Arial.ttf", "DejaVuSans.ttf"),
+}
+
+# Packed atlas output (names must match rummikub/image_cache.py)
+ATLAS_IMAGE = "tiles_atlas.png"
+ATLAS_INDEX = "tiles_atlas.json"
+ATLAS_COLUMNS = 13
+ATLAS_TILE_SIZE = (130, 200)  # Default cell size: the in-game tile size
+
 # Define colors to match authentic Rummikub sets
 COLORS = {
     "red": (215, 38, 38),     # Bright red
@@ -19,8 +40,22 @@ COLORS = {
     "yellow": (235, 180, 0)   # Rummikub uses yellow (not orange)
 }
 
-# Create output directory if it doesn't exist
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Palettes for tiles rendered at runtime; color names must match the game's
+# ("orange" for the yellow tiles)
+THEMES = {
+    "classic": {
+        "red": COLORS["red"],
+        "blue": COLORS["blue"],
+        "black": COLORS["black"],
+        "orange": COLORS["yellow"]
+    },
+    "high_contrast": {
+        "red": (200, 0, 0),
+        "blue": (0, 60, 220),
+        "black": (0, 0, 0),
+        "orange": (230, 120, 0)
+    }
+}
 
 def find_joker_face():
     """Search for the joker face image in multiple possible locations."""
@@ -63,10 +98,31 @@ def rounded_rectangle(draw, xy, radius, fill=None, outline=None, width=1):
         draw.line((x1, y1+radius, x1, y2-radius), fill=outline, width=width)
         draw.line((x2, y1+radius, x2, y2-radius), fill=outline, width=width)
 
-def create_tile_base(scale=3):
-    """Create a base tile with authentic Rummikub styling."""
+def tile_canvas(size=None, scale=3):
+    """Supersampled canvas for a tile of final size (width, height).
+
+    The layout is designed in TILE_WIDTH x TILE_HEIGHT units and scaled by the
+    tile height, so wider tiles get more margin rather than bigger numbers.
+
+    Returns:
+        tuple: (canvas width, canvas height, canvas pixels per design unit)
+    """
+    width, height = size or (TILE_WIDTH, TILE_HEIGHT)
+    return width * scale, height * scale, height * scale / TILE_HEIGHT
+
+def units(value, unit):
+    """Convert a design-unit length to whole canvas pixels."""
+    return int(round(value * unit))
+
+def create_tile_base(scale=3, vectorized=True, size=None):
+    """Create a base tile with authentic Rummikub styling.
+
+    vectorized selects the NumPy shading pass; False runs the original
+    per-pixel loops, which produce the same pixels far more slowly.
+    size is the final (width, height) the tile will be resized to.
+    """
     # Create a high-res base image
-    width, height = TILE_WIDTH * scale, TILE_HEIGHT * scale
+    width, height, unit = tile_canvas(size, scale)
     base = Image.new('RGBA', (width, height), (0, 0, 0, 0))
     draw = ImageDraw.Draw(base)
     
@@ -74,7 +130,16 @@ def create_tile_base(scale=3):
     ivory = (250, 248, 240)
     
     # Create the main tile shape with rounded corners
-    rounded_rectangle(draw, (0, 0, width, height), BORDER_RADIUS * scale, fill=ivory)
+    rounded_rectangle(draw, (0, 0, width, height), units(BORDER_RADIUS, unit), fill=ivory)
+    
+    if vectorized:
+        return shade_tile_array(base, unit)
+    return shade_tile_loops(base, unit)
+
+def shade_tile_loops(base, scale):
+    """Add texture, gradient and edge highlights pixel by pixel (reference implementation)."""
+    width, height = base.size
+    draw = ImageDraw.Draw(base)
     
     # Add subtle texture like real tiles (fine grain)
     for i in range(0, width, 2):
@@ -97,48 +162,83 @@ def create_tile_base(scale=3):
 
     # Add subtle highlight along top and left edges
     highlight = (255, 255, 255, 100)
-    edge_width = scale
-    for i in range(BORDER_RADIUS * scale, width - BORDER_RADIUS * scale):
+    edge_width = units(1, scale)
+    inset = units(BORDER_RADIUS, scale)
+    for i in range(inset, width - inset):
         for j in range(edge_width):
             if base.getpixel((i, j))[3] > 0:
                 base.putpixel((i, j), highlight)
                 
-    for j in range(BORDER_RADIUS * scale, height - BORDER_RADIUS * scale):
+    for j in range(inset, height - inset):
         for i in range(edge_width):
             if base.getpixel((i, j))[3] > 0:
                 base.putpixel((i, j), highlight)
     
     return base
 
-def create_number_tile(number, color_name, color_rgb, scale=3):
+def shade_tile_array(base, scale):
+    """Add texture, gradient and edge highlights with whole-array NumPy operations.
+
+    Produces exactly the same pixels as shade_tile_loops.
+    """
+    width, height = base.size
+    pixels = np.array(base)  # (height, width, 4) uint8
+    ys, xs = np.mgrid[0:height, 0:width]
+    
+    # Add subtle texture like real tiles (fine grain): every other pixel on
+    # the (x + y) % 8 == 0 diagonals, drawn opaque even over the corners
+    grain = (xs % 2 == 0) & (ys % 2 == 0) & ((xs + ys) % 8 == 0)
+    pixels[grain] = (245, 243, 235, 255)
+    
+    # Add subtle 3D effect with gradient shading, darker away from the top-left
+    dist = np.sqrt((xs / width) ** 2 + (ys / height) ** 2) * 15
+    shade = np.clip(dist, 0, 10).astype(np.int16)
+    interior = np.zeros((height, width), dtype=bool)
+    interior[1:-1, 1:-1] = True
+    shaded = interior & (pixels[..., 3] > 0)
+    rgb = pixels[..., :3].astype(np.int16)
+    rgb = np.maximum(rgb - shade[..., None], 220)
+    pixels[..., :3] = np.where(shaded[..., None], rgb, pixels[..., :3]).astype(np.uint8)
+    
+    # Add subtle highlight along top and left edges
+    highlight = (255, 255, 255, 100)
+    edge_width = units(1, scale)
+    inset = units(BORDER_RADIUS, scale)
+    top = pixels[:edge_width, inset:width - inset]
+    top[top[..., 3] > 0] = highlight
+    left = pixels[inset:height - inset, :edge_width]
+    left[left[..., 3] > 0] = highlight
+    
+    return Image.fromarray(pixels)
+
+def load_font(size, bold):
+    """Load the first available font of a fallback chain in FONT_CANDIDATES.
+
+    Returns:
+        tuple: (font, size to lay it out at); Pillow's default bitmap font is
+            much larger per point, so its size is a third of the requested one
+    """
+    for name in FONT_CANDIDATES[bold]:
+        try:
+            return ImageFont.truetype(name, size), size
+        except Exception:
+            continue
+    return ImageFont.load_default(), size // 3
+
+def create_number_tile(number, color_name, color_rgb, scale=3, vectorized=True, size=None):
     """Create a number tile with authentic Rummikub styling."""
     # Get the base tile
-    img = create_tile_base(scale)
+    width, height, unit = tile_canvas(size, scale)
+    img = create_tile_base(scale, vectorized, size)
     draw = ImageDraw.Draw(img)
     
     # Determine font size based on number of digits
-    base_size = 55 * scale
+    base_size = units(55, unit)
     if number >= 10:
-        base_size = 48 * scale
+        base_size = units(48, unit)
     
-    # Try to load a bold sans-serif font similar to Rummikub
-    try:
-        # Try Arial Bold first (common on Windows)
-        font = ImageFont.truetype("Arial Bold.ttf", base_size)
-    except:
-        try:
-            font = ImageFont.truetype("arialbd.ttf", base_size)  # Another name for Arial Bold
-        except:
-            try:
-                font = ImageFont.truetype("DejaVuSans-Bold.ttf", base_size)  # Common on Linux
-            except:
-                try:
-                    # Try regular Arial if bold isn't available
-                    font = ImageFont.truetype("Arial.ttf", base_size)  
-                except:
-                    # Fallback to default font
-                    font = ImageFont.load_default()
-                    base_size = base_size // 3  # Adjust size for default font
+    # Load a bold sans-serif font similar to Rummikub
+    font, base_size = load_font(base_size, bold=True)
     
     # Draw the number with proper positioning
     number_text = str(number)
@@ -154,12 +254,12 @@ def create_number_tile(number, color_name, color_rgb, scale=3):
         text_width, text_height = draw.textsize(number_text, font=font)
     
     # Position text in the center
-    x = (TILE_WIDTH * scale - text_width) // 2
-    y = (TILE_HEIGHT * scale - text_height) // 2 - scale * 2  # Slightly above center
+    x = (width - text_width) // 2
+    y = (height - text_height) // 2 - units(2, unit)  # Slightly above center
     
     # Create embossed/3D effect for the number
     # 1. Drop shadow
-    shadow_offset = scale
+    shadow_offset = units(1, unit)
     shadow_color = tuple(max(0, c-60) for c in color_rgb)
     draw.text((x + shadow_offset, y + shadow_offset), number_text, fill=shadow_color, font=font)
     
@@ -168,15 +268,7 @@ def create_number_tile(number, color_name, color_rgb, scale=3):
     
     # Add a small identifier at the bottom
     try:
-        small_font_size = 11 * scale
-        try:
-            small_font = ImageFont.truetype("Arial.ttf", small_font_size)
-        except:
-            try:
-                small_font = ImageFont.truetype("DejaVuSans.ttf", small_font_size)
-            except:
-                small_font = ImageFont.load_default()
-                small_font_size = small_font_size // 3
+        small_font, small_font_size = load_font(units(11, unit), bold=False)
     
         # Get small text width
         try:
@@ -186,35 +278,37 @@ def create_number_tile(number, color_name, color_rgb, scale=3):
             small_width, _ = draw.textsize(color_name.upper(), font=small_font)
         
         # Position at bottom
-        bottom_margin = 10 * scale
-        small_x = (TILE_WIDTH * scale - small_width) // 2
-        small_y = TILE_HEIGHT * scale - bottom_margin - small_font_size
+        bottom_margin = units(10, unit)
+        small_x = (width - small_width) // 2
+        small_y = height - bottom_margin - small_font_size
         
         draw.text((small_x, small_y), color_name.upper(), fill=color_rgb, font=small_font)
     except Exception as e:
         print(f"Warning: Could not add color name: {e}")
     
     # Resize to final dimensions with antialiasing
-    img = img.resize((TILE_WIDTH, TILE_HEIGHT), Image.LANCZOS)
+    img = img.resize(size or (TILE_WIDTH, TILE_HEIGHT), Image.LANCZOS)
     
     return img
 
-def create_joker_tile(joker_face_path=None, scale=3):
+def create_joker_tile(joker_face_path=None, scale=3, vectorized=True, size=None):
     """Create a joker tile with authentic Rummikub styling using the provided joker face."""
     # Get the base tile
-    img = create_tile_base(scale)
+    width, height, unit = tile_canvas(size, scale)
+    img = create_tile_base(scale, vectorized, size)
     draw = ImageDraw.Draw(img)
     
     # Add a thin black border around the edge
     border_color = (0, 0, 0)
+    border_width = units(BORDER_WIDTH, unit)
     border_rect = (
-        BORDER_WIDTH * scale // 2, 
-        BORDER_WIDTH * scale // 2, 
-        TILE_WIDTH * scale - BORDER_WIDTH * scale // 2, 
-        TILE_HEIGHT * scale - BORDER_WIDTH * scale // 2
+        border_width // 2, 
+        border_width // 2, 
+        width - border_width // 2, 
+        height - border_width // 2
     )
-    rounded_rectangle(draw, border_rect, BORDER_RADIUS * scale - 1, 
-                     outline=border_color, width=BORDER_WIDTH * scale)
+    rounded_rectangle(draw, border_rect, units(BORDER_RADIUS, unit) - 1, 
+                     outline=border_color, width=border_width)
     
     # Try to load the joker face image
     if joker_face_path and os.path.exists(joker_face_path):
@@ -226,13 +320,13 @@ def create_joker_tile(joker_face_path=None, scale=3):
             # This makes the image work better when pasted onto our tile
             
             # Resize to fit nicely on the tile (approximately 2/3 of the tile height)
-            face_size = int(TILE_HEIGHT * scale * 0.6)
+            face_size = int(height * 0.6)
             joker_face = joker_face.resize((face_size, face_size), Image.LANCZOS)
             
             # Center it in the upper portion of the tile
             face_position = (
-                (TILE_WIDTH * scale - face_size) // 2,
-                int(TILE_HEIGHT * scale * 0.20)
+                (width - face_size) // 2,
+                int(height * 0.20)
             )
             
             # Paste the joker face onto the tile
@@ -241,25 +335,14 @@ def create_joker_tile(joker_face_path=None, scale=3):
         except Exception as e:
             print(f"Error processing joker face: {e}")
             print("Using fallback joker text")
-            draw_fallback_joker(draw, scale)
+            draw_fallback_joker(draw, scale, size)
     else:
         print("Joker face image not found, using text fallback")
-        draw_fallback_joker(draw, scale)
+        draw_fallback_joker(draw, scale, size)
     
     # Add "JOKER" text at the bottom
     try:
-        joker_font_size = 18 * scale
-        try:
-            joker_font = ImageFont.truetype("Arial Bold.ttf", joker_font_size)
-        except:
-            try:
-                joker_font = ImageFont.truetype("arialbd.ttf", joker_font_size)
-            except:
-                try:
-                    joker_font = ImageFont.truetype("DejaVuSans-Bold.ttf", joker_font_size)
-                except:
-                    joker_font = ImageFont.load_default()
-                    joker_font_size = joker_font_size // 3
+        joker_font, joker_font_size = load_font(units(18, unit), bold=True)
         
         joker_text = "JOKER"
         
@@ -271,34 +354,28 @@ def create_joker_tile(joker_face_path=None, scale=3):
             joker_width, _ = draw.textsize(joker_text, font=joker_font)
         
         # Position at bottom
-        bottom_margin = 15 * scale
-        joker_x = (TILE_WIDTH * scale - joker_width) // 2
-        joker_y = TILE_HEIGHT * scale - bottom_margin - joker_font_size
+        bottom_margin = units(15, unit)
+        joker_x = (width - joker_width) // 2
+        joker_y = height - bottom_margin - joker_font_size
         
         # Draw with slight shadow for 3D effect
-        draw.text((joker_x + scale, joker_y + scale), joker_text, fill=(50, 50, 50), font=joker_font)
+        shadow_offset = units(1, unit)
+        draw.text((joker_x + shadow_offset, joker_y + shadow_offset), joker_text, fill=(50, 50, 50), font=joker_font)
         draw.text((joker_x, joker_y), joker_text, fill=(0, 0, 0), font=joker_font)
     except Exception as e:
         print(f"Warning: Could not add JOKER text: {e}")
     
     # Resize to final dimensions with antialiasing
-    img = img.resize((TILE_WIDTH, TILE_HEIGHT), Image.LANCZOS)
+    img = img.resize(size or (TILE_WIDTH, TILE_HEIGHT), Image.LANCZOS)
     
     return img
 
-def draw_fallback_joker(draw, scale):
+def draw_fallback_joker(draw, scale, size=None):
     """Draw a fallback joker text if image isn't available."""
+    width, height, unit = tile_canvas(size, scale)
     try:
         # Load a large font for the word "JOKER"
-        large_font_size = 32 * scale
-        try:
-            large_font = ImageFont.truetype("Arial Bold.ttf", large_font_size)
-        except:
-            try:
-                large_font = ImageFont.truetype("DejaVuSans-Bold.ttf", large_font_size)
-            except:
-                large_font = ImageFont.load_default()
-                large_font_size = large_font_size // 3
+        large_font, large_font_size = load_font(units(32, unit), bold=True)
         
         # Draw multicolor "JOKER" text
         joker_text = "JOKER"
@@ -312,8 +389,8 @@ def draw_fallback_joker(draw, scale):
             text_width, text_height = draw.textsize(joker_text, font=large_font)
         
         # Center text in upper portion of tile
-        x = (TILE_WIDTH * scale - text_width) // 2
-        y = (TILE_HEIGHT * scale // 3) - (text_height // 2)
+        x = (width - text_width) // 2
+        y = (height // 3) - (text_height // 2)
         
         # Draw with multiple colors (like a rainbow effect)
         colors = list(COLORS.values())
@@ -349,43 +426,201 @@ def create_preview_image(tile_paths):
     
     return preview
 
-def main():
+def build_atlas(tile_dir, tile_size=ATLAS_TILE_SIZE, columns=ATLAS_COLUMNS):
+    """Pack every tile_*.png in tile_dir into one atlas image plus a JSON index.
+
+    The game loads the atlas with a single file open and cuts each tile out as
+    a subsurface. Tiles are resized to tile_size (None keeps each tile's own
+    size, which makes for a very large atlas with high-resolution tiles).
+    """
+    filenames = sorted(name for name in os.listdir(tile_dir)
+                       if name.startswith("tile_") and name.endswith(".png"))
+    if not filenames:
+        raise ValueError(f"No tile images found in {tile_dir}")
+
+    tiles = []
+    for filename in filenames:
+        tile = Image.open(os.path.join(tile_dir, filename)).convert("RGBA")
+        if tile_size is not None and tile.size != tuple(tile_size):
+            tile = tile.resize(tuple(tile_size), Image.LANCZOS)
+        tiles.append((filename, tile))
+
+    cell_width = max(tile.width for _, tile in tiles)
+    cell_height = max(tile.height for _, tile in tiles)
+    columns = min(columns, len(tiles))
+    rows = (len(tiles) + columns - 1) // columns
+
+    atlas = Image.new('RGBA', (columns * cell_width, rows * cell_height), (0, 0, 0, 0))
+    index = {"image": ATLAS_IMAGE, "tiles": {}}
+    for i, (filename, tile) in enumerate(tiles):
+        x = (i % columns) * cell_width
+        y = (i // columns) * cell_height
+        atlas.paste(tile, (x, y))
+        index["tiles"][filename] = [x, y, tile.width, tile.height]
+
+    atlas_path = os.path.join(tile_dir, ATLAS_IMAGE)
+    atlas.save(atlas_path)
+    with open(os.path.join(tile_dir, ATLAS_INDEX), "w") as index_file:
+        json.dump(index, index_file, indent=2)
+    print(f"Atlas with {len(tiles)} tiles saved to {atlas_path}")
+    return atlas_path
+
+
+def font_fingerprint():
+    """Resolve the candidate fonts so a font install/removal invalidates cached tiles."""
+    resolved = []
+    for name in FONT_CANDIDATES[True] + FONT_CANDIDATES[False]:
+        try:
+            resolved.append(ImageFont.truetype(name, 10).path)
+        except Exception:
+            resolved.append(None)
+    return resolved
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents, or None if there is no file."""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def tile_jobs(colors=None, scale=3, joker_face_path=None, size=None):
+    """List (filename, inputs) for every tile; inputs fully describe the rendered image."""
+    colors = COLORS if colors is None else colors
+    size = list(size) if size else None
+    jobs = []
+    for color_name, color_rgb in colors.items():
+        for number in range(1, 14):  # Numbers 1-13
+            jobs.append((f"tile_{number}_{color_name}.png", {
+                "kind": "number", "number": number, "color": color_name,
+                "rgb": list(color_rgb), "scale": scale, "size": size
+            }))
+    joker_inputs = {"kind": "joker", "scale": scale, "size": size, "face": joker_face_path}
+    jobs.append(("tile_joker_1.png", joker_inputs))
+    jobs.append(("tile_joker_2.png", joker_inputs))
+    return jobs
+
+
+def inputs_hash(inputs, fonts, face_digest):
+    """Content hash of everything that affects one tile's pixels."""
+    key = dict(inputs, version=GENERATOR_VERSION, fonts=fonts,
+               face=face_digest if inputs["kind"] == "joker" else None)
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def render_tile(output_dir, filenames, inputs, vectorized=True):
+    """Render one tile and save it under each of filenames in output_dir (runs in a worker process)."""
+    size = tuple(inputs["size"]) if inputs["size"] else None
+    if inputs["kind"] == "joker":
+        img = create_joker_tile(inputs["face"], inputs["scale"], vectorized, size)
+    else:
+        img = create_number_tile(inputs["number"], inputs["color"], tuple(inputs["rgb"]),
+                                 inputs["scale"], vectorized, size)
+    for filename in filenames:
+        img.save(os.path.join(output_dir, filename))
+    return filenames
+
+
+def generate_tiles(output_dir=OUTPUT_DIR, colors=None, scale=3, joker_face_path=None,
+                   workers=None, force=False, vectorized=True, size=None):
+    """Render every tile whose inputs changed since the last build.
+
+    A manifest in output_dir records the input hash of each tile. Tiles with a
+    matching hash and an existing file are skipped; the rest are rendered in
+    a process pool of `workers` processes (1 renders in this process).
+
+    Returns:
+        tuple: (paths of all tiles, file names that were regenerated)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    manifest = {}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+
+    fonts = font_fingerprint()
+    face_digest = file_digest(joker_face_path)
+    jobs = tile_jobs(colors, scale, joker_face_path, size)
+    hashes = {filename: inputs_hash(inputs, fonts, face_digest) for filename, inputs in jobs}
+    stale = [(filename, inputs) for filename, inputs in jobs
+             if manifest.get(filename) != hashes[filename]
+             or not os.path.exists(os.path.join(output_dir, filename))]
+
+    # Tiles with identical inputs (the two jokers) are rendered once and saved twice
+    renders = {}
+    for filename, inputs in stale:
+        renders.setdefault(hashes[filename], (inputs, []))[1].append(filename)
+
+    if workers == 1 or len(renders) <= 1:
+        for inputs, filenames in renders.values():
+            render_tile(output_dir, filenames, inputs, vectorized)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render_tile, output_dir, filenames, inputs, vectorized)
+                       for inputs, filenames in renders.values()]
+            for future in futures:
+                future.result()
+
+    for filename, _ in stale:
+        print(f"Created {filename}")
+        manifest[filename] = hashes[filename]
+    with open(manifest_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+    paths = [os.path.join(output_dir, filename) for filename, _ in jobs]
+    return paths, [filename for filename, _ in stale]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Rummikub tile images.")
+    parser.add_argument("--atlas", action="store_true",
+                        help="also pack the generated tiles into a sprite atlas")
+    parser.add_argument("--atlas-only", metavar="TILE_DIR",
+                        help="pack an existing tile folder into an atlas without generating tiles")
+    parser.add_argument("--atlas-size", metavar="WxH", default="%dx%d" % ATLAS_TILE_SIZE,
+                        help="atlas cell size, or 'original' to keep tile sizes (default: %(default)s)")
+    parser.add_argument("--reference", action="store_true",
+                        help="shade tiles with the slow per-pixel loops instead of NumPy")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes for tile rendering (default: one per CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every tile even if its inputs are unchanged")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    atlas_size = None if args.atlas_size == "original" else tuple(int(v) for v in args.atlas_size.split("x"))
+
+    if args.atlas_only:
+        build_atlas(args.atlas_only, atlas_size)
+        return
+
     print("Generating authentic Rummikub tiles...")
     
     # Find the joker face image
     joker_face_path = find_joker_face()
     
-    # List to track all generated tile paths for preview
-    all_tile_paths = []
-    
-    # Generate number tiles
-    for color_name, color_rgb in COLORS.items():
-        for number in range(1, 14):  # Numbers 1-13
-            img = create_number_tile(number, color_name, color_rgb)
-            filename = f"tile_{number}_{color_name}.png"
-            filepath = os.path.join(OUTPUT_DIR, filename)
-            img.save(filepath)
-            all_tile_paths.append(filepath)
-            print(f"Created {filename}")
-    
-    # Create joker tiles
-    joker_img = create_joker_tile(joker_face_path)
-    joker1_path = os.path.join(OUTPUT_DIR, "tile_joker_1.png")
-    joker2_path = os.path.join(OUTPUT_DIR, "tile_joker_2.png")
-    joker_img.save(joker1_path)
-    joker_img.save(joker2_path)
-    all_tile_paths.append(joker1_path)
-    all_tile_paths.append(joker2_path)
-    print("Created joker tiles")
+    all_tile_paths, regenerated = generate_tiles(
+        OUTPUT_DIR, joker_face_path=joker_face_path, workers=args.jobs,
+        force=args.force, vectorized=not args.reference
+    )
+    print(f"{len(regenerated)} of {len(all_tile_paths)} tiles regenerated")
     
     # Create and save preview image
-    preview_img = create_preview_image(all_tile_paths)
     preview_path = os.path.join(OUTPUT_DIR, "tiles_preview.png")
-    preview_img.save(preview_path)
-    print(f"Preview image saved to {preview_path}")
+    if regenerated or not os.path.exists(preview_path):
+        preview_img = create_preview_image(all_tile_paths)
+        preview_img.save(preview_path)
+        print(f"Preview image saved to {preview_path}")
     
     print("All tiles generated successfully!")
     print(f"Tiles saved to {os.path.abspath(OUTPUT_DIR)}")
 
+    if args.atlas and (regenerated or not os.path.exists(os.path.join(OUTPUT_DIR, ATLAS_IMAGE))):
+        build_atlas(OUTPUT_DIR, atlas_size)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,16 +1,95 @@
 import pygame
 import math
 from rummikub.tile import Tile
-from rummikub.utils import Graph
+from rummikub import rules
+from rummikub.utils import Graph, segment_rows
 from typing import List, Optional
 
 
 class Board:
-    def __init__(self, game):
+    # How tiles on the table are split into sets:
+    #   'graph' - connected components of tiles within LINK_DISTANCE of each other
+    #   'rows'  - snapped rows split at horizontal gaps (never merges adjacent rows)
+    SEGMENTATION_STRATEGIES = ('graph', 'rows')
+    LINK_DISTANCE = 200
+
+    # Layout used when melds are placed programmatically (computer moves): tiles
+    # in a meld sit within LINK_DISTANCE of each other, separate melds don't
+    TABLE_ORIGIN = (40, 140)
+    TABLE_SIZE = (3400, 1760)
+    MELD_TILE_STEP = 130
+    MELD_GAP = 100
+    MELD_ROW_STEP = 240
+
+    def __init__(self, game, segmentation: str = 'graph'):
         self.game = game
         self.graph: Graph = Graph(106)
         self.tiles = {}  # All board tiles: {tile_id: Tile}
         self.added_tiles = []  # Tile IDs added during current turn
+        self.segmentation = None
+        self.set_segmentation(segmentation)
+
+    def set_segmentation(self, strategy: str) -> None:
+        """
+        Choose how board tiles are split into sets.
+        
+        Args:
+            strategy: One of SEGMENTATION_STRATEGIES
+        """
+        if strategy not in self.SEGMENTATION_STRATEGIES:
+            raise ValueError(f"Unknown segmentation strategy: {strategy}")
+        self.segmentation = strategy
+
+    def find_sets(self) -> List[List[int]]:
+        """
+        Split the board tiles into candidate sets using the active strategy.
+        
+        Returns:
+            List[List[int]]: Tile IDs of each set
+        """
+        if self.segmentation == 'rows':
+            positions = {tile_id: tile.get_coordinates() for tile_id, tile in self.tiles.items()}
+            return segment_rows(positions, max_step=self.LINK_DISTANCE)
+        return self.graph.get_components()
+
+    def get_sets(self) -> List[List[Tile]]:
+        """
+        Split the board tiles into sets at their current positions.
+        
+        Returns:
+            List[List[Tile]]: Tiles of each set
+        """
+        self.graph.update_all_tiles(self.tiles)
+        return [[self.tiles[tile_id] for tile_id in tile_ids] for tile_ids in self.find_sets()]
+
+    def arrange_melds(self, melds: List[List[Tile]]) -> None:
+        """
+        Lay melds out left to right in rows, so each one is found as its own set.
+        
+        Args:
+            melds: Every set that should be on the table, as board tiles in order
+            
+        Raises:
+            ValueError: If the melds don't fit on the table
+        """
+        left, top = self.TABLE_ORIGIN
+        x, y = left, top
+        for meld in melds:
+            width = len(meld) * self.MELD_TILE_STEP
+            if x > left and x + width > self.TABLE_SIZE[0]:
+                x, y = left, y + self.MELD_ROW_STEP
+            if y + self.MELD_ROW_STEP > self.TABLE_SIZE[1]:
+                raise ValueError("Melds don't fit on the table")
+            for tile in meld:
+                tile.set_coordinates(x, y)
+                x += self.MELD_TILE_STEP
+            x += self.MELD_GAP
+
+    def clear(self) -> None:
+        """Take every tile off the board, ready for a new game."""
+        self.tiles = {}
+        self.added_tiles = []
+        self.graph = Graph(106)
 
     def add_tile(self, tile: Tile) -> None:
         self.tiles[tile.id] = tile
@@ -42,27 +121,7 @@ class Board:
         Returns:
             bool: True if tiles form a valid group
         """
-        # Must be exactly 3 or 4 tiles
-        if len(tiles) not in (3, 4):
-            return False
-            
-        # Separate non-joker tiles
-        non_jokers = [tile for tile in tiles if not hasattr(tile, 'is_joker') or not tile.is_joker]
-        if not non_jokers:  # There must be at least one non-joker to define the number
-            return False
-            
-        # All non-joker tiles must share the same number
-        target_number = non_jokers[0].number
-        for tile in non_jokers:
-            if tile.number != target_number:
-                return False
-                
-        # Colors of non-joker tiles must be unique
-        colors = [tile.color for tile in non_jokers]
-        if len(colors) != len(set(colors)):
-            return False
-            
-        return True
+        return rules.is_valid_group(tiles)
 
     def is_valid_run(self, tiles: list) -> bool:
         """
@@ -74,45 +133,24 @@ class Board:
         Returns:
             bool: True if tiles form a valid run
         """
-        # Must contain at least 3 tiles
-        if len(tiles) < 3:
-            return False
-            
-        non_jokers = [tile for tile in tiles if not hasattr(tile, 'is_joker') or not tile.is_joker]
-        if not non_jokers:  # Run must have at least one non-joker to set the color
-            return False
-            
-        # All non-joker tiles must be the same color
-        run_color = non_jokers[0].color
-        for tile in non_jokers:
-            if tile.color != run_color:
-                return False
-                
-        # Sort non-joker tiles by their number
-        non_jokers.sort(key=lambda tile: tile.number)
-        numbers = [tile.number for tile in non_jokers]
-        
-        # Check that there are no duplicate numbers among non-jokers
-        if len(numbers) != len(set(numbers)):
-            return False
-            
-        # Compute the total gaps needed between consecutive numbers
-        required_gaps = 0
-        for i in range(len(numbers) - 1):
-            required_gaps += numbers[i+1] - numbers[i] - 1
-            
-        available_jokers = len(tiles) - len(non_jokers)
-        if required_gaps > available_jokers:
-            return False
-            
-        return True
+        return rules.is_valid_run(tiles)
 
-    def update_sets(self) -> None:
-        """Updates sets by finding connected tile groups using Kruskal's algorithm."""
-        self.graph.update_all_tiles(self.tiles)
-        forests = self.graph.kruskals_msf(self.tiles, max_weight=200)
-        self.game.statistics['valid_sets_formed'] = len(forests)
-        self.graph.print_forests(forests)
+    def update_sets(self, moved_tile: Optional[Tile] = None) -> None:
+        """
+        Updates sets from the board graph's connected tile groups.
+        
+        Args:
+            moved_tile: The only tile that moved since the last update. When given,
+                just that tile is re-linked in the graph; otherwise every tile
+                position is re-synced.
+        """
+        if moved_tile is not None:
+            self.graph.update_tile(moved_tile)
+        else:
+            self.graph.update_all_tiles(self.tiles)
+        sets = self.find_sets()
+        self.game.statistics['valid_sets_formed'] = len(sets)
+        self.graph.print_sets(sets)
         
         # Reset all jokers first
         for tile_id, tile in self.tiles.items():
@@ -120,8 +158,7 @@ class Board:
                 tile.reset_joker()
         
         # Update joker values in valid sets
-        for forest in forests:
-            tile_ids, _ = forest
+        for tile_ids in sets:
             # Skip small groups (not valid sets)
             if len(tile_ids) < 3:
                 continue
@@ -140,14 +177,15 @@ class Board:
                 continue
             
             # Determine set type and assign joker values
-            if self.is_valid_group(forest_tiles):
+            kind = rules.meld_kind(forest_tiles)
+            if kind & rules.GROUP:
                 # In a group, all jokers get the same number as the group
                 group_number = regular_tiles[0].number
                 for joker in jokers:
                     joker.number = group_number
                     joker.in_set = True
                     
-            elif self.is_valid_run(forest_tiles):
+            elif kind & rules.RUN:
                 # In a run, jokers fill in gaps or extend the sequence
                 self._assign_joker_run_values(jokers, regular_tiles)
 
@@ -159,40 +197,10 @@ class Board:
             jokers: List of joker tiles in the set
             regular_tiles: List of non-joker tiles in the set
         """
-        # Get the color and ordered numbers of the run
-        color = regular_tiles[0].color
-        numbers = sorted([t.number for t in regular_tiles])
-        
-        # Find gaps in the sequence
-        min_num = min(numbers)
-        max_num = max(numbers)
-        full_sequence = set(range(min_num, max_num + 1))
-        gaps = list(full_sequence - set(numbers))
-        
-        # Assign jokers to fill gaps first, then extend the sequence
-        joker_index = 0
-        
-        # Step 1: Fill gaps
-        for gap in sorted(gaps):
-            if joker_index < len(jokers):
-                jokers[joker_index].number = gap
-                jokers[joker_index].in_set = True
-                joker_index += 1
-            else:
-                break
-        
-        # Step 2: If we have remaining jokers, extend the sequence
-        while joker_index < len(jokers):
-            # Try to extend downward first, then upward
-            if min_num > 1:
-                min_num -= 1
-                jokers[joker_index].number = min_num
-                jokers[joker_index].in_set = True
-            else:
-                max_num += 1
-                jokers[joker_index].number = max_num
-                jokers[joker_index].in_set = True
-            joker_index += 1
+        numbers = [t.number for t in regular_tiles]
+        for joker, value in zip(jokers, rules.run_joker_values(numbers, len(jokers))):
+            joker.number = value
+            joker.in_set = True
 
     def snap_tile(self, dropped_tile: Tile, snap_threshold: float = 200) -> None:
         """
@@ -231,15 +239,16 @@ class Board:
         self.graph.update_tile(dropped_tile)
 
     def validate_sets(self) -> bool:
-        # Get the connected groups (forests) from the graph.
-        forests = self.graph.kruskals_msf(self.tiles, max_weight=200)
+        # Re-sync any tiles that moved without a set update (e.g. reverted drags),
+        # then split the board into sets.
+        self.graph.update_all_tiles(self.tiles)
+        sets = self.find_sets()
         
-        # Iterate over each forest and verify that it forms a valid set.
-        for forest in forests:
-            tile_ids, _ = forest
+        # Iterate over each group and verify that it forms a valid set.
+        for tile_ids in sets:
             tile_list = [self.tiles[t_id] for t_id in tile_ids]
             # A valid set must be either a valid group or a valid run.
-            if not (self.is_valid_group(tile_list) or self.is_valid_run(tile_list)):
+            if not rules.is_legal_meld(tile_list):
                 # Print an error message with details about the invalid set.
                 set_details = [f"(Number: {tile.number}, Color: {tile.color}{' Joker' if hasattr(tile, 'is_joker') and tile.is_joker else ''})"
                             for tile in tile_list]
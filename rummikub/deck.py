@@ -1,19 +1,93 @@
 from rummikub.tile import Tile
-from typing import Type, List, Tuple
+from rummikub.image_cache import ImageCache, ATLAS_INDEX
+from rummikub.rules import TileSpec
+from rummikub.tile_deck import TileDeck
+from typing import Callable, Optional, Type, List, Tuple, Union
 import re
 import os
 import random
 
-class Deck:
+# Where tiles rendered for a display size and theme are kept between runs
+TILE_CACHE_ENV = "RUMMIKUB_TILE_CACHE"
+DEFAULT_TILE_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "rummikub", "tiles")
 
-    def __init__(self, tile_folder: Type[str]):
+def spec_tile(tile_id: int, number: int, color: str, image_path: Optional[str], is_joker: bool = False) -> TileSpec:
+    """Tile factory for decks that never draw: plain TileSpecs, no images."""
+    return TileSpec(tile_id, number, color, is_joker)
+
+
+class Deck(TileDeck):
+
+    def __init__(self, tile_folder: Optional[str], tile_factory: Callable = None,
+                 seed: Union[int, random.Random, None] = None):
+        """
+        Build and shuffle a deck.
+        
+        Args:
+            tile_folder (str): Folder with the tile images, or None for the standard
+                106-tile set without images (only useful with a headless tile_factory)
+            tile_factory (Callable, optional): Called as ``tile_factory(id, number, color,
+                image_path, is_joker=...)`` for every tile. Defaults to Tile.
+            seed (int or random.Random, optional): Seed or generator for shuffling.
+                Defaults to None, which uses the global ``random`` module.
+        """
         self.tile_folder = tile_folder
-        self.tiles: List[Tile] = (self._shuffle(self._initialize_tiles()))
+        self.tile_factory = tile_factory
+        super().__init__(seed)
 
-    def __len__(self) -> int:
-        return len(self.tiles)
+    @classmethod
+    def headless(cls, seed: Union[int, random.Random, None] = None) -> "Deck":
+        """
+        Build a deck of TileSpecs without touching the disk or pygame surfaces.
+        
+        Args:
+            seed (int or random.Random, optional): Seed or generator for shuffling
+            
+        Returns:
+            Deck: The standard 106-tile set as TileSpecs
+        """
+        return cls(None, tile_factory=spec_tile, seed=seed)
+
+    @classmethod
+    def rendered(cls, size: Tuple[int, int] = (Tile.DEFAULT_WIDTH, Tile.DEFAULT_HEIGHT),
+                 theme: str = "classic", cache_root: str = None) -> "Deck":
+        """
+        Build a deck from tiles rendered at exactly the display size, so they
+        are never rescaled at load time.
+        
+        Tiles are rendered once per (size, theme) into an on-disk cache and
+        only re-rendered when their inputs change.
+        
+        Args:
+            size (Tuple[int, int]): Tile (width, height) in pixels
+            theme (str): Palette name from the generator's THEMES
+            cache_root (str, optional): Cache folder. Defaults to $RUMMIKUB_TILE_CACHE
+                or ~/.cache/rummikub/tiles.
+            
+        Returns:
+            Deck: Deck backed by the rendered tiles
+        """
+        # Imported here so Pillow is only needed when tiles are rendered
+        from rummikub.assets import generate_rummikub_tiles as generator
+        
+        if theme not in generator.THEMES:
+            raise ValueError(f"Unknown tile theme {theme!r}; expected one of {sorted(generator.THEMES)}")
+        
+        cache_root = cache_root or os.environ.get(TILE_CACHE_ENV) or DEFAULT_TILE_CACHE
+        width, height = size
+        tile_folder = os.path.join(cache_root, f"{theme}_{width}x{height}")
+        generator.generate_tiles(
+            tile_folder,
+            colors=generator.THEMES[theme],
+            joker_face_path=generator.find_joker_face(),
+            size=(width, height)
+        )
+        return cls(tile_folder)
 
     def _get_tile_images(self) -> List[Tuple[int, Type[str], Type[str]]]:
+        if self.tile_folder is None:
+            return self._standard_tiles()
+
         # Pattern for regular numbered tiles
         number_pattern = re.compile(r"tile_(\d+)_(\w+)\.png")
         # Pattern for joker tiles
@@ -22,7 +96,8 @@ class Deck:
         tile_data = []
         tile_id = 0
 
-        for filename in os.listdir(self.tile_folder):
+        # Sorted so tile ids, and so seeded shuffles, are the same on every filesystem
+        for filename in sorted(self._list_tile_files()):
             # Check for regular numbered tiles
             match = number_pattern.match(filename)
             if match:
@@ -41,26 +116,25 @@ class Deck:
                 
         return tile_data
 
+    def _list_tile_files(self) -> List[str]:
+        """List tile image names, preferring a packed atlas over the folder contents."""
+        index_path = os.path.join(self.tile_folder, ATLAS_INDEX)
+        if os.path.exists(index_path):
+            return ImageCache.register_atlas(index_path)
+        return os.listdir(self.tile_folder)
+
     def _initialize_tiles(self) -> List[Tile]:
         tile_files = self._get_tile_images()
+        tile_factory = self.tile_factory or Tile
         tiles = []
 
         for tile in tile_files:
             # Unpack the tile data (now includes is_joker flag)
             tile_id, number, color, image_path, is_joker = tile
-            tiles.append(Tile(tile_id, number, color, image_path, is_joker=is_joker))
-        return tiles
-    
-    def _shuffle(self, tiles: List[Tile]) -> List[Tile]:
-        """Shuffles the deck of tiles randomly."""
-        random.shuffle(tiles)
+            tiles.append(tile_factory(tile_id, number, color, image_path, is_joker=is_joker))
         return tiles
 
-    def pick_tile(self) -> Tile:
-        return self.tiles.pop()
-
 
 
 
     
-
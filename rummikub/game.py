@@ -1,9 +1,11 @@
 # Updated sections for game.py
 import pygame
 from rummikub.player import Player
+from rummikub.ai import ComputerPlayer
 from rummikub.deck import Deck
 from rummikub.screens.game_screen import GameScreen
 from rummikub.screens.menu import SetupMenu, TurnMenu
+from rummikub.rules import INITIAL_MELD_POINTS
 
 class Game:
     """
@@ -12,14 +14,19 @@ class Game:
     This class handles the overall game flow, screen transitions, and game rules.
     """
     
+    FRAME_RATE = 60
+    IDLE_TIMEOUT_MS = 500  # Longest the loop sleeps waiting for input
+    
     def __init__(self):
         """Initialize the game with default settings."""
-        self.deck = Deck("./rummikub/assets/tiles_2")
         pygame.init()
         self.screen = pygame.display.set_mode((3400, 2500))
+        # Build the deck once a display exists so cached tile surfaces are converted
+        self.deck = Deck("./rummikub/assets/tiles_2")
         pygame.display.set_caption("Rummikub")
         self.clock = pygame.time.Clock()
         self.running = True
+        self.pending_events = []  # Events taken off the queue while idle
         self.current_turn = 0
         self.players = []  # Will be set after name submission
         
@@ -39,27 +46,58 @@ class Game:
         self.menu_screen = SetupMenu(self)
         self.current_screen = self.menu_screen
 
-        self.game_screen = GameScreen(self)
+        # Built on first use so launching only pays for the menu
+        self._game_screen = None
+
+    @property
+    def game_screen(self):
+        """The main game screen, constructed the first time it is needed."""
+        if self._game_screen is None:
+            self._game_screen = GameScreen(self)
+        return self._game_screen
+
+    @game_screen.setter
+    def game_screen(self, screen):
+        self._game_screen = screen
+
+    def clear_table(self):
+        """Empty the board left over from a previous game, if there was one."""
+        if self._game_screen is not None:
+            self._game_screen.board.clear()
 
     def change_screen(self, new_screen):
         """Change the active screen."""
         self.current_screen = new_screen
+        # The game screen only repaints what changed, so redraw it fully on entry
+        if new_screen is self._game_screen:
+            new_screen.invalidate()
 
     def handle_events(self):
         """Process game events."""
-        events = pygame.event.get()
+        events = self.pending_events + pygame.event.get()
+        self.pending_events = []
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
         self.current_screen.handle_events(events)
 
+    def wait_for_events(self):
+        """Sleep until an event arrives or the idle timeout passes."""
+        event = pygame.event.wait(self.IDLE_TIMEOUT_MS)
+        if event.type != pygame.NOEVENT:
+            self.pending_events.append(event)
+
+    def needs_redraw(self) -> bool:
+        """Whether the current screen has anything new to show."""
+        return bool(self.current_screen.dirty)
+
     def update(self):
         """Update game state."""
         self.current_screen.update()
 
     def render(self):
         """Render the current screen."""
-        if self.current_screen != self.game_screen:
+        if self.current_screen is not self._game_screen:
             self.current_screen.draw(self.screen)
             pygame.display.flip()
         else:
@@ -119,9 +157,26 @@ class Game:
         self.populate_rack()
         self.save_positions()
 
-        self.change_screen(TurnMenu(self, turn_message, stats_message))
+        self.begin_turn(turn_message, stats_message)
         print(f"{self.players[self.current_turn].name}'s turn")
 
+    def begin_turn(self, turn_message, stats_message=None):
+        """
+        Hand the turn to the current player.
+        
+        Humans get the turn menu so the rack is only revealed to them; computer
+        players go straight to the game screen and start searching for a move.
+        
+        Args:
+            turn_message (str): Name shown on the turn menu
+            stats_message (str, optional): Statistics shown on the turn menu
+        """
+        if isinstance(self.players[self.current_turn], ComputerPlayer):
+            self.change_screen(self.game_screen)
+            self.game_screen.start_computer_turn()
+        else:
+            self.change_screen(TurnMenu(self, turn_message, stats_message))
+
     # Keep other methods, but enhance with statistics tracking where relevant
     
     def validate_turn(self) -> bool:
@@ -161,7 +216,7 @@ class Game:
                 total_value += tile.get_number()
         
         # Check if the total meets the 30 point requirement.
-        if total_value >= 30:
+        if total_value >= INITIAL_MELD_POINTS:
             current_player.initial_meld = True
             print(f"Initial meld met this turn with a total value of {total_value}.")
             return True
@@ -196,10 +251,14 @@ class Game:
 
     def run(self):
         while self.running:
+            # Block instead of spinning while the screen is static
+            if not self.needs_redraw():
+                self.wait_for_events()
             self.handle_events()
             self.update()
-            self.render()
-            self.clock.tick(60)
+            if self.needs_redraw():
+                self.render()
+            self.clock.tick(self.FRAME_RATE)
         pygame.quit()
 
 if __name__ == '__main__':
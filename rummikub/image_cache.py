@@ -0,0 +1,141 @@
+import json
+import os
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+# File names written by assets/generate_rummikub_tiles.py --atlas
+ATLAS_IMAGE = "tiles_atlas.png"
+ATLAS_INDEX = "tiles_atlas.json"
+
+
+class ImageCache:
+    """
+    Process-wide cache of decoded and scaled image surfaces.
+
+    Surfaces are keyed by (path, size) so every tile sharing an image file
+    shares one decoded original and one scaled copy per size, and building a
+    new deck for another game never touches the disk again. Cached surfaces
+    are shared: callers must not draw onto them.
+    """
+
+    _cache: Dict[Tuple[str, Optional[Tuple[int, int]]], pygame.Surface] = {}
+
+    # Highlighted copies: {(path, size, rgba): surface}
+    _tinted: Dict[Tuple[str, Tuple[int, int], Tuple[int, ...]], pygame.Surface] = {}
+
+    # Images packed into an atlas: {normalized path: (atlas path, (x, y, w, h))}
+    _atlas_regions: Dict[str, Tuple[str, Tuple[int, int, int, int]]] = {}
+
+    @classmethod
+    def register_atlas(cls, index_path: str) -> List[str]:
+        """
+        Serve the images listed in an atlas index from the packed atlas image.
+
+        Once registered, loading "<atlas folder>/<file name>" returns a subsurface
+        of the atlas instead of opening the individual file.
+
+        Args:
+            index_path (str): Path to the atlas JSON index
+
+        Returns:
+            List[str]: File names of the images packed in the atlas
+        """
+        with open(index_path) as index_file:
+            index = json.load(index_file)
+        folder = os.path.dirname(index_path)
+        atlas_path = os.path.join(folder, index["image"])
+        for filename, rect in index["tiles"].items():
+            cls._atlas_regions[os.path.normpath(os.path.join(folder, filename))] = (atlas_path, tuple(rect))
+        return list(index["tiles"])
+
+    @classmethod
+    def load(cls, path: str, size: Optional[Tuple[int, int]] = None) -> pygame.Surface:
+        """
+        Get the image at path, decoding and scaling it only on first use.
+
+        Args:
+            path (str): Path to the image file
+            size (Tuple[int, int], optional): Target (width, height). Defaults to
+                None, which returns the image at its original resolution.
+
+        Returns:
+            pygame.Surface: The cached surface
+        """
+        key = (path, size)
+        surface = cls._cache.get(key)
+        if surface is None:
+            if size is None:
+                surface = cls._decode(path)
+            else:
+                source = cls.load(path)
+                if source.get_size() != size:
+                    surface = cls._optimize(pygame.transform.smoothscale(source, size))
+                elif source.get_parent() is not None:
+                    # An atlas region: the atlas was converted once when decoded, and
+                    # its subsurfaces keep sharing that one pixel buffer
+                    surface = source
+                else:
+                    surface = cls._optimize(source)
+            cls._cache[key] = surface
+        return surface
+
+    @classmethod
+    def tinted(cls, path: str, size: Tuple[int, int], color: Tuple[int, ...]) -> pygame.Surface:
+        """
+        Get the image at path and size with a translucent color overlay baked in.
+
+        Args:
+            path (str): Path to the image file
+            size (Tuple[int, int]): Target (width, height)
+            color (Tuple[int, ...]): RGBA overlay color
+
+        Returns:
+            pygame.Surface: The cached, pre-tinted surface
+        """
+        key = (path, size, tuple(color))
+        surface = cls._tinted.get(key)
+        if surface is None:
+            surface = cls.load(path, size).copy()
+            overlay = pygame.Surface(size, pygame.SRCALPHA)
+            overlay.fill(color)
+            surface.blit(overlay, (0, 0))
+            cls._tinted[key] = surface
+        return surface
+
+    @classmethod
+    def _decode(cls, path: str) -> pygame.Surface:
+        """Read an image from its atlas if it was packed into one, else from disk."""
+        region = cls._atlas_regions.get(os.path.normpath(path))
+        if region is None:
+            return pygame.image.load(path)
+        atlas_path, rect = region
+        return cls._load_atlas(atlas_path).subsurface(pygame.Rect(rect))
+
+    @classmethod
+    def _load_atlas(cls, atlas_path: str) -> pygame.Surface:
+        """Decode an atlas image once, converted to the display format if there is a display."""
+        key = (atlas_path, None)
+        atlas = cls._cache.get(key)
+        if atlas is None:
+            atlas = cls._optimize(pygame.image.load(atlas_path))
+            cls._cache[key] = atlas
+        return atlas
+
+    @classmethod
+    def _optimize(cls, surface: pygame.Surface) -> pygame.Surface:
+        """Convert a surface to the display's pixel format once a display exists."""
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha()
+        return surface
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every cached surface and atlas registration."""
+        cls._cache.clear()
+        cls._tinted.clear()
+        cls._atlas_regions.clear()
+
+    @classmethod
+    def size(cls) -> int:
+        """Number of cached surfaces."""
+        return len(cls._cache) + len(cls._tinted)
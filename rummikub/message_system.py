@@ -38,14 +38,19 @@ class Message:
         # Check if message has expired
         return elapsed < self.duration
     
+    def get_rect(self, surface: pygame.Surface, default_y: int = 100) -> pygame.Rect:
+        """Area the message covers on the surface, measured without rendering it."""
+        width, height = ThemeManager.get_font(self.font_name).size(self.text)
+        if self.position:
+            x, y = self.position
+        else:
+            x = surface.get_width() // 2 - width // 2
+            y = default_y
+        return pygame.Rect(x, y, width, height)
+    
     def draw(self, surface: pygame.Surface, default_y: int = 100) -> None:
         """Draw the message with the current alpha value."""
-        font = ThemeManager.get_font(self.font_name)
-        color = ThemeManager.get_color(self.color_name)
-        
-        # Create a text surface with the current alpha
-        text_surf = font.render(self.text, True, color)
-        text_surf.set_alpha(self.alpha)
+        text_surf = ThemeManager.render_text(self.text, self.font_name, self.color_name)
         
         # Position the message
         if self.position:
@@ -53,8 +58,11 @@ class Message:
         else:
             x = surface.get_width() // 2 - text_surf.get_width() // 2
             y = default_y
-            
+        
+        # The text surface is shared through the cache, so only fade it for this blit
+        text_surf.set_alpha(self.alpha)
         surface.blit(text_surf, (x, y))
+        text_surf.set_alpha(None)
 
 class MessageSystem:
     """Manages game messages and notifications."""
@@ -77,12 +85,21 @@ class MessageSystem:
         """Update all active messages, removing expired ones."""
         self.messages = [msg for msg in self.messages if msg.update()]
     
+    def is_active(self) -> bool:
+        """Whether any message is still showing (and fading)."""
+        return bool(self.messages)
+    
     def draw(self, surface: pygame.Surface) -> None:
         """Draw all active messages to the screen."""
         for i, message in enumerate(self.messages):
             y_pos = 100 + i * self.vertical_spacing
             message.draw(surface, default_y=y_pos)
     
+    def get_rects(self, surface: pygame.Surface) -> List[pygame.Rect]:
+        """Areas covered by all active messages."""
+        return [message.get_rect(surface, default_y=100 + i * self.vertical_spacing)
+                for i, message in enumerate(self.messages)]
+    
     def clear(self) -> None:
         """Clear all messages."""
         self.messages.clear()
\ No newline at end of file
@@ -1,6 +1,4 @@
-from rummikub.tile import Tile
-from rummikub.deck import Deck
-from typing import List, Type, Dict, Iterator
+from typing import Type, Dict
 
 class Player:
     def __init__(self, game, name: Type[str]):
@@ -14,12 +12,12 @@ class Player:
         tiles = {}
         for _ in range(14):
             new_tile = self.game.deck.pick_tile()
-            tiles[new_tile.get_id()] = new_tile
+            tiles[new_tile.id] = new_tile
         return tiles
 
     def draw_tile(self) -> None:     
         new_tile = self.game.deck.pick_tile()
-        self.tiles[new_tile.get_id()] = new_tile
+        self.tiles[new_tile.id] = new_tile
 
     def add_tile(self, tile) -> None:
         self.tiles[tile.id] = tile
@@ -0,0 +1,54 @@
+"""
+Pure-Python Rummikub rules engine.
+
+Nothing in this package imports pygame, so it can validate boards in headless
+services and simulations without booting SDL or decoding tile images.
+"""
+from rummikub.rules.tiles import TileSpec, to_spec, to_specs
+from rummikub.rules.encoding import encode, encode_tile, encode_tiles, decode
+from rummikub.rules.melds import (
+    GROUP,
+    RUN,
+    meld_signature,
+    meld_table,
+    meld_kind,
+    is_legal_meld,
+)
+from rummikub.rules.validation import (
+    is_joker,
+    is_valid_group,
+    is_valid_run,
+    is_valid_set,
+    find_invalid_set,
+    validate_sets,
+    run_joker_values,
+)
+from rummikub.rules.solver import Solution, solve, TILES, POINTS, INITIAL_MELD_POINTS
+
+__all__ = [
+    'TileSpec',
+    'to_spec',
+    'to_specs',
+    'encode',
+    'encode_tile',
+    'encode_tiles',
+    'decode',
+    'GROUP',
+    'RUN',
+    'meld_signature',
+    'meld_table',
+    'meld_kind',
+    'is_legal_meld',
+    'is_joker',
+    'is_valid_group',
+    'is_valid_run',
+    'is_valid_set',
+    'find_invalid_set',
+    'validate_sets',
+    'run_joker_values',
+    'Solution',
+    'solve',
+    'TILES',
+    'POINTS',
+    'INITIAL_MELD_POINTS',
+]
@@ -0,0 +1,65 @@
+from typing import Iterable, List, Tuple
+
+# Bit layout of an encoded tile (fits in a uint8):
+#   bits 0-3  number (1-13)
+#   bits 4-5  color code
+#   bit  6    joker flag
+# Jokers encode as the bare flag so their assigned number never affects
+# validity, and 0 is reserved as padding for fixed-width meld arrays.
+NUMBER_MASK = 0x0F
+COLOR_SHIFT = 4
+COLOR_MASK = 0x03
+JOKER_FLAG = 0x40
+EMPTY = 0
+
+COLORS: Tuple[str, ...] = ('red', 'blue', 'black', 'orange')
+COLOR_CODES = {color: code for code, color in enumerate(COLORS)}
+
+
+def encode(number: int, color: str, is_joker: bool = False) -> int:
+    """
+    Pack a tile's face value into a small integer.
+
+    Args:
+        number (int): Numeric value of the tile (1-13, ignored for jokers)
+        color (str): Color of the tile (ignored for jokers)
+        is_joker (bool, optional): Whether this tile is a joker. Defaults to False.
+
+    Returns:
+        int: Encoded tile in the range 1-127
+
+    Raises:
+        ValueError: If the number or color cannot be encoded
+    """
+    if is_joker:
+        return JOKER_FLAG
+    if not 1 <= number <= 13:
+        raise ValueError(f"Cannot encode tile number {number}")
+    if color not in COLOR_CODES:
+        raise ValueError(f"Cannot encode tile color {color!r}")
+    return (COLOR_CODES[color] << COLOR_SHIFT) | number
+
+
+def encode_tile(tile) -> int:
+    """Encode any tile-like object (number, color, is_joker)."""
+    return encode(tile.number, tile.color, bool(getattr(tile, 'is_joker', False)))
+
+
+def encode_tiles(tiles: Iterable) -> List[int]:
+    """Encode a sequence of tile-like objects."""
+    return [encode_tile(tile) for tile in tiles]
+
+
+def decode(code: int) -> Tuple[int, str, bool]:
+    """
+    Unpack an encoded tile.
+
+    Args:
+        code (int): Encoded tile
+
+    Returns:
+        Tuple[int, str, bool]: (number, color, is_joker); jokers decode as (0, 'joker', True)
+    """
+    if code & JOKER_FLAG:
+        return 0, 'joker', True
+    return code & NUMBER_MASK, COLORS[(code >> COLOR_SHIFT) & COLOR_MASK], False
@@ -0,0 +1,97 @@
+"""
+Lookup table of every legal meld in a standard 106-tile set.
+
+Validity only depends on the multiset of tile faces, so each legal meld is
+stored under its canonical signature: the sorted tuple of encoded tiles. The
+table is built lazily on first use (a few thousand entries, well under a
+second) and checking a meld afterwards is a single dict lookup.
+"""
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, Optional, Tuple
+
+from rummikub.rules.encoding import COLORS, JOKER_FLAG, encode, encode_tile
+
+# Meld kinds, combined as bit flags (a meld such as 5-joker-joker is both)
+GROUP = 1
+RUN = 2
+
+MAX_JOKERS = 2
+
+Signature = Tuple[int, ...]
+
+
+def meld_signature(tiles: Iterable) -> Optional[Signature]:
+    """
+    Build the canonical signature of a meld.
+
+    Args:
+        tiles: Iterable of tile-like objects (number, color, is_joker)
+
+    Returns:
+        Signature: Sorted tuple of encoded tiles, or None if a tile cannot be encoded
+    """
+    try:
+        return tuple(sorted(encode_tile(tile) for tile in tiles))
+    except ValueError:
+        return None
+
+
+def _add(table: Dict[Signature, int], codes, jokers: int, kind: int) -> None:
+    signature = tuple(sorted(list(codes) + [JOKER_FLAG] * jokers))
+    table[signature] = table.get(signature, 0) | kind
+
+
+def _build_meld_table() -> Dict[Signature, int]:
+    table: Dict[Signature, int] = {}
+
+    # Groups: 3-4 tiles, one number, distinct colors, jokers fill missing colors
+    for number in range(1, 14):
+        for size in range(1, len(COLORS) + 1):
+            for colors in combinations(COLORS, size):
+                codes = [encode(number, color) for color in colors]
+                for jokers in range(MAX_JOKERS + 1):
+                    if 3 <= size + jokers <= 4:
+                        _add(table, codes, jokers, GROUP)
+
+    # Runs: distinct numbers of one color whose gaps are covered by jokers;
+    # any jokers left over extend the run
+    for color in COLORS:
+        for low in range(1, 14):
+            for high in range(low, 14):
+                interior = range(low + 1, high)
+                for gap_count in range(min(MAX_JOKERS, len(interior)) + 1):
+                    for gaps in combinations(interior, gap_count):
+                        numbers = [n for n in range(low, high + 1) if n not in gaps]
+                        codes = [encode(n, color) for n in numbers]
+                        for jokers in range(gap_count, MAX_JOKERS + 1):
+                            if len(numbers) + jokers >= 3:
+                                _add(table, codes, jokers, RUN)
+    return table
+
+
+@lru_cache(maxsize=None)
+def meld_table() -> Dict[Signature, int]:
+    """Return the (lazily built, process-wide) table of legal meld signatures."""
+    return _build_meld_table()
+
+
+def meld_kind(tiles: Iterable) -> int:
+    """
+    Look up what kind of meld the tiles form.
+
+    Args:
+        tiles: Iterable of tile-like objects
+
+    Returns:
+        int: Bitwise OR of GROUP and RUN, or 0 if the tiles are not a legal meld
+    """
+    signature = meld_signature(tiles)
+    if signature is None:
+        return 0
+    return meld_table().get(signature, 0)
+
+
+def is_legal_meld(tiles: Iterable) -> bool:
+    """Return True if the tiles form a valid group or run."""
+    return meld_kind(tiles) != 0
@@ -0,0 +1,398 @@
+"""
+Move solver: the best way to lay a rack onto the table.
+
+Tiles are placed value by value (1-13). For every color the state keeps two
+run slots, each holding the length of the run it is building capped at 3
+(0 means no open run; a run may only close at 0 or 3+). Tiles of the current
+value that don't extend a run go into groups, whose feasibility only depends
+on how many real tiles they get, whether a color repeats and how many jokers
+join them. States also count the jokers placed so far, so every table tile
+(jokers included) must end up in a meld while rack tiles are optional.
+
+That bounds the search to a few thousand states per value however many tiles
+are on the table. States are packed into ints, states whose runs are strictly
+behind another state's with no better score are pruned, and the winning path
+is replayed into melds of the original tiles, which are checked against
+``is_valid_set`` before being returned.
+
+Jokers are interchangeable, so the first jokers placed (in value order) are
+counted as the table's and any later ones as the rack's. Each color has at
+most two open runs at a time (the number of copies of a tile), so a joker
+never opens a third, parallel run of a color.
+"""
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from rummikub.rules.encoding import COLORS, COLOR_CODES
+from rummikub.rules.validation import is_joker, find_invalid_set
+
+TILES = 'tiles'
+POINTS = 'points'
+OBJECTIVES = (TILES, POINTS)
+
+INITIAL_MELD_POINTS = 30
+
+# What happens to a run slot at a value
+END = 0    # Close the run (or leave an empty slot empty)
+REAL = 1   # Extend with a real tile of the slot's color
+JOKER = 2  # Extend with a joker
+
+MAX_RUN = 3  # Run lengths are capped here; 3+ is all validity needs
+
+# A color's two slots as a sorted pair of capped lengths, indexed 0-9
+PAIRS = tuple((low, high) for low in range(MAX_RUN + 1) for high in range(low, MAX_RUN + 1))
+PAIR_INDEX = {pair: index for index, pair in enumerate(PAIRS)}
+CLOSED_PAIRS = frozenset(PAIR_INDEX[pair] for pair in ((0, 0), (0, MAX_RUN), (MAX_RUN, MAX_RUN)))
+SLOT_STATES = len(PAIRS) ** len(COLORS)
+COLOR_STRIDES = tuple(len(PAIRS) ** color for color in range(len(COLORS)))
+
+# Slot lengths that can follow every continuation of a given length: a 3+ run
+# may close or grow, and a run of 2 completes a step before a run of 1
+DOMINATING = {0: (3,), 1: (2, 3), 2: (3,), 3: ()}
+
+# Upper bound on the tie-break part of a score (points of 106 tiles, or a tile count)
+TIE_BREAK_RANGE = 4096
+
+# States expanded between deadline checks; a crowded table has tens of thousands per layer
+DEADLINE_CHECK_STATES = 512
+
+
+class Solution(NamedTuple):
+    """
+    Result of a solve.
+
+    Attributes:
+        melds (List[list]): Melds on the table after the move. Before the initial
+            meld only the new melds are listed, since the table is left as is.
+        played (list): Rack tiles moved to the table
+        points (int): Value of the played tiles (jokers count as the number they stand for)
+    """
+    melds: List[list]
+    played: list
+    points: int
+
+
+def _slot_actions(length: int) -> Tuple[int, ...]:
+    if length in (0, MAX_RUN):
+        return (END, REAL, JOKER)
+    return (REAL, JOKER)
+
+
+def _next_length(length: int, action: int) -> int:
+    return 0 if action == END else min(length + 1, MAX_RUN)
+
+
+@lru_cache(maxsize=None)
+def _color_moves(pair: int, forced: int, available: int, jokers_left: int):
+    """
+    Enumerate what one color can do at one value.
+
+    Args:
+        pair (int): Index of the color's slot lengths in PAIRS
+        forced (int): Copies of the tile on the table, which must be placed
+        available (int): Copies on the table and in the rack
+        jokers_left (int): Jokers not placed yet
+
+    Returns:
+        tuple: (new_pair, actions, used, grouped, jokers_used) entries, where ``used``
+            counts the real copies placed; symmetric duplicates are dropped.
+    """
+    slots = PAIRS[pair]
+    moves = {}
+    for first in _slot_actions(slots[0]):
+        for second in _slot_actions(slots[1]):
+            actions = (first, second)
+            in_runs = actions.count(REAL)
+            wild = actions.count(JOKER)
+            if in_runs > available or wild > jokers_left:
+                continue
+            new_pair = PAIR_INDEX[tuple(sorted(_next_length(length, action)
+                                               for length, action in zip(slots, actions)))]
+            for grouped in range(max(0, forced - in_runs), available - in_runs + 1):
+                key = (new_pair, in_runs, grouped, wild)
+                if key not in moves:
+                    moves[key] = (new_pair, actions, in_runs + grouped, grouped, wild)
+    return tuple(moves.values())
+
+
+@lru_cache(maxsize=None)
+def _pair_upgrades(pair: int) -> Tuple[int, ...]:
+    """Pairs that differ from ``pair`` by one slot with a dominating length."""
+    low, high = PAIRS[pair]
+    upgrades = {PAIR_INDEX[tuple(sorted((longer, high)))] for longer in DOMINATING[low]}
+    upgrades.update(PAIR_INDEX[tuple(sorted((low, longer)))] for longer in DOMINATING[high])
+    return tuple(sorted(upgrades))
+
+
+def _group_count(real: int, wide: bool, jokers: int) -> Optional[int]:
+    """
+    Find how many groups can hold the tiles set aside for groups at one value.
+
+    Dealing the tiles round-robin, ``k`` groups work when every group gets a
+    real tile, no color has more than ``k`` copies and each group ends up with
+    3-4 tiles. ``wide`` means a single group can't hold the real tiles.
+
+    Returns:
+        int: Number of groups (0 if there is nothing to group), or None if infeasible
+    """
+    total = real + jokers
+    if total == 0:
+        return 0
+    for count in range(2 if wide else 1, real + 1):
+        if 3 * count <= total <= 4 * count:
+            return count
+    return None
+
+
+def _prune_dominated(scores: Dict[int, int]) -> Dict[int, int]:
+    """
+    Drop states that a state with longer runs and no worse score makes redundant.
+
+    Anything that can be played from the pruned state can be played from its
+    dominator too, so this only shrinks the search.
+    """
+    pruned = {}
+    for key, score in scores.items():
+        slots = key % SLOT_STATES
+        dominated = False
+        for stride in COLOR_STRIDES:
+            pair = slots // stride % len(PAIRS)
+            for upgrade in _pair_upgrades(pair):
+                if scores.get(key + (upgrade - pair) * stride, -1) >= score:
+                    dominated = True
+                    break
+            if dominated:
+                break
+        if not dominated:
+            pruned[key] = score
+    return pruned
+
+
+def solve(table: Iterable, rack: Iterable, initial_meld: bool = True, objective: str = TILES,
+          deadline: Optional[float] = None) -> Optional[Solution]:
+    """
+    Find the arrangement that plays the most rack tiles (or points).
+
+    Args:
+        table: Tile-like objects currently on the table; all of them must stay in valid melds
+        rack: Tile-like objects the player may play
+        initial_meld (bool, optional): Whether the player already made their initial meld.
+            If not, the table is left untouched and the new melds must be worth at least
+            INITIAL_MELD_POINTS. Defaults to True.
+        objective (str, optional): TILES or POINTS; the other one breaks ties. Defaults to TILES.
+        deadline (float, optional): ``time.monotonic()`` value to give up at. Defaults to None.
+
+    Returns:
+        Solution: The best move (``played`` is empty when nothing can be played),
+            or None if the table tiles can't be arranged into valid melds at all
+
+    Raises:
+        ValueError: If the objective is unknown
+        TimeoutError: If the deadline passes before the search finishes
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective {objective!r}, expected one of {OBJECTIVES}")
+
+    table = list(table) if initial_meld else []
+    rack = list(rack)
+    threshold = 0 if initial_meld else INITIAL_MELD_POINTS
+    # Scores are single ints: the objective in the high bits, the tie-break below
+    tile_weight, point_weight = (TIE_BREAK_RANGE, 1) if objective == TILES else (1, TIE_BREAK_RANGE)
+
+    # Tiles by (color code, value): table copies first, they must be placed
+    pools: Dict[Tuple[int, int], Tuple[list, list]] = {}
+    jokers: Tuple[list, list] = ([], [])
+    for side, tiles in enumerate((table, rack)):
+        for tile in tiles:
+            if is_joker(tile):
+                jokers[side].append(tile)
+            else:
+                pools.setdefault((COLOR_CODES[tile.color], tile.number), ([], []))[side].append(tile)
+    table_jokers = len(jokers[0])
+    joker_count = table_jokers + len(jokers[1])
+
+    # A state packs, from the lowest digits up: the slot pairs of every color,
+    # jokers placed, points toward the initial meld (capped at the threshold) and,
+    # within a value, the real tiles set aside for groups and whether they need
+    # more than one group. Each step keeps the best score per state and a link
+    # to the (previous state, decision) that reached it.
+    # Transitions only depend on one color's pair and the fields above the slots,
+    # so they are worked out once per combination as (key delta, score gain, decision).
+    joker_stride = SLOT_STATES
+    meld_stride = joker_stride * (joker_count + 1)
+    group_stride = meld_stride * (threshold + 1)
+
+    def unpack(upper: int) -> Tuple[int, int, int]:
+        # (jokers placed, initial meld points, group field) from key // joker_stride
+        return upper % (joker_count + 1), upper // (joker_count + 1) % (threshold + 1), \
+            upper // (joker_count + 1) // (threshold + 1)
+
+    def gains(placed: int, wild: int, real_played: int, meld_points: int, value: int) -> Tuple[int, int]:
+        # Rack tiles played (jokers past the table's count come from the rack) and
+        # the change in initial meld points
+        played = real_played + max(0, placed + wild - table_jokers) - max(0, placed - table_jokers)
+        return played, min(meld_points + played * value, threshold) - meld_points
+
+    def color_transitions(pair, upper, color_stride, forced, available, value, unit):
+        placed, meld_points, group = unpack(upper)
+        transitions = []
+        for new_pair, actions, used, grouped, wild in _color_moves(pair, forced, available, joker_count - placed):
+            played, meld_gain = gains(placed, wild, used - forced, meld_points, value)
+            real = (group >> 1) + grouped
+            wide = (group & 1) or grouped > 1 or real > len(COLORS)
+            delta = ((new_pair - pair) * color_stride + wild * joker_stride + meld_gain * meld_stride
+                     + (((real << 1) | wide) - group) * group_stride)
+            transitions.append((delta, played * unit, (actions, used)))
+        return transitions
+
+    def closing_transitions(upper, value, unit):
+        placed, meld_points, group = unpack(upper)
+        transitions = []
+        for wild in range(joker_count - placed + 1):
+            groups = _group_count(group >> 1, group & 1, wild)
+            if groups is None:
+                continue
+            played, meld_gain = gains(placed, wild, 0, meld_points, value)
+            delta = wild * joker_stride + meld_gain * meld_stride - group * group_stride
+            transitions.append((delta, played * unit, (wild, groups)))
+        return transitions
+
+    def check_deadline():
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError("Solver ran past its deadline")
+
+    layer = {0: 0}
+    history = []
+    pair_count = len(PAIRS)
+
+    for value in range(1, 14):
+        unit = tile_weight + value * point_weight
+        partial = layer
+        steps = []
+        for color, color_stride in enumerate(COLOR_STRIDES):
+            table_tiles, rack_tiles = pools.get((color, value), ((), ()))
+            forced, available = len(table_tiles), len(table_tiles) + len(rack_tiles)
+            cache = {}
+            scores, links = {}, {}
+            for index, (key, score) in enumerate(partial.items()):
+                if not index % DEADLINE_CHECK_STATES:
+                    check_deadline()
+                local = (key // color_stride % pair_count, key // joker_stride)
+                transitions = cache.get(local)
+                if transitions is None:
+                    transitions = cache[local] = color_transitions(
+                        *local, color_stride, forced, available, value, unit)
+                for delta, gain, decision in transitions:
+                    new_key = key + delta
+                    new_score = score + gain
+                    if scores.get(new_key, -1) < new_score:
+                        scores[new_key] = new_score
+                        links[new_key] = (key, decision)
+            steps.append(links)
+            partial = scores
+
+        # Close the value: place the group tiles, possibly with jokers
+        cache = {}
+        scores, links = {}, {}
+        for index, (key, score) in enumerate(partial.items()):
+            if not index % DEADLINE_CHECK_STATES:
+                check_deadline()
+            upper = key // joker_stride
+            transitions = cache.get(upper)
+            if transitions is None:
+                transitions = cache[upper] = closing_transitions(upper, value, unit)
+            for delta, gain, decision in transitions:
+                new_key = key + delta
+                new_score = score + gain
+                if scores.get(new_key, -1) < new_score:
+                    scores[new_key] = new_score
+                    links[new_key] = (key, decision)
+        layer = _prune_dominated(scores)
+        history.append((steps, links))
+
+    # Every run must be closed, every table joker placed and the initial meld reached
+    best_key = None
+    for key, score in layer.items():
+        slots = key % SLOT_STATES
+        if any(slots // stride % len(PAIRS) not in CLOSED_PAIRS for stride in COLOR_STRIDES):
+            continue
+        if key // joker_stride % (joker_count + 1) < table_jokers:
+            continue
+        if score and key // meld_stride % (threshold + 1) < threshold:
+            continue
+        if best_key is None or score > layer[best_key]:
+            best_key = key
+    if best_key is None:
+        return None
+
+    decisions = []
+    key = best_key
+    for steps, closing_links in reversed(history):
+        key, closing = closing_links[key]
+        path = []
+        for step in reversed(steps):
+            key, decision = step[key]
+            path.append(decision)
+        path.reverse()
+        decisions.append((path,) + closing)
+    decisions.reverse()
+    return _replay(decisions, pools, jokers)
+
+
+def _replay(decisions, pools, jokers) -> Solution:
+    """Turn the winning path back into melds of the original tile objects."""
+    melds: List[list] = []
+    played: list = []
+    points = 0
+    # Jokers are handed out in the order the solver placed them, table ones first
+    joker_supply = iter([(joker, False) for joker in jokers[0]] + [(joker, True) for joker in jokers[1]])
+    runs = [[[], []] for _ in COLORS]
+
+    def take_joker(value: int):
+        nonlocal points
+        joker, from_rack = next(joker_supply)
+        if from_rack:
+            played.append(joker)
+            points += value
+        return joker
+
+    for value, (path, wild, groups) in enumerate(decisions, start=1):
+        grouped_tiles = []
+        for color, (actions, used) in enumerate(path):
+            table_tiles, rack_tiles = pools.get((color, value), ((), ()))
+            from_rack = list(rack_tiles)[:used - len(table_tiles)]
+            supply = iter(list(table_tiles) + from_rack)
+            played.extend(from_rack)
+            points += value * len(from_rack)
+
+            # Slots were sorted by capped length when the decision was made
+            slots = sorted(runs[color], key=lambda run: min(len(run), MAX_RUN))
+            for run, action in zip(slots, actions):
+                if action == END:
+                    if run:
+                        melds.append(list(run))
+                        run.clear()
+                elif action == REAL:
+                    run.append(next(supply))
+                else:
+                    run.append(take_joker(value))
+            runs[color] = slots
+            grouped_tiles.extend(supply)
+
+        if groups:
+            # Deal colors round-robin so no group repeats a color, then top up with jokers
+            value_groups = [[] for _ in range(groups)]
+            for index, tile in enumerate(grouped_tiles):
+                value_groups[index % groups].append(tile)
+            for _ in range(wild):
+                min(value_groups, key=len).append(take_joker(value))
+            melds.extend(value_groups)
+
+    for color_runs in runs:
+        melds.extend(list(run) for run in color_runs if run)
+
+    invalid = find_invalid_set(melds)
+    if invalid is not None:
+        raise RuntimeError(f"Solver produced an invalid meld: {invalid}")
+    return Solution(melds, played, points)
@@ -0,0 +1,41 @@
+from typing import NamedTuple, Iterable, List
+
+
+class TileSpec(NamedTuple):
+    """
+    Plain, display-free description of a Rummikub tile.
+
+    The rules engine only needs a tile's identity and face value, so it works on
+    these records (or on any object exposing the same attributes, such as
+    ``rummikub.tile.Tile``) without touching pygame.
+
+    Attributes:
+        id (int): Unique identifier for the tile
+        number (int): Numeric value of the tile (1-13, 0 for jokers)
+        color (str): Color of the tile ('red', 'blue', 'black', 'orange', 'joker')
+        is_joker (bool): Whether this tile is a joker
+    """
+    id: int
+    number: int
+    color: str
+    is_joker: bool = False
+
+
+def to_spec(tile) -> TileSpec:
+    """
+    Build a TileSpec from any tile-like object.
+
+    Args:
+        tile: Object with id, number and color attributes (is_joker optional)
+
+    Returns:
+        TileSpec: Immutable record holding the tile's rule-relevant data
+    """
+    if isinstance(tile, TileSpec):
+        return tile
+    return TileSpec(tile.id, tile.number, tile.color, bool(getattr(tile, 'is_joker', False)))
+
+
+def to_specs(tiles: Iterable) -> List[TileSpec]:
+    """Convert an iterable of tile-like objects to a list of TileSpecs."""
+    return [to_spec(tile) for tile in tiles]
@@ -0,0 +1,131 @@
+from typing import Iterable, List, Optional, Sequence
+
+
+def is_joker(tile) -> bool:
+    """Return True if the tile-like object is a joker."""
+    return bool(getattr(tile, 'is_joker', False))
+
+
+def is_valid_group(tiles: Sequence) -> bool:
+    """
+    Check if tiles form a valid group (same number, different colors).
+
+    Args:
+        tiles: Sequence of tile-like objects (number, color, is_joker)
+
+    Returns:
+        bool: True if tiles form a valid group
+    """
+    # Must be exactly 3 or 4 tiles
+    if len(tiles) not in (3, 4):
+        return False
+
+    # Separate non-joker tiles
+    non_jokers = [tile for tile in tiles if not is_joker(tile)]
+    if not non_jokers:  # There must be at least one non-joker to define the number
+        return False
+
+    # All non-joker tiles must share the same number
+    target_number = non_jokers[0].number
+    for tile in non_jokers:
+        if tile.number != target_number:
+            return False
+
+    # Colors of non-joker tiles must be unique
+    colors = [tile.color for tile in non_jokers]
+    return len(colors) == len(set(colors))
+
+
+def is_valid_run(tiles: Sequence) -> bool:
+    """
+    Check if tiles form a valid run (same color, sequential numbers).
+
+    Args:
+        tiles: Sequence of tile-like objects (number, color, is_joker)
+
+    Returns:
+        bool: True if tiles form a valid run
+    """
+    # Must contain at least 3 tiles
+    if len(tiles) < 3:
+        return False
+
+    non_jokers = [tile for tile in tiles if not is_joker(tile)]
+    if not non_jokers:  # Run must have at least one non-joker to set the color
+        return False
+
+    # All non-joker tiles must be the same color
+    run_color = non_jokers[0].color
+    for tile in non_jokers:
+        if tile.color != run_color:
+            return False
+
+    numbers = sorted(tile.number for tile in non_jokers)
+
+    # Check that there are no duplicate numbers among non-jokers
+    if len(numbers) != len(set(numbers)):
+        return False
+
+    # The gaps between consecutive numbers must be covered by the jokers
+    required_gaps = numbers[-1] - numbers[0] + 1 - len(numbers)
+    available_jokers = len(tiles) - len(non_jokers)
+    return required_gaps <= available_jokers
+
+
+def is_valid_set(tiles: Sequence) -> bool:
+    """Check if tiles form either a valid group or a valid run."""
+    return is_valid_group(tiles) or is_valid_run(tiles)
+
+
+def find_invalid_set(sets: Iterable[Sequence]) -> Optional[Sequence]:
+    """
+    Find the first set that is neither a valid group nor a valid run.
+
+    Args:
+        sets: Iterable of tile sequences, one per set on the table
+
+    Returns:
+        The first invalid set, or None if every set is valid
+    """
+    for tiles in sets:
+        if not is_valid_set(tiles):
+            return tiles
+    return None
+
+
+def validate_sets(sets: Iterable[Sequence]) -> bool:
+    """Return True if every set on the table is a valid group or run."""
+    return find_invalid_set(sets) is None
+
+
+def run_joker_values(numbers: Iterable[int], joker_count: int) -> List[int]:
+    """
+    Work out which numbers the jokers of a run stand for.
+
+    Jokers fill the gaps between the run's numbers first, then extend the
+    sequence downward while possible and upward after that.
+
+    Args:
+        numbers: Numbers of the non-joker tiles in the run
+        joker_count: Number of jokers in the run
+
+    Returns:
+        List[int]: One number per joker, in assignment order
+    """
+    numbers = sorted(numbers)
+    min_num, max_num = numbers[0], numbers[-1]
+    present = set(numbers)
+    gaps = [n for n in range(min_num, max_num + 1) if n not in present]
+
+    # Step 1: Fill gaps
+    values = gaps[:joker_count]
+
+    # Step 2: Extend the sequence with any remaining jokers
+    while len(values) < joker_count:
+        if min_num > 1:
+            min_num -= 1
+            values.append(min_num)
+        else:
+            max_num += 1
+            values.append(max_num)
+    return values
@@ -0,0 +1,97 @@
+"""
+NumPy batch validators for encoded melds.
+
+Melds are rows of a 2D array of encoded tiles (see ``rummikub.rules.encoding``),
+right-padded with ``EMPTY``. Each validator checks every row in one call and
+returns a boolean mask, matching ``is_valid_group``/``is_valid_run`` exactly.
+"""
+from typing import Iterable, Optional, Sequence
+import numpy as np
+
+from rummikub.rules.encoding import (
+    NUMBER_MASK, COLOR_SHIFT, COLOR_MASK, JOKER_FLAG, EMPTY, encode_tiles
+)
+
+
+def pack_melds(melds: Iterable[Sequence], width: Optional[int] = None) -> np.ndarray:
+    """
+    Encode tile melds into a padded uint8 array suitable for batch validation.
+
+    Args:
+        melds: Iterable of tile sequences (tile-like objects)
+        width (int, optional): Row width. Defaults to the longest meld.
+
+    Returns:
+        np.ndarray: Array of shape (len(melds), width)
+    """
+    encoded = [encode_tiles(meld) for meld in melds]
+    if width is None:
+        width = max((len(meld) for meld in encoded), default=0)
+    packed = np.full((len(encoded), width), EMPTY, dtype=np.uint8)
+    for row, meld in enumerate(encoded):
+        if len(meld) > width:
+            raise ValueError(f"Meld of {len(meld)} tiles does not fit in width {width}")
+        packed[row, :len(meld)] = meld
+    return packed
+
+
+def _decompose(codes):
+    """Split an encoded meld array into the per-tile fields used by the validators."""
+    codes = np.atleast_2d(np.asarray(codes)).astype(np.int32, copy=False)
+    present = codes != EMPTY
+    real = present & ((codes & JOKER_FLAG) == 0)
+    numbers = codes & NUMBER_MASK
+    colors = (codes >> COLOR_SHIFT) & COLOR_MASK
+    length = present.sum(axis=1)
+    n_real = real.sum(axis=1)
+    return real, numbers, colors, length, n_real
+
+
+def _same_value(values, real):
+    """Row mask: all real tiles share the same value."""
+    high = np.where(real, values, -1).max(axis=1)
+    low = np.where(real, values, NUMBER_MASK + 1).min(axis=1)
+    return high == low
+
+
+def valid_groups(codes) -> np.ndarray:
+    """
+    Check which rows form a valid group (same number, different colors).
+
+    Args:
+        codes: Array-like of encoded melds, shape (n, width)
+
+    Returns:
+        np.ndarray: Boolean mask of shape (n,)
+    """
+    real, numbers, colors, length, n_real = _decompose(codes)
+    color_bits = np.bitwise_or.reduce(np.where(real, 1 << colors, 0), axis=1)
+    return ((length >= 3) & (length <= 4) & (n_real >= 1)
+            & _same_value(numbers, real)
+            & (np.bitwise_count(color_bits) == n_real))
+
+
+def valid_runs(codes) -> np.ndarray:
+    """
+    Check which rows form a valid run (same color, sequential numbers).
+
+    Args:
+        codes: Array-like of encoded melds, shape (n, width)
+
+    Returns:
+        np.ndarray: Boolean mask of shape (n,)
+    """
+    real, numbers, colors, length, n_real = _decompose(codes)
+    number_bits = np.bitwise_or.reduce(np.where(real, 1 << numbers, 0), axis=1)
+    high = np.where(real, numbers, 0).max(axis=1)
+    low = np.where(real, numbers, NUMBER_MASK + 1).min(axis=1)
+    required_gaps = high - low + 1 - n_real
+    return ((length >= 3) & (n_real >= 1)
+            & _same_value(colors, real)
+            & (np.bitwise_count(number_bits) == n_real)
+            & (required_gaps <= length - n_real))
+
+
+def valid_sets(codes) -> np.ndarray:
+    """Check which rows form either a valid group or a valid run."""
+    return valid_groups(codes) | valid_runs(codes)
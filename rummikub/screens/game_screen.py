@@ -4,6 +4,7 @@ from rummikub.board import Board
 from rummikub.player import Player
 from rummikub.theme_manager import ThemeManager
 from rummikub.message_system import MessageSystem
+from rummikub.ai import ComputerPlayer, Opponent
 
 class GameScreen:
     """
@@ -13,6 +14,8 @@ class GameScreen:
     It handles tile interaction, move validation, and visual feedback.
     """
 
+    BUTTON_SIZE = (200, 100)  # Buttons are drawn by ThemeManager at this size
+
     def __init__(self, game):
         """
         Initialize the game screen.
@@ -32,16 +35,6 @@ class GameScreen:
         self.message_system = MessageSystem()
 
         # Load images
-        self.draw_button_img = pygame.image.load("./rummikub/assets/buttons/draw_button.png")
-        self.end_button_img = pygame.image.load("./rummikub/assets/buttons/end_turn_button.png")
-        # Create a new reset button image or use a placeholder for now
-        try:
-            self.reset_button_img = pygame.image.load("./rummikub/assets/buttons/reset_button.png")
-        except:
-            # If the reset button image doesn't exist, create a similar sized surface
-            self.reset_button_img = pygame.Surface(self.end_button_img.get_size())
-            self.reset_button_img.fill((50, 100, 200))  # Blue background
-        
         self.player_rack_img = pygame.image.load("./rummikub/assets/rack.png")
         self.player_rack_rect = self.player_rack_img.get_rect(midbottom=(1700, 2500))
         
@@ -56,27 +49,35 @@ class GameScreen:
         
         # Position buttons vertically centered relative to the rack
         # with the middle button (End Turn) aligned with rack center
-        self.draw_button_rect = self.draw_button_img.get_rect(
-            center=(right_side_x, rack_center_y - button_spacing)
-        )
+        self.draw_button_rect = pygame.Rect((0, 0), self.BUTTON_SIZE)
+        self.draw_button_rect.center = (right_side_x, rack_center_y - button_spacing)
         
-        self.end_button_rect = self.end_button_img.get_rect(
-            center=(right_side_x, rack_center_y)
-        )
+        self.end_button_rect = pygame.Rect((0, 0), self.BUTTON_SIZE)
+        self.end_button_rect.center = (right_side_x, rack_center_y)
         
-        self.reset_button_rect = self.reset_button_img.get_rect(
-            center=(right_side_x, rack_center_y + button_spacing)
-        )
+        self.reset_button_rect = pygame.Rect((0, 0), self.BUTTON_SIZE)
+        self.reset_button_rect.center = (right_side_x, rack_center_y + button_spacing)
         
         # Create semi-transparent surfaces for board area
         self.board_area = pygame.Surface((3400, 1760), pygame.SRCALPHA)
         self.board_area.fill((*ThemeManager.get_color('board_area')[:3], 128))
         
+        # Opaque layer with everything except buttons, tiles and messages,
+        # rebuilt when the turn, deck size or theme version changes
+        self.background = None
+        self.background_key = None
+        
         # Track hover state for buttons
         self.draw_button_hover = False
         self.end_button_hover = False
         self.reset_button_hover = False
         
+        # Retained-mode rendering state: regions to repaint on the next frame
+        self.screen_rect = pygame.Rect(0, 0, 3400, 2500)
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.message_rects = []
+        
         # Try to initialize sound system
         try:
             pygame.mixer.init()
@@ -107,18 +108,51 @@ class GameScreen:
         if self.sound_enabled and sound_name in self.sounds:
             self.sounds[sound_name].play()
 
+    @property
+    def dirty(self) -> bool:
+        """Whether the next render has anything to repaint."""
+        return bool(self.full_redraw or self.dirty_rects or self.message_rects
+                    or self.message_system.is_active())
+
+    def invalidate(self, rect=None) -> None:
+        """
+        Mark part of the screen as needing a repaint on the next render.
+        
+        Args:
+            rect (pygame.Rect, optional): Region that changed. Defaults to None,
+                which schedules a full redraw.
+        """
+        if rect is None:
+            self.full_redraw = True
+        else:
+            self.dirty_rects.append(rect)
+
     def handle_events(self, events):
-        # Update hover states for buttons
+        # Update hover states for buttons, repainting only the buttons that changed
         mouse_pos = pygame.mouse.get_pos()
+        previous_hover = (self.draw_button_hover, self.end_button_hover, self.reset_button_hover)
         self.draw_button_hover = self.draw_button_rect.collidepoint(mouse_pos)
         self.end_button_hover = self.end_button_rect.collidepoint(mouse_pos)
         self.reset_button_hover = self.reset_button_rect.collidepoint(mouse_pos)
+        current_hover = (self.draw_button_hover, self.end_button_hover, self.reset_button_hover)
+        button_rects = (self.draw_button_rect, self.end_button_rect, self.reset_button_rect)
+        for rect, was_hovered, is_hovered in zip(button_rects, previous_hover, current_hover):
+            if was_hovered != is_hovered:
+                self.invalidate(rect)
+
+        # Computer players move on their own; the mouse only hovers meanwhile
+        if self.is_computer_turn():
+            return
 
         for event in events:
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
                 
                 # Handle button clicks with visual/audio feedback
+                if any(rect.collidepoint(mouse_pos) for rect in button_rects):
+                    # Buttons can change the turn, rack or whole board
+                    self.invalidate()
+                
                 if self.draw_button_rect.collidepoint(mouse_pos):
                     if self.board.added_tiles:
                         self.message_system.add_message(
@@ -127,36 +161,12 @@ class GameScreen:
                         )
                         self.play_sound('invalid_move')
                     else:
-                        self.game.players[self.game.current_turn].draw_tile()
-                        self.message_system.add_message(
-                            f"{self.game.players[self.game.current_turn].name} drew a tile.",
-                            color_name='highlight'
-                        )
-                        self.game.statistics['tiles_drawn'] += 1
-                        self.play_sound('draw_tile')
-                        self.game.next_turn()
+                        self.draw_and_pass()
                 
                 elif self.end_button_rect.collidepoint(mouse_pos):
                     # Modified behavior: Check validity but don't reset on invalid
                     if self.game.validate_turn():
-                        self.message_system.add_message(
-                            "Valid move! Turn completed.",
-                            color_name='valid'
-                        )
-                        self.play_sound('valid_set')
-                        
-                        if self.game.check_for_win():
-                            winner = self.game.players[self.game.current_turn].name
-                            self.message_system.add_message(
-                                f"{winner} wins the game!",
-                                color_name='highlight',
-                                duration=5.0,
-                                font_name='title'
-                            )
-                            self.play_sound('win')
-                            # Could add a win screen transition here
-                        else:
-                            self.game.next_turn()
+                        self.finish_valid_turn()
                     else:
                         # Just show message but don't reset tiles
                         self.message_system.add_message(
@@ -182,6 +192,7 @@ class GameScreen:
                         tile.start_drag(mouse_pos)
                         self.dragged_tile = tile
                         self.dragged_from = 'rack'
+                        self.invalidate(tile.draw_rect)
                         break
                 
                 # If not in rack, check board tiles
@@ -191,9 +202,12 @@ class GameScreen:
                             tile.start_drag(mouse_pos)
                             self.dragged_tile = tile
                             self.dragged_from = 'board'
+                            self.invalidate(tile.draw_rect)
                             break
 
             elif event.type == pygame.MOUSEMOTION and self.dragged_tile:
+                # Repaint where the tile was and where it is now
+                self.invalidate(self.dragged_tile.draw_rect)
                 self.dragged_tile.update_drag(pygame.mouse.get_pos())
                 
                 # Provide visual feedback during dragging
@@ -202,8 +216,10 @@ class GameScreen:
                     self.dragged_tile.set_highlight(True, 'valid' if valid_drop else 'invalid')
                 else:
                     self.dragged_tile.set_highlight(False)
+                self.invalidate(self.dragged_tile.draw_rect)
 
             elif event.type == pygame.MOUSEBUTTONUP and self.dragged_tile:
+                self.invalidate(self.dragged_tile.draw_rect)
                 self.dragged_tile.stop_drag()
                 self.dragged_tile.set_highlight(False)  # Clear highlight
                 
@@ -213,8 +229,9 @@ class GameScreen:
                         # Valid drop from rack to board
                         self.game.players[self.game.current_turn].remove_tile(self.dragged_tile.id)
                         self.board.add_tile(self.dragged_tile)
-                        self.board.update_sets()
+                        # Snap first so the sets are segmented from the tile's final row
                         self.board.snap_tile(self.dragged_tile)
+                        self.board.update_sets(self.dragged_tile)
                         self.play_sound('tile_place')
                     else:
                         # Invalid drop: revert to pre-drag position
@@ -230,8 +247,8 @@ class GameScreen:
                             self.play_sound('invalid_move')
                         else:
                             # Valid move within board
-                            self.board.update_sets()
                             self.board.snap_tile(self.dragged_tile)
+                            self.board.update_sets(self.dragged_tile)
                             self.play_sound('tile_place')
                     else:
                         # Dropped outside board
@@ -246,20 +263,162 @@ class GameScreen:
                             self.dragged_tile.revert_to_turn_start()
                             self.play_sound('invalid_move')
                 
+                self.invalidate(self.dragged_tile.draw_rect)
                 self.dragged_tile = None
                 self.dragged_from = None
 
+    def draw_and_pass(self) -> None:
+        """Draw a tile for the current player (or pass if the deck is empty) and end their turn."""
+        player = self.game.players[self.game.current_turn]
+        if len(self.game.deck) == 0:
+            self.message_system.add_message(f"{player.name} passed.", color_name='highlight')
+            self.game.next_turn()
+            return
+        
+        player.draw_tile()
+        self.message_system.add_message(
+            f"{player.name} drew a tile.",
+            color_name='highlight'
+        )
+        self.game.statistics['tiles_drawn'] += 1
+        self.play_sound('draw_tile')
+        self.game.next_turn()
+
+    def finish_valid_turn(self) -> None:
+        """End a validated turn, finishing the game if the player emptied their rack."""
+        self.message_system.add_message(
+            "Valid move! Turn completed.",
+            color_name='valid'
+        )
+        self.play_sound('valid_set')
+        
+        if self.game.check_for_win():
+            winner = self.game.players[self.game.current_turn].name
+            self.message_system.add_message(
+                f"{winner} wins the game!",
+                color_name='highlight',
+                duration=5.0,
+                font_name='title'
+            )
+            self.play_sound('win')
+            # Could add a win screen transition here
+        else:
+            self.game.next_turn()
+
+    def is_computer_turn(self) -> bool:
+        """Whether the current player is a computer opponent."""
+        return isinstance(self.game.players[self.game.current_turn], ComputerPlayer)
+
+    def start_computer_turn(self) -> None:
+        """Start the current computer player's search; its move is played from update()."""
+        players = self.game.players
+        turn = self.game.current_turn
+        player = players[turn]
+        # What the player can see of the others, in turn order
+        opponents = [Opponent(len(other.tiles), other.initial_meld)
+                     for other in players[turn + 1:] + players[:turn]]
+        player.start_turn(self.board.get_sets(), opponents)
+        self.message_system.add_message(
+            f"{player.name} is thinking...",
+            color_name='highlight',
+            duration=player.time_budget
+        )
+        self.invalidate()
+
+    def play_computer_move(self, player: ComputerPlayer, move) -> None:
+        """
+        Carry out a computer player's move like a human turn: lay the tiles out,
+        validate, and draw instead if there is no move or it doesn't hold up.
+        
+        Args:
+            player (ComputerPlayer): The current player
+            move (Move): The move found by its search, or None to draw
+        """
+        self.invalidate()
+        if move is None:
+            self.draw_and_pass()
+            return
+        
+        for spec in move.played:
+            self.board.add_tile(player.remove_tile(spec.id))
+        melds = [[self.board.tiles[spec.id] for spec in meld] for meld in move.melds]
+        try:
+            self.board.arrange_melds(melds)
+        except ValueError:
+            self.board.reset_board()
+            self.draw_and_pass()
+            return
+        self.board.update_sets()
+        self.play_sound('tile_place')
+        
+        if self.game.validate_turn():
+            self.finish_valid_turn()
+        else:
+            self.board.reset_board()
+            self.draw_and_pass()
+
     def update(self):
-        """Update game screen components."""
+        """Update game screen components, playing a computer move once it is ready."""
         self.message_system.update()
+        
+        player = self.game.players[self.game.current_turn]
+        if isinstance(player, ComputerPlayer) and player.is_thinking() and player.search.done():
+            self.play_computer_move(player, player.finish_turn())
 
     def render(self):
-        """Render the game screen with all UI components."""
+        """
+        Repaint the parts of the game screen that changed since the last frame.
+        
+        A full redraw happens after invalidate() is called without a rect (screen
+        changes, button actions). Otherwise only the dirty regions are repainted
+        and pushed to the display, so an idle screen costs nothing to render.
+        """
+        # Messages fade every frame, so their old and new areas are always dirty
+        message_rects = self.message_system.get_rects(self.screen)
+        self.dirty_rects.extend(self.message_rects)
+        self.dirty_rects.extend(message_rects)
+        self.message_rects = message_rects
+        
+        # Rebuilding the background for a new turn or theme schedules a full redraw
+        self.get_background()
+        
+        if self.full_redraw:
+            self.draw_scene()
+            pygame.display.update()
+        elif self.dirty_rects:
+            dirty = [pygame.Rect(rect).clip(self.screen_rect) for rect in self.dirty_rects]
+            dirty = [rect for rect in dirty if rect.width and rect.height]
+            for rect in dirty:
+                self.draw_scene(rect)
+            pygame.display.update(dirty)
+        
+        self.full_redraw = False
+        self.dirty_rects = []
+
+    def get_background_key(self) -> tuple:
+        """State the background layer depends on."""
+        return (
+            self.game.current_turn,
+            self.game.players[self.game.current_turn].name,
+            len(self.game.deck),
+            ThemeManager.theme_version
+        )
+
+    def build_background(self) -> pygame.Surface:
+        """
+        Composite the static parts of the screen into one opaque surface.
+        
+        Returns:
+            pygame.Surface: Background, board overlay, header text and rack
+        """
+        background = pygame.Surface(self.screen_rect.size).convert()
+        
         # Clear screen with theme background
-        self.screen.fill(ThemeManager.get_color('background'))
+        background.fill(ThemeManager.get_color('background'))
         
         # Draw board area with semi-transparent overlay
-        self.screen.blit(self.board_area, (0, 0))
+        self.board_area.fill((*ThemeManager.get_color('board_area')[:3], 128))
+        background.blit(self.board_area, (0, 0))
         
         # Draw current player indicator
         current_player = self.game.players[self.game.current_turn]
@@ -268,7 +427,7 @@ class GameScreen:
             font_name='heading',
             color_name='highlight'
         )
-        self.screen.blit(player_text, (20, 20))
+        background.blit(player_text, (20, 20))
         
         # Draw deck info
         deck_text = ThemeManager.render_text(
@@ -276,48 +435,84 @@ class GameScreen:
             font_name='normal',
             color_name='text'
         )
-        self.screen.blit(deck_text, (20, 80))
-        
-        # Draw player rack and UI elements
-        self.screen.blit(self.player_rack_img, self.player_rack_rect)
-        
-        # Draw themed buttons in their new positions
-        ThemeManager.draw_button(
-            self.screen, 
-            self.draw_button_rect,
-            "Draw Tile",
-            color_name='button_success',
-            hover=self.draw_button_hover
-        )
+        background.blit(deck_text, (20, 80))
         
-        ThemeManager.draw_button(
-            self.screen, 
-            self.end_button_rect,
-            "End Turn",
-            color_name='button_danger',
-            hover=self.end_button_hover
-        )
+        # Draw player rack
+        background.blit(self.player_rack_img, self.player_rack_rect)
+        
+        return background
+
+    def get_background(self) -> pygame.Surface:
+        """Return the background layer, rebuilding it if its inputs changed."""
+        key = self.get_background_key()
+        if key != self.background_key:
+            if self.background_key is not None:
+                self.invalidate()
+            self.background = self.build_background()
+            self.background_key = key
+        return self.background
+
+    def draw_buttons(self, area: pygame.Rect = None) -> None:
+        """
+        Blit the pre-rendered button sprites for their current hover state.
+        
+        Buttons are kept out of the background layer so hovering one only
+        repaints that button instead of recompositing the whole layer.
         
-        # Draw the new Reset Tiles button
-        ThemeManager.draw_button(
-            self.screen, 
-            self.reset_button_rect,
-            "Reset Tiles",
-            color_name='button_info',  # Assuming 'button_info' exists in your theme
-            hover=self.reset_button_hover
+        Args:
+            area (pygame.Rect, optional): Only draw buttons overlapping this region.
+                Defaults to None, which draws every button.
+        """
+        buttons = (
+            (self.draw_button_rect, "Draw Tile", 'button_success', self.draw_button_hover),
+            (self.end_button_rect, "End Turn", 'button_danger', self.end_button_hover),
+            (self.reset_button_rect, "Reset Tiles", 'button_info', self.reset_button_hover),
         )
+        for rect, text, color_name, hover in buttons:
+            if area is None or area.colliderect(rect):
+                sprite = ThemeManager.get_button_sprite(rect.size, text, color_name, hover=hover)
+                self.screen.blit(sprite, rect)
+
+    def draw_scene(self, area: pygame.Rect = None) -> None:
+        """
+        Draw the game screen, optionally restricted to one region.
         
-        # Draw player tiles and board
-        self.draw_player_tiles()
-        self.board.draw(self.screen)
+        Args:
+            area (pygame.Rect, optional): Region to repaint. Defaults to None,
+                which repaints the whole screen.
+        """
+        background = self.get_background()
+        
+        if area is None:
+            self.screen.blit(background, (0, 0))
+            self.draw_buttons()
+            
+            # Draw player tiles and board
+            self.draw_player_tiles()
+            self.board.draw(self.screen)
+        else:
+            self.screen.set_clip(area)
+            self.screen.blit(background, area.topleft, area)
+            self.draw_buttons(area)
+            
+            rack_tiles = list(self.game.players[self.game.current_turn].tiles.values())
+            if self.is_computer_turn():
+                rack_tiles = []  # Hidden, as in draw_player_tiles()
+            for tile in rack_tiles + list(self.board.tiles.values()):
+                if area.colliderect(tile.draw_rect):
+                    tile.draw(self.screen)
         
         # Draw messages last (on top)
         self.message_system.draw(self.screen)
         
-        pygame.display.update()
-
+        if area is not None:
+            self.screen.set_clip(None)
 
     def draw_player_tiles(self) -> None:
+        """Draw the current player's rack, unless it belongs to a computer opponent."""
+        # A computer's rack is hidden from the people at the screen
+        if self.is_computer_turn():
+            return
         self.game.players[self.game.current_turn].draw(self.screen)
 
     def is_on_board(self, tile) -> None:
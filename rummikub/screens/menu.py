@@ -2,9 +2,16 @@ import os
 import pygame
 import pygame_menu
 from pygame_menu import themes, BaseImage
+from pygame_menu.widgets import TextInput
 import random
 from rummikub.player import Player
-from rummikub.deck import Deck
+from rummikub.ai import ComputerPlayer, LEVELS, get_strategy
+from rummikub.image_cache import ImageCache
+
+def text_input_focused(menu) -> bool:
+    """Whether a text input has focus; its cursor blinks without any new events."""
+    return isinstance(menu.get_selected_widget(), TextInput)
+
 
 class SetupMenu:
     """
@@ -15,6 +22,11 @@ class SetupMenu:
     def __init__(self, game, end_message=None):
         self.game = game
         self.current_page = "MAIN"  # Track which page we're viewing
+        self.dirty = True  # Redraw needed on the next frame
+        
+        # Computer opponents added after the named players
+        self.computer_count = 0
+        self.computer_level = 'Normal'
         
         # Define a custom theme with the game's color scheme
         custom_theme = themes.THEME_DARK.copy()
@@ -31,12 +43,13 @@ class SetupMenu:
             theme=custom_theme
         )
         
-        # Store references to different "pages" (menus)
-        self.menus = {
-            "MAIN": self.menu,
-            "RULES": self._create_rules_menu(),
-            "EXAMPLES": self._create_examples_menu(),
-            "SETUP": self._create_setup_menu()
+        # Store references to different "pages" (menus); the others are built on
+        # first visit so launching only pays for the main menu
+        self.menus = {"MAIN": self.menu}
+        self.page_builders = {
+            "RULES": self._create_rules_menu,
+            "EXAMPLES": self._create_examples_menu,
+            "SETUP": self._create_setup_menu
         }
         
         # Initialize the main menu
@@ -45,7 +58,7 @@ class SetupMenu:
         # Set initial menu based on context
         if end_message:
             self.current_page = "SETUP"
-            self.menu = self.menus["SETUP"]
+            self.menu = self.get_page("SETUP")
 
     def _setup_main_menu(self, end_message=None):
         """Set up the main menu with banner and navigation buttons."""
@@ -171,7 +184,7 @@ class SetupMenu:
         setup_menu.add.label("Player Setup", font_size=45, font_color=(255, 215, 0))
         setup_menu.add.vertical_margin(20)
         
-        setup_menu.add.label("Enter 2-4 player names, separated by commas:", font_size=36)
+        setup_menu.add.label("Enter player names, separated by commas (2-4 players including computers):", font_size=36)
         self.name_input = setup_menu.add.text_input(
             title='',
             default="Connor, Elsa",
@@ -182,6 +195,23 @@ class SetupMenu:
             font_size=36
         )
         
+        setup_menu.add.vertical_margin(20)
+        setup_menu.add.selector(
+            "Computer opponents: ",
+            [(str(count), count) for count in range(4)],
+            default=self.computer_count,
+            onchange=self._set_computer_count,
+            font_size=36
+        )
+        levels = list(LEVELS)
+        setup_menu.add.selector(
+            "Computer level: ",
+            [(level, level) for level in levels],
+            default=levels.index(self.computer_level),
+            onchange=self._set_computer_level,
+            font_size=36
+        )
+        
         setup_menu.add.vertical_margin(30)
         setup_menu.add.button("Start Game", self.submit_names, font_size=45, background_color=(40, 150, 40))
         setup_menu.add.vertical_margin(10)
@@ -197,50 +227,72 @@ class SetupMenu:
         total_width = (tile_width + 10) * len(tile_filenames)
         surface = pygame.Surface((total_width, tile_height), pygame.SRCALPHA)
         
-        # Add tiles to the surface
+        # Add tiles to the surface, sharing scaled images through the image cache
         for i, filename in enumerate(tile_filenames):
             tile_path = os.path.join("./rummikub/assets/tiles_2/", filename)
             if os.path.exists(tile_path):
-                image = pygame.image.load(tile_path)
-                scaled_image = pygame.transform.scale(image, (tile_width, tile_height))
+                scaled_image = ImageCache.load(tile_path, (tile_width, tile_height))
                 surface.blit(scaled_image, (i * (tile_width + 10), 0))
         
-        # Save the surface as a temporary image
-        temp_file = "./rummikub/assets/tiles_2/temp_row.png"
-        pygame.image.save(surface, temp_file)
+        # Hand the composited row to the menu directly, no temporary image file
+        menu.add.surface(surface)
+
+    def get_page(self, name):
+        """
+        Get a menu page, building it on first use.
         
-        # Add the image to the menu
-        tile_row = BaseImage(temp_file)
-        menu.add.image(tile_row)
+        Args:
+            name (str): Page name, one of "MAIN", "RULES", "EXAMPLES" or "SETUP"
+            
+        Returns:
+            pygame_menu.Menu: The page
+        """
+        if name not in self.menus:
+            self.menus[name] = self.page_builders[name]()
+        return self.menus[name]
 
     def _show_main(self):
         """Show the main menu."""
         self.current_page = "MAIN"
-        self.menu = self.menus["MAIN"]
+        self.menu = self.get_page("MAIN")
 
     def _show_rules(self):
         """Show the rules page."""
         self.current_page = "RULES"
-        self.menu = self.menus["RULES"]
+        self.menu = self.get_page("RULES")
 
     def _show_examples(self):
         """Show the examples page."""
         self.current_page = "EXAMPLES"
-        self.menu = self.menus["EXAMPLES"]
+        self.menu = self.get_page("EXAMPLES")
 
     def _show_setup(self):
         """Show the setup page."""
         self.current_page = "SETUP"
-        self.menu = self.menus["SETUP"]
+        self.menu = self.get_page("SETUP")
+
+    def _set_computer_count(self, selected, count):
+        """Selector callback for the number of computer opponents."""
+        self.computer_count = count
+
+    def _set_computer_level(self, selected, level):
+        """Selector callback for the computer opponents' level, a key of LEVELS."""
+        self.computer_level = level
 
     def submit_names(self):
         """Process submitted player names and start the game."""
         names = [name.strip() for name in self.name_input.get_value().split(",") if name.strip()]
         
-        if 2 <= len(names) <= 4:
-            # Reset the game state
-            self.game.deck = Deck("./rummikub/assets/tiles_2")
+        if 2 <= len(names) + self.computer_count <= 4:
+            # Reset the game state, reshuffling the tiles already loaded
+            self.game.deck.reset()
+            self.game.clear_table()
             self.game.players = [Player(self.game, name) for name in names]
+            strategy, time_budget, options = LEVELS[self.computer_level]
+            self.game.players += [
+                ComputerPlayer(self.game, f"Computer {number}", get_strategy(strategy, **options), time_budget)
+                for number in range(1, self.computer_count + 1)
+            ]
             self.game.current_turn = 0
             self.game.game_over = False
             self.game.winner = None
@@ -257,12 +309,12 @@ class SetupMenu:
             self.game.populate_rack()
             self.game.save_positions()
             
-            # Transition to the first player's turn menu
+            # Transition to the first player's turn
             turn_message = f"{self.game.players[self.game.current_turn].name}"
-            self.game.change_screen(TurnMenu(self.game, turn_message))
+            self.game.begin_turn(turn_message)
         else:
             # Add error message to setup menu
-            self.menus["SETUP"].add.label(
+            self.get_page("SETUP").add.label(
                 "Please enter 2 to 4 player names, separated by commas.",
                 font_color=(255, 100, 100),
                 font_size=36
@@ -270,7 +322,8 @@ class SetupMenu:
 
     def handle_events(self, events):
         """Handle menu events."""
-        self.menu.update(events)
+        if self.menu.update(events) or events:
+            self.dirty = True
 
     def update(self):
         pass
@@ -278,6 +331,8 @@ class SetupMenu:
     def draw(self, surface):
         """Draw the current menu."""
         self.menu.draw(surface)
+        # Keep redrawing while the cursor of a focused text input blinks
+        self.dirty = text_input_focused(self.menu)
 
 
 class TurnMenu:
@@ -287,6 +342,7 @@ class TurnMenu:
         self.game = game
         self.turn_message = turn_message
         self.stats_message = stats_message
+        self.dirty = True  # Redraw needed on the next frame
 
         # Create a simpler theme
         custom_theme = themes.THEME_DARK.copy()
@@ -398,7 +454,8 @@ class TurnMenu:
         self.game.change_screen(self.game.game_screen)
 
     def handle_events(self, events):
-        self.menu.update(events)
+        if self.menu.update(events) or events:
+            self.dirty = True
 
     def update(self):
         pass
@@ -417,4 +474,5 @@ class TurnMenu:
         )
         
         # Draw the menu
-        self.menu.draw(surface)
\ No newline at end of file
+        self.menu.draw(surface)
+        self.dirty = text_input_focused(self.menu)
\ No newline at end of file
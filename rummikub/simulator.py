@@ -0,0 +1,327 @@
+"""
+Headless game simulation for tuning rules and computer strategies.
+
+Games are played on TileSpecs with the rules package and the computer
+strategies: no window, no menus and no image assets, so thousands of games
+can be spread over worker processes. Usage:
+
+    python -m rummikub.simulator --games 1000 --strategies solver greedy
+"""
+import argparse
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from rummikub import rules
+from rummikub.ai.strategy import Move, Opponent, Strategy, get_strategy, run_search
+from rummikub.player import Player
+from rummikub.tile_deck import TileDeck
+
+
+class GameResult(NamedTuple):
+    """
+    Outcome of one simulated game.
+
+    Attributes:
+        seed (int): Seed the game was dealt from
+        winner (int): Seat of the winner, or None if the game hit the turn limit or tied
+        turns (int): Turns played
+        tiles_drawn (int): Tiles drawn after the deal
+        rack_points (Tuple[int, ...]): Points left on each seat's rack
+    """
+    seed: int
+    winner: Optional[int]
+    turns: int
+    tiles_drawn: int
+    rack_points: Tuple[int, ...]
+
+
+class SimulationReport(NamedTuple):
+    """
+    Aggregated results of many games.
+
+    Attributes:
+        games (int): Games played
+        wins (Tuple[int, ...]): Games won by each seat
+        unfinished (int): Games without a winner
+        turns (int): Turns played over all games
+        tiles_drawn (int): Tiles drawn over all games
+        elapsed (float): Wall-clock seconds for the whole run
+    """
+    games: int
+    wins: Tuple[int, ...]
+    unfinished: int
+    turns: int
+    tiles_drawn: int
+    elapsed: float = 0.0
+
+    @classmethod
+    def from_results(cls, results: Iterable[GameResult], seats: int) -> "SimulationReport":
+        """Aggregate individual game results."""
+        wins = [0] * seats
+        games = unfinished = turns = tiles_drawn = 0
+        for result in results:
+            games += 1
+            turns += result.turns
+            tiles_drawn += result.tiles_drawn
+            if result.winner is None:
+                unfinished += 1
+            else:
+                wins[result.winner] += 1
+        return cls(games, tuple(wins), unfinished, turns, tiles_drawn)
+
+    def merge(self, other: "SimulationReport") -> "SimulationReport":
+        """Combine the counts of two reports; elapsed time is the longer of the two."""
+        return SimulationReport(
+            self.games + other.games,
+            tuple(a + b for a, b in zip(self.wins, other.wins)),
+            self.unfinished + other.unfinished,
+            self.turns + other.turns,
+            self.tiles_drawn + other.tiles_drawn,
+            max(self.elapsed, other.elapsed),
+        )
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        return self.turns / self.games if self.games else 0.0
+
+
+class _Table:
+    """The bits of Game a Player needs: just the deck it draws from."""
+
+    def __init__(self, deck: TileDeck):
+        self.deck = deck
+
+
+class Simulator:
+    """
+    Plays complete games between computer strategies without any display.
+
+    Each game is dealt from its own seed, so a run is reproducible no matter
+    how its games are split over worker processes.
+
+    Attributes:
+        strategies (Tuple[str, ...]): Strategy name for each seat
+        max_turns (int): Turns after which a game is abandoned
+        time_budget (float): Seconds each move search may take, or None for no limit
+        mcts_workers (int): Worker processes per 'mcts' seat for root-parallel search
+    """
+
+    MAX_TURNS = 500
+
+    def __init__(self, strategies: Sequence[str] = ('solver', 'solver'), max_turns: int = MAX_TURNS,
+                 time_budget: Optional[float] = None, mcts_workers: int = 1):
+        """
+        Set up a simulator.
+
+        Args:
+            strategies (Sequence[str], optional): Strategy names (keys of STRATEGIES), one per seat.
+                Defaults to two solver players.
+            max_turns (int, optional): Turn limit per game. Defaults to MAX_TURNS.
+            time_budget (float, optional): Seconds per move search. Defaults to None (no limit).
+            mcts_workers (int, optional): Worker processes per 'mcts' seat. Defaults to 1 (in-process).
+
+        Raises:
+            ValueError: If there aren't 2 to 4 seats or a strategy is unknown
+        """
+        if not 2 <= len(strategies) <= 4:
+            raise ValueError("Simulations need 2 to 4 players")
+        for name in strategies:
+            get_strategy(name)
+        # Names rather than instances, so the simulator pickles cheaply into workers
+        self.strategies = tuple(strategies)
+        self.max_turns = max_turns
+        self.time_budget = time_budget
+        self.mcts_workers = mcts_workers
+        self._deck: Optional[TileDeck] = None
+        self._seat_strategies: Optional[List[Strategy]] = None
+
+    def __getstate__(self):
+        # Each worker process builds its own strategies and deck
+        return dict(self.__dict__, _seat_strategies=None, _deck=None)
+
+    def strategy_options(self, name: str) -> dict:
+        """Constructor options for the strategy named ``name``."""
+        return {'workers': self.mcts_workers} if name == 'mcts' else {}
+
+    def get_strategies(self) -> List[Strategy]:
+        """One strategy per seat, built on first use and kept for later games."""
+        if self._seat_strategies is None:
+            self._seat_strategies = [get_strategy(name, **self.strategy_options(name)) for name in self.strategies]
+        return self._seat_strategies
+
+    def deal(self, seed: int) -> TileDeck:
+        """
+        Reshuffle the headless deck for a game dealt from ``seed``.
+
+        Args:
+            seed (int): Seed for this game
+
+        Returns:
+            TileDeck: A deck whose order depends only on the seed
+        """
+        # One deck per simulator (so per worker process), reshuffled for every game
+        if self._deck is None:
+            self._deck = TileDeck()
+        self._deck.reset(seed)
+        return self._deck
+
+    def find_move(self, strategy, table_sets: List[List[rules.TileSpec]], player: Player,
+                  opponents: Sequence[Opponent] = ()) -> Optional[Move]:
+        """Run a strategy's search, keeping its best move if it runs out of time."""
+        deadline = time.monotonic() + self.time_budget if self.time_budget else None
+        best = run_search(strategy, table_sets, list(player.tiles.values()), player.initial_meld,
+                          deadline, opponents)
+        # Same check as the game screen: a move that breaks a set isn't played
+        if best is not None and not rules.validate_sets(best.melds):
+            return None
+        return best
+
+    def play(self, seed: int) -> GameResult:
+        """
+        Play one game to the end.
+
+        A game ends when a player empties their rack. Once the deck is empty and
+        every player passes in a row, the lowest rack wins, as in the table rules.
+
+        Args:
+            seed (int): Seed to deal from
+
+        Returns:
+            GameResult: How the game went
+        """
+        table = _Table(self.deal(seed))
+        players = [Player(table, f"Seat {seat + 1}") for seat in range(len(self.strategies))]
+        strategies = self.get_strategies()
+        table_sets: List[List[rules.TileSpec]] = []
+        turns = tiles_drawn = passes = 0
+        seat = 0
+        winner = None
+
+        while turns < self.max_turns:
+            player = players[seat]
+            opponents = [Opponent(len(other.tiles), other.initial_meld)
+                         for other in players[seat + 1:] + players[:seat]]
+            move = self.find_move(strategies[seat], table_sets, player, opponents)
+            turns += 1
+            if move is not None:
+                table_sets = move.melds
+                for tile in move.played:
+                    player.remove_tile(tile.id)
+                player.initial_meld = True
+                passes = 0
+                if not player.tiles:
+                    winner = seat
+                    break
+            elif len(table.deck):
+                player.draw_tile()
+                tiles_drawn += 1
+                passes = 0
+            else:
+                passes += 1
+                if passes == len(players):
+                    winner = self._lowest_rack(players)
+                    break
+            seat = (seat + 1) % len(players)
+
+        return GameResult(seed, winner, turns, tiles_drawn, self._rack_points(players))
+
+    @staticmethod
+    def _rack_points(players: List[Player]) -> Tuple[int, ...]:
+        return tuple(sum(tile.number for tile in player.tiles.values()) for player in players)
+
+    @classmethod
+    def _lowest_rack(cls, players: List[Player]) -> Optional[int]:
+        """Seat with the fewest points left, or None on a tie."""
+        points = cls._rack_points(players)
+        lowest = min(points)
+        return points.index(lowest) if points.count(lowest) == 1 else None
+
+    def play_many(self, seeds: Iterable[int]) -> SimulationReport:
+        """
+        Play a chunk of games in this process.
+
+        Args:
+            seeds: Seed of each game
+
+        Returns:
+            SimulationReport: Aggregated results of the chunk (elapsed is 0)
+        """
+        return SimulationReport.from_results((self.play(seed) for seed in seeds), len(self.strategies))
+
+    def run(self, games: int, seed: int = 0, workers: Optional[int] = None,
+            chunk_size: Optional[int] = None) -> SimulationReport:
+        """
+        Play many games, spread over a process pool.
+
+        Workers play chunks of consecutive seeds and send back one aggregated
+        report per chunk rather than a result per game.
+
+        Args:
+            games (int): Number of games
+            seed (int, optional): Seed of the first game; game ``i`` uses ``seed + i``. Defaults to 0.
+            workers (int, optional): Worker processes (1 plays in this process). Defaults to one per CPU.
+            chunk_size (int, optional): Games per chunk. Defaults to about four chunks per worker.
+
+        Returns:
+            SimulationReport: Aggregated results, including the wall-clock time
+        """
+        workers = workers or os.cpu_count() or 1
+        chunk_size = chunk_size or max(1, math.ceil(games / (workers * 4)))
+        seeds = range(seed, seed + games)
+        chunks = [seeds[start:start + chunk_size] for start in range(0, games, chunk_size)]
+
+        start = time.perf_counter()
+        report = SimulationReport(0, (0,) * len(self.strategies), 0, 0, 0)
+        if workers == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                report = report.merge(self.play_many(chunk))
+        else:
+            # Spawned, so workers never inherit this process's shared search pool
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+                for partial in pool.map(self.play_many, chunks):
+                    report = report.merge(partial)
+        return report._replace(elapsed=time.perf_counter() - start)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Play Rummikub games between computer strategies.")
+    parser.add_argument("--games", type=int, default=100, help="games to play (default: %(default)s)")
+    parser.add_argument("--strategies", nargs="+", default=["solver", "solver"],
+                        help="strategy for each seat, 2 to 4 of them (default: solver solver)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game (default: %(default)s)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="games per worker task")
+    parser.add_argument("--max-turns", type=int, default=Simulator.MAX_TURNS,
+                        help="turns before a game is abandoned (default: %(default)s)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="seconds per move search (default: no limit)")
+    parser.add_argument("--mcts-workers", type=int, default=1,
+                        help="search processes per mcts seat, on top of --jobs (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    simulator = Simulator(args.strategies, max_turns=args.max_turns, time_budget=args.time_budget,
+                          mcts_workers=args.mcts_workers)
+    report = simulator.run(args.games, seed=args.seed, workers=args.jobs, chunk_size=args.chunk_size)
+
+    print(f"{report.games} games in {report.elapsed:.1f}s ({report.games_per_second:.1f} games/s)")
+    for seat, (name, wins) in enumerate(zip(simulator.strategies, report.wins)):
+        print(f"  Seat {seat + 1} ({name}): {wins} wins ({wins / max(report.games, 1):.1%})")
+    print(f"  Unfinished or tied: {report.unfinished}")
+    print(f"  Mean turns: {report.mean_turns:.1f}, tiles drawn: {report.tiles_drawn}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import pygame
+from collections import OrderedDict
 from typing import Dict, Tuple, Optional
 
 class ThemeManager:
@@ -34,11 +35,27 @@ class ThemeManager:
     # Cached font objects
     _font_cache: Dict[str, pygame.font.Font] = {}
     
+    # Rendered text surfaces, least recently used first: {(text, font, color): surface}
+    TEXT_CACHE_SIZE = 256
+    _text_cache: "OrderedDict[Tuple[str, str, Tuple[int, ...]], pygame.Surface]" = OrderedDict()
+    text_cache_hits = 0
+    text_cache_misses = 0
+    
+    # Pre-rendered buttons: {(text, size, background, border, text color): surface}
+    _button_cache: Dict[Tuple, pygame.Surface] = {}
+    
+    # Part of the key of pre-rendered layers; the palette is fixed for now,
+    # so anything that changes it at runtime must bump this
+    theme_version = 0
+    
     @classmethod
     def initialize(cls):
         """Initialize pygame font module and create cached fonts."""
         pygame.font.init()
         
+        # Surfaces rendered with the old fonts are stale
+        cls.clear_text_cache()
+        
         # Generate font cache
         for font_name, font_config in cls.FONTS.items():
             cls._font_cache[font_name] = pygame.font.SysFont(
@@ -61,25 +78,70 @@ class ThemeManager:
     
     @classmethod
     def render_text(cls, text: str, font_name: str = 'normal', color_name: str = 'text') -> pygame.Surface:
-        """Render text with specified font and color."""
-        font = cls.get_font(font_name)
+        """
+        Render text with specified font and color, reusing earlier renders.
+        
+        The returned surface is shared with other callers and must not be modified.
+        """
         color = cls.get_color(color_name)
-        return font.render(text, True, color)
+        key = (text, font_name, color)
+        
+        surface = cls._text_cache.get(key)
+        if surface is not None:
+            cls._text_cache.move_to_end(key)
+            cls.text_cache_hits += 1
+            return surface
+        
+        cls.text_cache_misses += 1
+        surface = cls.get_font(font_name).render(text, True, color)
+        cls._text_cache[key] = surface
+        if len(cls._text_cache) > cls.TEXT_CACHE_SIZE:
+            cls._text_cache.popitem(last=False)
+        return surface
+    
+    @classmethod
+    def clear_text_cache(cls) -> None:
+        """Drop all cached text surfaces and reset the hit/miss counters."""
+        cls._text_cache.clear()
+        cls.text_cache_hits = 0
+        cls.text_cache_misses = 0
+    
+    @classmethod
+    def get_button_sprite(cls, size: Tuple[int, int], text: str, color_name: str = 'button',
+                          text_color: str = 'button_text', hover: bool = False) -> pygame.Surface:
+        """Get a themed button surface, rendering it on first use."""
+        bg_color = cls.get_color('button_hover' if hover else color_name)
+        border_color = cls.get_color('highlight' if hover else 'tile_border')
+        key = (text, tuple(size), bg_color, border_color, cls.get_color(text_color))
+        
+        sprite = cls._button_cache.get(key)
+        if sprite is None:
+            sprite = pygame.Surface(size, pygame.SRCALPHA)
+            button_rect = sprite.get_rect()
+            
+            # Draw button background
+            pygame.draw.rect(sprite, bg_color, button_rect, border_radius=10)
+            
+            # Draw button border
+            pygame.draw.rect(sprite, border_color, button_rect, width=2, border_radius=10)
+            
+            # Draw button text
+            text_surf = cls.render_text(text, 'button', text_color)
+            text_rect = text_surf.get_rect(center=button_rect.center)
+            sprite.blit(text_surf, text_rect)
+            
+            cls._button_cache[key] = sprite
+        return sprite
     
     @classmethod
     def draw_button(cls, surface: pygame.Surface, rect: pygame.Rect, text: str, 
                    color_name: str = 'button', text_color: str = 'button_text',
                    hover: bool = False) -> None:
         """Draw a themed button on the given surface."""
-        # Draw button background
-        bg_color = cls.get_color('button_hover' if hover else color_name)
-        pygame.draw.rect(surface, bg_color, rect, border_radius=10)
-        
-        # Draw button border
-        border_color = cls.get_color('highlight' if hover else 'tile_border')
-        pygame.draw.rect(surface, border_color, rect, width=2, border_radius=10)
-        
-        # Draw button text
-        text_surf = cls.render_text(text, 'button', text_color)
-        text_rect = text_surf.get_rect(center=rect.center)
-        surface.blit(text_surf, text_rect)
\ No newline at end of file
+        sprite = cls.get_button_sprite(rect.size, text, color_name, text_color, hover)
+        surface.blit(sprite, rect)
+    
+    @classmethod
+    def clear_button_cache(cls) -> None:
+        """Drop all pre-rendered button surfaces."""
+        cls._button_cache.clear()
@@ -2,17 +2,23 @@
 from typing import Type, Tuple, List, Optional
 import pygame
 from rummikub.theme_manager import ThemeManager
+from rummikub.image_cache import ImageCache
+from rummikub.rules import TileSpec
 
 class Tile:
     """
     Represents a tile in the Rummikub game.
     
-    Each tile has a numeric value, color, and image representation.
-    Tiles can be dragged, dropped, and highlighted based on game state.
+    A Tile is a lightweight, slotted view over an immutable TileSpec: the spec
+    holds the tile's identity, while the view adds position, drag and highlight
+    state and a reference to its shared sprite. Game-state code that doesn't
+    draw (rules, solvers, simulations) can keep just the specs.
     
     Attributes:
+        spec (TileSpec): Immutable id, printed number, color and joker flag
         id (int): Unique identifier for the tile
-        number (int): Numeric value of the tile (1-13)
+        number (int): Numeric value of the tile (1-13); jokers take the value
+            they stand for in a set
         color (str): Color of the tile ('red', 'blue', 'black', 'orange')
         is_joker (bool): Whether this tile is a joker
         image (pygame.Surface): Visual representation of the tile
@@ -25,6 +31,13 @@ class Tile:
     # Default tile dimensions
     DEFAULT_WIDTH = 130
     DEFAULT_HEIGHT = 200
+    DRAG_SCALE = 1.1  # Tiles grow 10% while dragged
+
+    __slots__ = (
+        'spec', 'number', 'in_set', 'image_path', 'width', 'height', 'image', 'rect',
+        'turn_start_pos', 'pre_drag_pos', 'dragging', 'drag_offset',
+        'highlight', 'highlight_color', 'scale_factor'
+    )
 
     def __init__(self, id: int, number: int, color: Type[str], image_path: Type[str], is_joker: bool = False,
                  width: int = None, height: int = None):
@@ -40,14 +53,12 @@ class Tile:
             width (int, optional): Custom width for the tile. Defaults to DEFAULT_WIDTH.
             height (int, optional): Custom height for the tile. Defaults to DEFAULT_HEIGHT.
         """
-        self.id = id
-        self.number = number
-        self.color = color
-        self.is_joker = is_joker
+        self.spec = TileSpec(id, number, color, is_joker)
+        self.number = number  # Jokers take the value they stand for
         self.in_set = False  # Track if the joker is currently in a set
         
-        # Load the original image
-        self.original_image = pygame.image.load(image_path)
+        # Sprites are shared with every tile using the same file
+        self.image_path = image_path
         
         # Set dimensions (use defaults if not specified)
         self.width = width if width is not None else self.DEFAULT_WIDTH
@@ -68,6 +79,40 @@ class Tile:
         self.highlight_color = None
         self.scale_factor = 1.0  # For hover/drag animation
 
+    @classmethod
+    def from_spec(cls, spec: TileSpec, image_path: Type[str], width: int = None, height: int = None) -> "Tile":
+        """
+        Create a drawable view for a tile spec.
+        
+        Args:
+            spec (TileSpec): The tile to show
+            image_path (str): Path to the tile's image file
+            width (int, optional): Custom width for the tile. Defaults to DEFAULT_WIDTH.
+            height (int, optional): Custom height for the tile. Defaults to DEFAULT_HEIGHT.
+            
+        Returns:
+            Tile: The new tile view
+        """
+        return cls(spec.id, spec.number, spec.color, image_path, is_joker=spec.is_joker,
+                   width=width, height=height)
+
+    @property
+    def id(self) -> int:
+        return self.spec.id
+
+    @property
+    def color(self) -> Type[str]:
+        return self.spec.color
+
+    @property
+    def is_joker(self) -> bool:
+        return self.spec.is_joker
+
+    @property
+    def original_image(self) -> pygame.Surface:
+        """The unscaled sprite, shared through ImageCache."""
+        return ImageCache.load(self.image_path)
+
     def resize_image(self, width: int, height: int) -> pygame.Surface:
         """
         Resize the tile image to the specified dimensions.
@@ -77,9 +122,9 @@ class Tile:
             height (int): Target height
             
         Returns:
-            pygame.Surface: The resized image
+            pygame.Surface: The resized image (shared through ImageCache)
         """
-        return pygame.transform.smoothscale(self.original_image, (width, height))
+        return ImageCache.load(self.image_path, (width, height))
 
     def set_size(self, width: int, height: int) -> None:
         """
@@ -114,6 +159,21 @@ class Tile:
         self.highlight = highlight
         self.highlight_color = color_name
 
+    @property
+    def draw_rect(self) -> pygame.Rect:
+        """Screen area covered by the tile, including the enlarged sprite while dragging."""
+        if not self.dragging:
+            return self.rect
+        
+        scaled_width = int(self.width * self.DRAG_SCALE)
+        scaled_height = int(self.height * self.DRAG_SCALE)
+        
+        # Grow around the tile so it keeps the same position
+        offset_x = (scaled_width - self.rect.width) // 2
+        offset_y = (scaled_height - self.rect.height) // 2
+        return pygame.Rect(self.rect.x - offset_x, self.rect.y - offset_y,
+                           scaled_width, scaled_height)
+
     def draw(self, screen): 
         """
         Draw the tile with highlight effects if active.
@@ -121,33 +181,23 @@ class Tile:
         Args:
             screen: The pygame surface to draw on
         """
-        # Scale the image if dragging
+        draw_rect = self.draw_rect
         current_image = self.image
         
         if self.dragging:
-            # Create a larger version while dragging
-            scale = 1.1  # 10% larger
-            scaled_width = int(self.width * scale)
-            scaled_height = int(self.height * scale)
-            current_image = self.resize_image(scaled_width, scaled_height)
-            
-            # Adjust rect to maintain the same position
-            offset_x = (scaled_width - self.rect.width) // 2
-            offset_y = (scaled_height - self.rect.height) // 2
-            draw_rect = pygame.Rect(self.rect.x - offset_x, self.rect.y - offset_y, 
-                                    scaled_width, scaled_height)
-        else:
-            draw_rect = self.rect
+            # Use the larger version while dragging (scaled once per image by ImageCache)
+            current_image = self.resize_image(draw_rect.width, draw_rect.height)
+        
+        # Swap in the pre-tinted sprite if highlighted
+        if self.highlight and self.highlight_color:
+            current_image = ImageCache.tinted(
+                self.image_path,
+                (draw_rect.width, draw_rect.height),
+                ThemeManager.get_color(self.highlight_color)
+            )
             
         # Draw the tile image
         screen.blit(current_image, draw_rect)
-        
-        # Draw highlight if active
-        if self.highlight and self.highlight_color:
-            highlight_surface = pygame.Surface((draw_rect.width, draw_rect.height), pygame.SRCALPHA)
-            highlight_color = ThemeManager.get_color(self.highlight_color)
-            highlight_surface.fill(highlight_color)
-            screen.blit(highlight_surface, draw_rect)
 
     def get_id(self) -> int:
         return self.id
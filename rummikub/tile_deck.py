@@ -0,0 +1,81 @@
+"""
+A shuffled pile of tiles that knows nothing about images or pygame.
+
+Deck builds on it for the game's image-backed tiles; headless code such as
+the simulator uses it directly with the standard set as TileSpecs.
+"""
+import random
+from typing import List, Optional, Tuple, Union
+
+from rummikub.rules import TileSpec
+from rummikub.rules.encoding import COLORS
+
+
+class TileDeck:
+
+    def __init__(self, seed: Union[int, random.Random, None] = None):
+        """
+        Build and shuffle the standard 106-tile set as TileSpecs.
+
+        Args:
+            seed (int or random.Random, optional): Seed or generator for shuffling.
+                Defaults to None, which uses the global ``random`` module.
+        """
+        self.rng = self._make_rng(seed)
+        # Every tile in id order, so reset() can rebuild the deck without loading anything
+        self.all_tiles: List = self._initialize_tiles()
+        self.tiles: List = self._shuffle(list(self.all_tiles))
+
+    @staticmethod
+    def _make_rng(seed: Union[int, random.Random, None]) -> Optional[random.Random]:
+        if seed is None or isinstance(seed, random.Random):
+            return seed
+        return random.Random(seed)
+
+    def reset(self, seed: Union[int, random.Random, None] = None) -> None:
+        """
+        Put every tile back in the deck and reshuffle it for a new game.
+
+        The tiles already built are reused, so this is O(n) and never touches
+        the disk. The same seed always gives the same order.
+
+        Args:
+            seed (int or random.Random, optional): New seed or generator. Defaults to None,
+                which keeps shuffling with the current one.
+        """
+        if seed is not None:
+            self.rng = self._make_rng(seed)
+        for tile in self.all_tiles:
+            if tile.is_joker and hasattr(tile, 'reset_joker'):
+                tile.reset_joker()
+        self.tiles[:] = self.all_tiles
+        self._shuffle(self.tiles)
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    @staticmethod
+    def _standard_tiles() -> List[Tuple[int, int, str, None, bool]]:
+        """Tile data for two copies of 1-13 in each color plus two jokers, without images."""
+        tile_data = []
+        for color in COLORS:
+            for number in range(1, 14):
+                for _ in range(2):
+                    tile_data.append((len(tile_data), number, color, None, False))
+        tile_data += [(len(tile_data) + i, 0, "joker", None, True) for i in range(2)]
+        return tile_data
+
+    def _initialize_tiles(self) -> List:
+        return [TileSpec(tile_id, number, color, is_joker)
+                for tile_id, number, color, _, is_joker in self._standard_tiles()]
+
+    def _shuffle(self, tiles: List) -> List:
+        """Shuffles the deck of tiles in place, with the deck's generator if it has one."""
+        if self.rng is not None:
+            self.rng.shuffle(tiles)
+        else:
+            random.shuffle(tiles)
+        return tiles
+
+    def pick_tile(self):
+        return self.tiles.pop()
@@ -1,158 +1,322 @@
-
+import math
 import numpy as np
-import pygame
-from typing import Dict, Tuple, List
-from rummikub.tile import Tile
-
+from typing import Dict, Tuple, List, Set
 
-import numpy as np
-
-import numpy as np
 
 class Graph:
-    """Optimized adjacency matrix representation of the playing board,
+    """Spatial hash representation of the playing board,
        that works with an external dictionary of board tiles.
+
+       Tiles are bucketed into a uniform grid whose cell size matches the snap
+       threshold, so adding, moving or removing a tile and querying its
+       neighbours only touches the surrounding cells instead of every tile.
+
+       Connected components (tiles chained together within link_distance) are
+       maintained incrementally: adding a tile merges the components it touches
+       and removing one only re-partitions the component it belonged to.
     """
-    def __init__(self, max_size: int):
+    def __init__(self, max_size: int, cell_size: float = 200, link_distance: float = None):
         self.size = max_size
-        # Distance matrix: initialize with infinity, diagonal set to 0.
-        self.matrix = np.full((self.size, self.size), np.inf)
-        np.fill_diagonal(self.matrix, 0)
+        self.cell_size = cell_size
+        self.link_distance = link_distance if link_distance is not None else cell_size
         # Vertex data: Each row holds [x, y, tile_id]. Uninitialized rows are [-1, -1, -1].
         self.vertex_data = np.full((self.size, 3), -1, dtype=int)
-    
+        # Grid buckets: {(cell_x, cell_y): {tile_id, ...}}
+        self.grid: Dict[Tuple[int, int], Set[int]] = {}
+        # Reverse index of the bucket holding each active tile: {tile_id: (cell_x, cell_y)}
+        self.cells: Dict[int, Tuple[int, int]] = {}
+        # Connected components: {label: {tile_id, ...}} and {tile_id: label}
+        self.components: Dict[int, Set[int]] = {}
+        self.component_of: Dict[int, int] = {}
+        self._next_label = 0
+
+    def _cell_for(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def _ensure_capacity(self, tile_id: int) -> None:
+        """Grow the vertex table so custom tile sets can use ids beyond max_size."""
+        if tile_id >= self.size:
+            new_size = max(tile_id + 1, self.size * 2)
+            grown = np.full((new_size, 3), -1, dtype=int)
+            grown[:self.size] = self.vertex_data
+            self.vertex_data = grown
+            self.size = new_size
+
+    def _insert(self, tid: int, x: int, y: int) -> None:
+        self._ensure_capacity(tid)
+        self.vertex_data[tid] = [x, y, tid]
+        cell = self._cell_for(x, y)
+        self.grid.setdefault(cell, set()).add(tid)
+        self.cells[tid] = cell
+        self._link(tid)
+
+    def _discard(self, tid: int) -> None:
+        cell = self.cells.pop(tid, None)
+        if cell is None:
+            return
+        bucket = self.grid[cell]
+        bucket.discard(tid)
+        if not bucket:
+            del self.grid[cell]
+        self._unlink(tid)
+
+    def _new_component(self, members: Set[int]) -> None:
+        label = self._next_label
+        self._next_label += 1
+        self.components[label] = members
+        for tid in members:
+            self.component_of[tid] = label
+
+    def _link(self, tid: int) -> None:
+        """Attach a newly placed tile, merging every component it now touches."""
+        labels = {self.component_of[other] for other, _ in self.get_neighbors(tid, self.link_distance)}
+        if not labels:
+            self._new_component({tid})
+            return
+        # Merge smaller components into the largest one
+        target = max(labels, key=lambda label: len(self.components[label]))
+        members = self.components[target]
+        for label in labels - {target}:
+            for other in self.components.pop(label):
+                self.component_of[other] = target
+                members.add(other)
+        members.add(tid)
+        self.component_of[tid] = target
+
+    def _unlink(self, tid: int) -> None:
+        """Detach a tile that left the grid, splitting its component if needed."""
+        label = self.component_of.pop(tid, None)
+        if label is None:
+            return
+        remaining = self.components.pop(label)
+        remaining.discard(tid)
+        # Re-partition only the old component with a breadth-first search
+        while remaining:
+            start = remaining.pop()
+            members = {start}
+            frontier = [start]
+            while frontier:
+                current = frontier.pop()
+                for other, _ in self.get_neighbors(current, self.link_distance):
+                    if other in remaining:
+                        remaining.discard(other)
+                        members.add(other)
+                        frontier.append(other)
+            self._new_component(members)
+
+    def get_component(self, tile_id: int) -> List[int]:
+        """Returns the ids of the tiles connected to the given tile (including itself)."""
+        label = self.component_of.get(tile_id)
+        if label is None:
+            return []
+        return sorted(self.components[label])
+
+    def get_components(self) -> List[List[int]]:
+        """Returns the connected groups of active tiles as lists of tile ids."""
+        return [sorted(members) for members in self.components.values()]
+
+    def is_active(self, tile_id: int) -> bool:
+        """Returns True if the tile is currently on the board graph."""
+        return tile_id in self.cells
+
+    def get_position(self, tile_id: int) -> Tuple[int, int]:
+        x, y, _ = self.vertex_data[tile_id]
+        return int(x), int(y)
+
+    def distance(self, u: int, v: int) -> float:
+        """Euclidean distance between two active tiles (inf if either is inactive)."""
+        if u == v:
+            return 0.0
+        if u not in self.cells or v not in self.cells:
+            return math.inf
+        ux, uy = self.get_position(u)
+        vx, vy = self.get_position(v)
+        return math.hypot(ux - vx, uy - vy)
+
     def add_tile(self, tile):
         """Add a new tile to the graph. If the tile already exists,
            update its data; otherwise, register it as active.
         """
         tid = tile.get_id()
-        # Check if the tile is already active (i.e. vertex_data[tid] not all -1).
-        if (self.vertex_data[tid] != -1).all():
+        if tid in self.cells:
             self.update_tile(tile)
             return
-        # Set tile's current position.
-        self.vertex_data[tid] = [tile.get_x(), tile.get_y(), tid]
-        # Find all active tile indices.
-        active_indices = np.where(self.vertex_data[:, 0] != -1)[0]
-        # Compute new tile distances relative to active ones.
-        coords = self.vertex_data[active_indices, :2].astype(float)
-        tile_coords = np.array(self.vertex_data[tid, :2], dtype=float)
-        diff = coords - tile_coords
-        distances = np.sqrt(np.sum(diff ** 2, axis=1))
-        # Update the row and column corresponding to tile 'tid'.
-        self.matrix[tid, active_indices] = distances
-        self.matrix[active_indices, tid] = distances
-        np.fill_diagonal(self.matrix, 0)
-    
+        self._insert(tid, tile.get_x(), tile.get_y())
+
     def update_tile(self, tile):
-        """Update vertex data and distances for a single tile.
+        """Update vertex data and grid bucket for a single tile.
            Should be called after the tile moves.
         """
         tid = tile.get_id()
-        self.vertex_data[tid] = [tile.get_x(), tile.get_y(), tid]
-        coords = self.vertex_data[:, :2].astype(float)
-        tile_coords = np.array(self.vertex_data[tid, :2], dtype=float)
-        diff = coords - tile_coords
-        distances = np.sqrt(np.sum(diff ** 2, axis=1))
-        self.matrix[tid, :] = distances
-        self.matrix[:, tid] = distances
-        np.fill_diagonal(self.matrix, 0)
-    
+        x, y = tile.get_x(), tile.get_y()
+        if tid in self.cells and self.get_position(tid) == (x, y):
+            return
+        self._discard(tid)
+        self._insert(tid, x, y)
+
     def update_all_tiles(self, tiles: dict):
-        """Refresh the entire graph based on the current positions in the provided tiles dictionary.
-           'tiles' is a dictionary {tile_id: Tile}.
+        """Refresh the graph based on the current positions in the provided tiles dictionary.
+           'tiles' is a dictionary {tile_id: Tile}. Only tiles that moved are re-bucketed.
         """
         for tile in tiles.values():
-            tid = tile.get_id()
-            self.vertex_data[tid] = [tile.get_x(), tile.get_y(), tid]
-        coords = self.vertex_data[:, :2].astype(float)
-        diff = coords[:, None, :] - coords[None, :, :]
-        self.matrix = np.sqrt(np.sum(diff ** 2, axis=2))
-        np.fill_diagonal(self.matrix, 0)
-    
+            self.update_tile(tile)
+
     def reset_tile_data(self, tile_id: int):
-        """Resets the vertex data and distances for a removed tile."""
-        self.vertex_data[tile_id] = [-1, -1, -1]
-        self.matrix[tile_id, :] = np.inf
-        self.matrix[:, tile_id] = np.inf
-        np.fill_diagonal(self.matrix, 0)
-    
+        """Resets the vertex data and grid entry for a removed tile."""
+        self._discard(tile_id)
+        if tile_id < self.size:
+            self.vertex_data[tile_id] = [-1, -1, -1]
+
     def remove_tile_by_id(self, tile_id: int) -> bool:
         """Removes a specific tile from the graph and resets its data.
            Returns True if removal was successful.
         """
-        if (self.vertex_data[tile_id] == -1).all():
+        if tile_id not in self.cells:
             return False
         self.reset_tile_data(tile_id)
         return True
-    
+
+    def _ring(self, cell: Tuple[int, int], radius: int):
+        """Yield the tile ids in the square ring of cells at Chebyshev distance 'radius'."""
+        cx, cy = cell
+        if radius == 0:
+            yield from self.grid.get(cell, ())
+            return
+        for dx in range(-radius, radius + 1):
+            for dy in (-radius, radius):
+                yield from self.grid.get((cx + dx, cy + dy), ())
+        for dy in range(-radius + 1, radius):
+            for dx in (-radius, radius):
+                yield from self.grid.get((cx + dx, cy + dy), ())
+
+    def get_neighbors(self, tile_id: int, max_distance: float) -> List[Tuple[int, float]]:
+        """Returns [(neighbor_id, distance), ...] for active tiles within max_distance."""
+        if tile_id not in self.cells:
+            return []
+        rings = int(math.ceil(max_distance / self.cell_size))
+        x, y = self.get_position(tile_id)
+        cell = self.cells[tile_id]
+        neighbors = []
+        for radius in range(rings + 1):
+            for other in self._ring(cell, radius):
+                if other == tile_id:
+                    continue
+                ox, oy = self.get_position(other)
+                distance = math.hypot(x - ox, y - oy)
+                if distance <= max_distance:
+                    neighbors.append((other, distance))
+        return neighbors
+
     def get_nearest_neighbor(self, tile) -> Tuple[int, float]:
-        """Returns (nearest_tile_id, distance) for the given tile, excluding itself."""
+        """Returns (nearest_tile_id, distance) for the given tile, excluding itself.
+           Returns (-1, inf) when the tile has no other tile to compare against.
+        """
         tid = tile.get_id()
-        distances = self.matrix[tid].copy()
-        distances[tid] = np.inf  # Exclude self
-        nearest_id = int(np.argmin(distances))
-        nearest_distance = distances[nearest_id]
+        x, y = tile.get_x(), tile.get_y()
+        cell = self._cell_for(x, y)
+        remaining = len(self.cells) - (1 if tid in self.cells else 0)
+        nearest_id, nearest_distance = -1, math.inf
+        radius = 0
+        # Expand ring by ring; anything beyond ring r is at least r cells away.
+        while remaining > 0 and nearest_distance > radius * self.cell_size - self.cell_size:
+            for other in self._ring(cell, radius):
+                if other == tid:
+                    continue
+                remaining -= 1
+                ox, oy = self.get_position(other)
+                distance = math.hypot(x - ox, y - oy)
+                if distance < nearest_distance or (distance == nearest_distance and other < nearest_id):
+                    nearest_id, nearest_distance = other, distance
+            radius += 1
         return nearest_id, nearest_distance
 
     def kruskals_msf(self, active_tiles: dict, max_weight: float):
         """Computes a minimum spanning forest with a max weight threshold.
            'active_tiles' is a dictionary {tile_id: Tile}.
         """
-        active_ids = np.array(list(active_tiles.keys()), dtype=int)
-        if active_ids.size == 0:
+        active_ids = [tid for tid in active_tiles.keys() if tid in self.cells]
+        if not active_ids:
             return []
-        
-        submatrix = self.matrix[np.ix_(active_ids, active_ids)]
-        triu_idx = np.triu_indices_from(submatrix, k=1)
-        edges = np.column_stack((active_ids[triu_idx[0]], active_ids[triu_idx[1]]))
-        weights = submatrix[triu_idx]
-        
-        valid = weights <= max_weight
-        edges, weights = edges[valid], weights[valid]
-        sorted_indices = np.argsort(weights)
-        edges, weights = edges[sorted_indices], weights[sorted_indices]
-        
-        parent = np.arange(self.size)
-        rank = np.zeros(self.size, dtype=int)
-        
+        active_set = set(active_ids)
+
+        # Only neighbouring cells can hold edges within max_weight.
+        edges = []
+        for u in active_ids:
+            for v, weight in self.get_neighbors(u, max_weight):
+                if u < v and v in active_set:
+                    edges.append((weight, u, v))
+        edges.sort()
+
+        parent = {tid: tid for tid in active_ids}
+        rank = dict.fromkeys(active_ids, 0)
+
         def find(i):
-            if parent[i] != i:
-                parent[i] = find(parent[i])
-            return parent[i]
-        
-        def union(x, y):
-            root_x, root_y = find(x), find(y)
-            if root_x != root_y:
-                if rank[root_x] < rank[root_y]:
-                    parent[root_x] = root_y
-                elif rank[root_x] > rank[root_y]:
-                    parent[root_y] = root_x
-                else:
-                    parent[root_y] = root_x
-                    rank[root_x] += 1
-        
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+            return root
+
+        def union(root_x, root_y):
+            if rank[root_x] < rank[root_y]:
+                parent[root_x] = root_y
+            elif rank[root_x] > rank[root_y]:
+                parent[root_y] = root_x
+            else:
+                parent[root_y] = root_x
+                rank[root_x] += 1
+
         edge_used = []
-        for u, v in edges:
-            if find(u) != find(v):
-                union(u, v)
-                edge_used.append((u, v, self.matrix[u, v]))
-        
+        for weight, u, v in edges:
+            root_u, root_v = find(u), find(v)
+            if root_u != root_v:
+                union(root_u, root_v)
+                edge_used.append((u, v, weight))
+
         forest_map = {}
         for tid in active_ids:
-            root = find(tid)
-            if root not in forest_map:
-                forest_map[root] = []
-            forest_map[root].append(tid)
-        
-        forests = [(vertices, [(u, v, self.matrix[u, v])
-                    for u, v, _ in edge_used if u in vertices or v in vertices])
-                   for vertices in forest_map.values()]
-        return forests
-    
+            forest_map.setdefault(find(tid), []).append(tid)
+
+        forest_edges = {}
+        for u, v, weight in edge_used:
+            forest_edges.setdefault(find(u), []).append((u, v, weight))
+
+        return [(vertices, forest_edges.get(root, []))
+                for root, vertices in forest_map.items()]
+
     def print_forests(self, forests):
         """Display the current grouped sets of active tiles."""
+        self.print_sets([vertices for vertices, edges in forests])
+
+    def print_sets(self, sets):
+        """Display the given groups of active tile ids."""
         print('Active Sets:')
-        for vertices, edges in forests:
+        for vertices in sets:
             # Convert np.int64 to regular ints for cleaner output
             print('{', [int(self.vertex_data[v][2]) for v in vertices], '}')
+
+
+def segment_rows(positions: Dict[int, Tuple[int, int]], max_step: float) -> List[List[int]]:
+    """Split tiles into melds by table row instead of by Euclidean distance.
+
+       Tiles are bucketed by their (snapped) y coordinate, sorted by x within a
+       row, and a new meld starts wherever the step to the next tile's x exceeds
+       max_step. Runs in O(N log N) and never merges vertically adjacent rows.
+       'positions' is a dictionary {tile_id: (x, y)}.
+    """
+    rows: Dict[int, List[Tuple[int, int]]] = {}
+    for tid, (x, y) in positions.items():
+        rows.setdefault(y, []).append((x, tid))
+
+    sets = []
+    for row in rows.values():
+        row.sort()
+        current = [row[0][1]]
+        for (prev_x, _), (x, tid) in zip(row, row[1:]):
+            if x - prev_x > max_step:
+                sets.append(current)
+                current = []
+            current.append(tid)
+        sets.append(current)
+    return sets
@@ -18,6 +18,24 @@ def pygame_setup():
     yield
     pygame.quit()
 
+@pytest.fixture(autouse=True)
+def clear_image_cache():
+    """Start every test with an empty shared image cache"""
+    from rummikub.image_cache import ImageCache
+    ImageCache.clear()
+    yield
+    ImageCache.clear()
+
+@pytest.fixture(autouse=True)
+def clear_theme_caches():
+    """Start every test with empty rendered-text and button caches"""
+    from rummikub.theme_manager import ThemeManager
+    ThemeManager.clear_text_cache()
+    ThemeManager.clear_button_cache()
+    yield
+    ThemeManager.clear_text_cache()
+    ThemeManager.clear_button_cache()
+
 @pytest.fixture
 def mock_surface():
     """Create a mock pygame surface for testing"""
@@ -60,4 +78,14 @@ def sample_deck():
 def empty_board(mock_game):
     """Create an empty board for testing"""
     from rummikub.board import Board
-    return Board(mock_game)
\ No newline at end of file
+    return Board(mock_game)
+
+@pytest.fixture
+def spec():
+    """Create TileSpecs with sequential ids"""
+    from rummikub.rules import TileSpec
+    counter = iter(range(1000))
+
+    def _create(number, color, is_joker=False):
+        return TileSpec(next(counter), number, color, is_joker)
+    return _create
@@ -0,0 +1,263 @@
+# tests/unit/test_ai.py
+import os
+import random
+import time
+
+import pytest
+from unittest.mock import MagicMock
+
+from rummikub import rules
+from rummikub.rules import TileSpec
+from rummikub.player import Player
+from rummikub.tile import Tile
+from rummikub.deck import Deck
+from rummikub.ai import (
+    ComputerPlayer,
+    GreedyStrategy,
+    MCTSStrategy,
+    Move,
+    MoveSearch,
+    Opponent,
+    SolverStrategy,
+    Strategy,
+    LEVELS,
+    credited_points,
+    get_pool,
+    get_strategy,
+    shutdown_pool,
+)
+from rummikub.ai import mcts
+
+
+class PidStrategy(Strategy):
+    """Plays the id of the process it searched in; module-level so workers can unpickle it"""
+
+    def search(self, table_sets, rack, initial_meld, deadline, opponents=()):
+        yield Move([], [os.getpid()])
+
+
+class TestStrategies:
+    """Unit tests for the computer move strategies"""
+
+    def search(self, strategy, table_sets, rack, initial_meld=True):
+        """Run a search to completion"""
+        return list(strategy.search(table_sets, rack, initial_meld, time.monotonic() + 10))
+
+    def test_get_strategy(self):
+        """Test strategies are created by name"""
+        assert isinstance(get_strategy('greedy'), GreedyStrategy)
+        assert isinstance(get_strategy('solver'), SolverStrategy)
+        with pytest.raises(ValueError):
+            get_strategy('random')
+
+    def test_greedy_keeps_table(self, spec):
+        """Test the greedy strategy only adds melds from the rack"""
+        table_sets = [[spec(1, "blue"), spec(2, "blue"), spec(3, "blue")]]
+        rack = [spec(10, "red"), spec(11, "red"), spec(12, "red"), spec(4, "blue")]
+        moves = self.search(GreedyStrategy(), table_sets, rack)
+
+        assert len(moves) == 1
+        assert moves[0].melds[0] == table_sets[0]
+        assert sorted(t.id for t in moves[0].played) == sorted(t.id for t in rack[:3])
+
+    def test_solver_improves_on_greedy(self, spec):
+        """Test the solver yields the greedy move, then one that extends table sets"""
+        table_sets = [[spec(1, "blue"), spec(2, "blue"), spec(3, "blue")]]
+        rack = [spec(10, "red"), spec(11, "red"), spec(12, "red"), spec(4, "blue")]
+        moves = self.search(SolverStrategy(), table_sets, rack)
+
+        assert [len(move.played) for move in moves] == [3, 4]
+        assert rules.validate_sets(moves[-1].melds)
+
+    def test_initial_meld_threshold(self, spec):
+        """Test nothing is played before the initial meld unless it is worth 30"""
+        rack = [spec(1, "red"), spec(2, "red"), spec(3, "red")]
+        assert self.search(SolverStrategy(), [], rack, initial_meld=False) == []
+
+        rack = [spec(9, "red"), spec(10, "red"), spec(11, "red"), spec(1, "blue")]
+        moves = self.search(SolverStrategy(), [], rack, initial_meld=False)
+        assert len(moves) == 1
+        assert credited_points(moves[0].melds, moves[0].played) == 30
+
+    def test_credited_points_values_jokers(self, spec):
+        """Test jokers count for the number they stand in for"""
+        joker = spec(0, "joker", True)
+        run = [spec(5, "red"), joker, spec(7, "red")]
+        group = [spec(8, "red"), spec(8, "blue"), spec(0, "joker", True)]
+
+        assert credited_points([run], run) == 18
+        assert credited_points([group], group) == 24
+        assert credited_points([run, group], [joker]) == 6
+
+
+class TestComputerPlayer:
+    """Unit tests for background move searches and the computer player"""
+
+    @pytest.fixture
+    def mock_game(self):
+        """Create a mock game whose deck deals a red 1-13 run and a blue 5"""
+        game = MagicMock()
+        specs = [TileSpec(i, n, "red") for i, n in enumerate(range(1, 14))] + [TileSpec(13, 5, "blue")]
+
+        def pick_tile():
+            spec = specs.pop(0)
+            tile = MagicMock(spec=Tile)
+            tile.id, tile.number, tile.color, tile.is_joker = spec
+            tile.get_id.return_value = spec.id
+            return tile
+
+        game.deck.pick_tile.side_effect = pick_tile
+        return game
+
+    def wait(self, search):
+        """Poll a search like the game loop does"""
+        while not search.done():
+            time.sleep(0.01)
+        return search.result()
+
+    def test_search_runs_in_worker_process(self):
+        """Test a strategy's search runs in a worker process and its move comes back"""
+        search = MoveSearch(PidStrategy(), [], [], True, time_budget=5)
+
+        move = self.wait(search)
+        assert move.played and move.played != [os.getpid()]
+
+    def test_search_stops_near_deadline(self):
+        """Test a search that can't finish hands back in time what it found"""
+        tiles = Deck.headless(seed=3).tiles
+        table_sets = rules.solve([], tiles[:90]).melds
+        start = time.monotonic()
+        search = MoveSearch(SolverStrategy(), table_sets, tiles[90:], True, time_budget=0.2)
+
+        move = self.wait(search)
+        assert time.monotonic() - start < 0.2 + MoveSearch.GRACE + 0.2
+        assert move is None or rules.validate_sets(move.melds)
+
+    def test_pool_strategy_runs_in_background(self):
+        """Test a strategy that searches on the pool itself is driven from a thread"""
+        strategy = MagicMock(spec=Strategy)
+        strategy.in_pool = True
+        strategy.search.return_value = iter([Move([], ['first']), Move([], ['second'])])
+        search = MoveSearch(strategy, [], [], True, time_budget=5)
+
+        assert self.wait(search).played == ['second']
+        strategy.search.assert_called_once_with([], [], True, search.deadline, ())
+
+    def test_search_keeps_best_move_at_deadline(self):
+        """Test a search that runs out of time returns the best move found so far"""
+        def slow_search(table_sets, rack, initial_meld, deadline, opponents):
+            yield Move([], ['quick'])
+            while time.monotonic() < deadline:
+                time.sleep(0.01)
+            raise TimeoutError
+
+        strategy = MagicMock(spec=Strategy)
+        strategy.in_pool = True
+        strategy.search.side_effect = slow_search
+        start = time.monotonic()
+        search = MoveSearch(strategy, [], [], True, time_budget=0.2)
+
+        assert self.wait(search).played == ['quick']
+        assert time.monotonic() - start < 1.0
+
+    def test_computer_player_turn(self, mock_game):
+        """Test a computer player searches with specs and hands back its move once"""
+        player = ComputerPlayer(mock_game, "Computer 1", 'greedy', time_budget=5)
+        assert isinstance(player, Player)
+        assert not player.is_thinking()
+
+        player.initial_meld = True
+        player.start_turn([])
+        assert player.is_thinking()
+        self.wait(player.search)
+
+        move = player.finish_turn()
+        assert len(move.played) == 13
+        assert not player.is_thinking()
+        assert player.finish_turn() is None
+
+    def test_computer_player_unknown_strategy(self, mock_game):
+        """Test strategy names are validated"""
+        with pytest.raises(ValueError):
+            ComputerPlayer(mock_game, "Computer 1", 'random')
+
+
+class TestMCTS:
+    """Unit tests for the information-set MCTS strategy"""
+
+    @pytest.fixture
+    def position(self):
+        """A table, a rack that can go out in one move, and two opponents"""
+        deck = Deck.headless(seed=3)
+        table_sets = rules.solve([], deck.tiles[:40]).melds
+        rack = [TileSpec(500 + i, n, "orange") for i, n in enumerate((1, 2, 3))]
+        return table_sets, rack, (Opponent(14, True), Opponent(10, False))
+
+    def test_registered(self):
+        """Test the strategy is available by name"""
+        assert isinstance(get_strategy('mcts'), MCTSStrategy)
+
+    def test_unseen_tiles(self, position):
+        """Test hidden tiles are everything not on the table or the rack"""
+        table_sets, rack, opponents = position
+        unseen = mcts.unseen_tiles(mcts._Position(table_sets, rack, True, opponents))
+        known = [tile for tile_set in table_sets for tile in tile_set] + rack
+
+        assert len(unseen) == 106 - len(known)
+        assert sum(tile.is_joker for tile in unseen + known) == 2
+        assert not {tile.id for tile in unseen} & {tile.id for tile in known}
+
+    def test_iteration_limit(self, position):
+        """Test the root statistics cover exactly the requested iterations"""
+        table_sets, rack, opponents = position
+        state = mcts._Position(table_sets, rack, True, opponents)
+        candidates = mcts.candidate_moves(state, None)
+        tree = mcts._Tree(state, candidates, random.Random(0), 0.7, 2).run(30, None)
+
+        assert candidates[-1] is None
+        assert sum(tree.visits) == 30
+        assert all(tree.visits)
+
+    def test_prefers_going_out(self, position):
+        """Test the search plays a move that empties the rack over drawing"""
+        table_sets, rack, opponents = position
+        moves = list(MCTSStrategy(iterations=40, seed=1).search(table_sets, rack, True, None, opponents))
+
+        assert len(moves[-1].played) == 3
+        assert rules.validate_sets(moves[-1].melds)
+
+    def test_time_limit(self, position):
+        """Test the wall-clock limit stops the search early"""
+        table_sets, rack, opponents = position
+        start = time.monotonic()
+        moves = list(MCTSStrategy(iterations=10 ** 6, time_limit=0.3).search(table_sets, rack, True, None, opponents))
+
+        assert moves
+        assert time.monotonic() - start < 2.0
+
+    def test_root_parallel_workers(self, position):
+        """Test worker processes search independently and their statistics are merged"""
+        table_sets, rack, opponents = position
+        strategy = MCTSStrategy(iterations=20, workers=2, seed=1)
+        moves = list(strategy.search(table_sets, rack, True, None, opponents))
+        assert len(moves[-1].played) == 3
+
+        # Every search in the process shares one pool
+        pool = get_pool()
+        list(MCTSStrategy(iterations=20, workers=2, seed=2).search(table_sets, rack, True, None, opponents))
+        assert get_pool() is pool
+
+    def test_shared_pool_spawns_workers(self):
+        """Test the shared pool starts workers with spawn, never by forking the game"""
+        shutdown_pool()
+        try:
+            assert get_pool(2)._mp_context.get_start_method() == 'spawn'
+            assert get_pool(4) is get_pool()
+        finally:
+            shutdown_pool()
+
+    def test_workers_configurable_by_name(self):
+        """Test strategy options reach the constructor and the Expert level searches in parallel"""
+        assert get_strategy('mcts', workers=3).workers == 3
+        strategy, _, options = LEVELS['Expert']
+        assert get_strategy(strategy, **options).workers == options['workers'] >= 1
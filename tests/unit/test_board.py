@@ -31,8 +31,8 @@ class TestBoard:
             # Configure nearest neighbor method
             mock_graph_instance.get_nearest_neighbor.return_value = (1, 100)  # Default (id, distance)
             
-            # Configure kruskals_msf method
-            mock_graph_instance.kruskals_msf.return_value = []  # Default empty forests
+            # Configure get_components method
+            mock_graph_instance.get_components.return_value = []  # Default no sets
             
             yield MockGraph, mock_graph_instance
     
@@ -284,11 +284,7 @@ class TestBoard:
         forest1_tiles = [1, 2, 3]  # A valid group
         forest2_tiles = [4, 5, 6, 7]  # A valid run
         
-        # Create forest data
-        forest1 = (forest1_tiles, [(1, 2, 50), (2, 3, 60)])
-        forest2 = (forest2_tiles, [(4, 5, 70), (5, 6, 80), (6, 7, 90)])
-        
-        board.graph.kruskals_msf.return_value = [forest1, forest2]
+        board.graph.get_components.return_value = [forest1_tiles, forest2_tiles]
         
         # Create tiles
         # Forest 1: Group (same number 8, different colors)
@@ -321,7 +317,7 @@ class TestBoard:
             
             # Verify graph methods were called
             board.graph.update_all_tiles.assert_called_once_with(board.tiles)
-            board.graph.kruskals_msf.assert_called_once_with(board.tiles, max_weight=200)
+            board.graph.get_components.assert_called_once_with()
             
             # Verify jokers were reset first
             joker1.reset_joker.assert_called_once()
@@ -330,6 +326,39 @@ class TestBoard:
             # Verify statistics were updated
             assert board.game.statistics['valid_sets_formed'] == 2
     
+    def test_update_sets_moved_tile(self, board, mock_tile):
+        """Test that a known moved tile is re-linked without a full resync"""
+        tile = mock_tile(1, 8, "red")
+        board.tiles = {1: tile}
+        
+        board.update_sets(tile)
+        
+        board.graph.update_tile.assert_called_once_with(tile)
+        board.graph.update_all_tiles.assert_not_called()
+    
+    def test_segmentation_strategy(self, board):
+        """Test choosing and rejecting segmentation strategies"""
+        assert board.segmentation == 'graph'
+        
+        board.set_segmentation('rows')
+        assert board.segmentation == 'rows'
+        
+        with pytest.raises(ValueError):
+            board.set_segmentation('diagonal')
+    
+    def test_find_sets_rows(self, board, mock_tile):
+        """Test row segmentation keeps stacked rows apart"""
+        board.set_segmentation('rows')
+        board.tiles = {
+            1: mock_tile(1, 8, "red", x=0, y=0),
+            2: mock_tile(2, 8, "blue", x=130, y=0),
+            3: mock_tile(3, 3, "red", x=0, y=200),
+            4: mock_tile(4, 4, "red", x=130, y=200),
+        }
+        
+        assert sorted(board.find_sets()) == [[1, 2], [3, 4]]
+        board.graph.get_components.assert_not_called()
+    
     def test_assign_joker_run_values_fill_gaps(self, board, mock_tile):
         """Test assigning values to jokers in a run with gaps"""
         # Create regular tiles with a gap
@@ -439,9 +468,7 @@ class TestBoard:
     def test_validate_sets_valid(self, board, mock_tile):
         """Test validating board sets when all are valid"""
         # Configure mock graph to return forests
-        forest1 = ([1, 2, 3], [(1, 2, 50), (2, 3, 60)])
-        forest2 = ([4, 5, 6, 7], [(4, 5, 70), (5, 6, 80), (6, 7, 90)])
-        board.graph.kruskals_msf.return_value = [forest1, forest2]
+        board.graph.get_components.return_value = [[1, 2, 3], [4, 5, 6, 7]]
         
         # Create tiles
         tile1 = mock_tile(1, 8, "red")
@@ -482,9 +509,10 @@ class TestBoard:
     def test_validate_sets_invalid(self, board, mock_tile):
         """Test validating board sets when some are invalid"""
         # Configure mock graph to return forests
-        forest1 = ([1, 2, 3], [(1, 2, 50), (2, 3, 60)])  # Valid group
-        forest2 = ([4, 5, 6, 7], [(4, 5, 70), (5, 6, 80), (6, 7, 90)])  # Invalid set
-        board.graph.kruskals_msf.return_value = [forest1, forest2]
+        board.graph.get_components.return_value = [
+            [1, 2, 3],     # Valid group
+            [4, 5, 6, 7],  # Invalid set
+        ]
         
         # Add tiles to board
         board.tiles = {
@@ -556,4 +584,31 @@ class TestBoard:
         positions = board.get_tile_positions()
         
         # Verify correct positions were returned
-        assert positions == {1: (100, 200), 2: (300, 400)}
\ No newline at end of file
+        assert positions == {1: (100, 200), 2: (300, 400)}
+    def test_arrange_melds(self, mock_game, mock_tile):
+        """Test laid-out melds are found as the same sets, wrapping onto new rows"""
+        board = Board(mock_game)  # Real graph
+        melds = [[mock_tile(meld * 20 + i, i + 1, "red") for i in range(size)]
+                 for meld, size in enumerate([13, 13, 4, 3, 5])]
+        for meld in melds:
+            for tile in meld:
+                def place(x, y, tile=tile):
+                    tile.get_x.return_value = x
+                    tile.get_y.return_value = y
+                    tile.get_coordinates.return_value = (x, y)
+                tile.set_coordinates.side_effect = place
+                board.tiles[tile.id] = tile
+
+        board.arrange_melds(melds)
+
+        assert sorted(sorted(t.id for t in found) for found in board.get_sets()) == \
+            sorted(sorted(t.id for t in meld) for meld in melds)
+        rows = {tile.get_y() for meld in melds for tile in meld}
+        assert len(rows) == 3
+        assert all(tile.get_x() + board.MELD_TILE_STEP <= board.TABLE_SIZE[0] for meld in melds for tile in meld)
+
+    def test_arrange_melds_overflow(self, board, mock_tile):
+        """Test melds that don't fit on the table are rejected"""
+        melds = [[mock_tile(i * 3 + j, j + 1, "red") for j in range(3)] for i in range(60)]
+        with pytest.raises(ValueError):
+            board.arrange_melds(melds)
@@ -227,4 +227,84 @@ class TestDeck:
             deck.pick_tile()
         
         # Verify empty deck has length 0
-        assert len(deck) == 0
\ No newline at end of file
+        assert len(deck) == 0
+    
+    def test_rendered_deck(self, tmp_path, mock_tile_class):
+        """Test a rendered deck generates tiles for its size and theme into the cache"""
+        from rummikub.assets import generate_rummikub_tiles as generator
+        
+        def fake_generate(folder, **kwargs):
+            os.makedirs(folder, exist_ok=True)
+            for filename, _ in generator.tile_jobs(kwargs['colors']):
+                open(os.path.join(folder, filename), 'w').close()
+            return [], []
+        
+        with patch.object(generator, 'generate_tiles', side_effect=fake_generate) as mock_generate:
+            deck = Deck.rendered((130, 200), theme="classic", cache_root=str(tmp_path))
+        
+        expected_folder = os.path.join(str(tmp_path), "classic_130x200")
+        assert deck.tile_folder == expected_folder
+        _, kwargs = mock_generate.call_args
+        assert kwargs['size'] == (130, 200)
+        assert kwargs['colors'] == generator.THEMES["classic"]
+        assert len(deck) == 106
+        assert {tile.color for tile in deck.tiles} == {"red", "blue", "black", "orange", "joker"}
+    
+    def test_rendered_deck_unknown_theme(self, tmp_path):
+        """Test asking for a theme the generator doesn't know fails clearly"""
+        with pytest.raises(ValueError):
+            Deck.rendered(theme="neon", cache_root=str(tmp_path))
+
+    def test_headless_deck(self):
+        """Test a headless deck holds the standard tile set as TileSpecs"""
+        from rummikub.rules import TileSpec
+
+        deck = Deck.headless()
+
+        assert deck.tile_folder is None
+        assert len(deck) == 106
+        assert all(isinstance(tile, TileSpec) for tile in deck.tiles)
+        assert sorted(tile.id for tile in deck.tiles) == list(range(106))
+        assert sum(tile.is_joker for tile in deck.tiles) == 2
+
+    def test_seeded_shuffle(self):
+        """Test the same seed or generator deals the same order"""
+        first = [tile.id for tile in Deck.headless(seed=42).tiles]
+
+        assert first == [tile.id for tile in Deck.headless(seed=42).tiles]
+        assert first == [tile.id for tile in Deck.headless(seed=random.Random(42)).tiles]
+        assert first != [tile.id for tile in Deck.headless(seed=43).tiles]
+
+    def test_tile_deck_matches_headless_deck(self):
+        """Test the pygame-free TileDeck deals the same tiles in the same order"""
+        from rummikub.tile_deck import TileDeck
+
+        assert TileDeck(seed=42).tiles == Deck.headless(seed=42).tiles
+
+    def test_unseeded_shuffle_uses_global_random(self, mock_shuffle):
+        """Test decks without a seed keep shuffling through random.shuffle"""
+        deck = Deck.headless()
+        mock_shuffle.assert_called_once_with(deck.tiles)
+
+    def test_reset(self, mock_listdir, mock_tile_class):
+        """Test reset gathers every tile back and reshuffles without reloading"""
+        deck = Deck("rummikub/assets/tiles_2", seed=1)
+        tiles = deck.tiles
+        drawn = [deck.pick_tile() for _ in range(10)]
+        mock_listdir.reset_mock()
+        mock_tile_class.reset_mock()
+
+        deck.reset(seed=5)
+
+        assert deck.tiles is tiles
+        assert len(deck) == 26
+        assert set(map(id, drawn)) <= set(map(id, deck.tiles))
+        mock_listdir.assert_not_called()
+        mock_tile_class.assert_not_called()
+        for tile in deck.tiles:
+            if tile.is_joker:
+                tile.reset_joker.assert_called_once()
+
+        order = [tile.id for tile in deck.tiles]
+        deck.reset(seed=5)
+        assert [tile.id for tile in deck.tiles] == order
@@ -9,6 +9,7 @@ from rummikub.deck import Deck
 from rummikub.tile import Tile
 from rummikub.screens.game_screen import GameScreen
 from rummikub.screens.menu import SetupMenu, TurnMenu
+from rummikub.ai import ComputerPlayer
 
 class TestGame:
     """Unit tests for the Game class"""
@@ -195,7 +196,7 @@ class TestGame:
         
         # Verify screen initialization
         mock_screens['SetupMenu'].assert_called_once_with(game)
-        mock_screens['GameScreen'].assert_called_once_with(game)
+        mock_screens['GameScreen'].assert_not_called()
         
         # Verify initial game state
         assert game.running == True
@@ -215,6 +216,19 @@ class TestGame:
         # Verify initial screen
         assert game.current_screen == mock_screens['setup_menu']
     
+    def test_game_screen_built_lazily(self, game, mock_screens):
+        """Test the game screen is constructed once, on first access"""
+        mock_screens['GameScreen'].reset_mock()
+        
+        # Rendering the menu must not build the game screen
+        with patch('pygame.display.flip'):
+            game.render()
+        mock_screens['GameScreen'].assert_not_called()
+        
+        assert game.game_screen is mock_screens['game_screen']
+        assert game.game_screen is mock_screens['game_screen']
+        mock_screens['GameScreen'].assert_called_once_with(game)
+    
     def test_change_screen(self, game, mock_screens):
         """Test changing the active screen"""
         # Change to game screen
@@ -249,6 +263,30 @@ class TestGame:
             # Verify current_screen.handle_events was called with events
             game.current_screen.handle_events.assert_called_once_with(mock_events)
     
+    def test_handle_events_includes_pending_events(self, game):
+        """Test events taken off the queue while idle are handled first"""
+        waited = MagicMock(type=pygame.MOUSEBUTTONDOWN)
+        queued = MagicMock(type=pygame.MOUSEBUTTONUP)
+        game.pending_events = [waited]
+        
+        with patch('pygame.event.get', return_value=[queued]):
+            game.handle_events()
+        
+        game.current_screen.handle_events.assert_called_once_with([waited, queued])
+        assert game.pending_events == []
+    
+    def test_wait_for_events(self, game):
+        """Test idle waiting keeps real events and drops timeouts"""
+        with patch('pygame.event.wait', return_value=MagicMock(type=pygame.NOEVENT)) as mock_wait:
+            game.wait_for_events()
+            mock_wait.assert_called_once_with(game.IDLE_TIMEOUT_MS)
+        assert game.pending_events == []
+        
+        event = MagicMock(type=pygame.KEYDOWN)
+        with patch('pygame.event.wait', return_value=event):
+            game.wait_for_events()
+        assert game.pending_events == [event]
+    
     def test_update(self, game):
         """Test game update method"""
         # Call update
@@ -276,7 +314,7 @@ class TestGame:
     def test_render_game_screen(self, game, mock_screens):
         """Test rendering the game screen"""
         # Set current screen to game_screen
-        game.current_screen = mock_screens['game_screen']
+        game.current_screen = game.game_screen
         
         # Call render
         game.render()
@@ -394,6 +432,20 @@ class TestGame:
             assert game.current_turn == 0
             assert game.statistics['turns_played'] == 2
     
+    def test_next_turn_computer_player(self, game, mock_players, mock_screens):
+        """Test a computer's turn skips the turn menu and starts its search"""
+        computer = MagicMock(spec=ComputerPlayer)
+        computer.name = "Computer 1"
+        computer.tiles = {}
+        game.players[1] = computer
+
+        with patch('builtins.print'):
+            game.next_turn()
+
+        mock_screens['TurnMenu'].assert_not_called()
+        assert game.current_screen is mock_screens['game_screen']
+        mock_screens['game_screen'].start_computer_turn.assert_called_once()
+
     def test_validate_turn_no_tiles_played(self, game, mock_screens):
         """Test validating turn when no tiles were played"""
         # Configure board with no added tiles
@@ -584,4 +636,21 @@ class TestGame:
             assert game.clock.tick.call_count == 3
             
             # Verify pygame.quit was called at the end
-            mock_quit.assert_called_once()
\ No newline at end of file
+            mock_quit.assert_called_once()
+    
+    def test_run_idle(self, game):
+        """Test the loop sleeps and skips rendering while the screen is clean"""
+        game.current_screen.dirty = False
+        
+        def stop():
+            game.running = False
+        
+        with patch.object(game, 'wait_for_events') as mock_wait, \
+             patch.object(game, 'handle_events', side_effect=stop), \
+             patch.object(game, 'update'), \
+             patch.object(game, 'render') as mock_render, \
+             patch('pygame.quit'):
+            game.run()
+            
+            mock_wait.assert_called_once()
+            mock_render.assert_not_called()
\ No newline at end of file
@@ -9,6 +9,8 @@ from rummikub.board import Board
 from rummikub.player import Player
 from rummikub.theme_manager import ThemeManager
 from rummikub.message_system import MessageSystem
+from rummikub.ai import ComputerPlayer, Move, Opponent
+from rummikub.rules import TileSpec
 
 class TestGameScreen:
     """Unit tests for the GameScreen class"""
@@ -263,18 +265,11 @@ class TestGameScreen:
         # Verify board creation
         assert isinstance(screen.board, MagicMock)
         
-        # Verify image loading
-        expected_image_paths = [
-            "./rummikub/assets/buttons/draw_button.png",
-            "./rummikub/assets/buttons/end_turn_button.png",
-            "./rummikub/assets/buttons/reset_button.png",
-            "./rummikub/assets/rack.png"
-        ]
-        
-        # Check that image load was called for each expected path
-        # Account for possible exception when loading reset button
-        for path in expected_image_paths[:2] + expected_image_paths[3:]:
-            assert any(call(path) == c for c in mock_pygame['load'].call_args_list)
+        # Verify only the rack image is loaded; buttons are drawn by ThemeManager
+        mock_pygame['load'].assert_called_once_with("./rummikub/assets/rack.png")
+        assert screen.draw_button_rect.size == GameScreen.BUTTON_SIZE
+        assert screen.end_button_rect.size == GameScreen.BUTTON_SIZE
+        assert screen.reset_button_rect.size == GameScreen.BUTTON_SIZE
         
         # Verify button hover states initialization
         assert screen.draw_button_hover == False
@@ -284,24 +279,6 @@ class TestGameScreen:
         # Verify sound initialization
         assert screen.sound_enabled == True
     
-    def test_initialization_with_missing_reset_button(self, mock_pygame, mock_theme_manager, mock_message_system, mock_board, mock_game):
-        """Test initialization with missing reset button image"""
-        # Configure image load to raise exception for reset button
-        def mock_load_image(path):
-            if "reset_button.png" in path:
-                raise FileNotFoundError("File not found")
-            mock_img = MagicMock()
-            mock_img.get_rect.return_value = pygame.Rect(0, 0, 200, 100)
-            return mock_img
-        
-        mock_pygame['load'].side_effect = mock_load_image
-        
-        # Create GameScreen
-        screen = GameScreen(mock_game)
-        
-        # Verify pygame Surface was called to create replacement
-        assert mock_pygame['surface'].fill.called
-    
     def test_initialization_with_sound_disabled(self, mock_pygame, mock_theme_manager, mock_message_system, mock_board, mock_game):
         """Test initialization with sound system failure"""
         # Configure mixer.init to raise exception
@@ -771,11 +748,11 @@ class TestGameScreen:
             # Verify board.add_tile was called
             game_screen.board.add_tile.assert_called_once_with(tile)
             
-            # Verify board.update_sets was called
-            game_screen.board.update_sets.assert_called_once()
-            
-            # Verify board.snap_tile was called
+            # Verify the tile was snapped before the sets were recomputed
             game_screen.board.snap_tile.assert_called_once_with(tile)
+            game_screen.board.update_sets.assert_called_once_with(tile)
+            board_calls = [name for name, _, _ in game_screen.board.method_calls]
+            assert board_calls.index('snap_tile') < board_calls.index('update_sets')
             
             # Verify sound played
             mock_play_sound.assert_called_with('tile_place')
@@ -852,6 +829,111 @@ class TestGameScreen:
             # Verify sound played
             mock_play_sound.assert_called_with('tile_place')
     
+    @pytest.fixture
+    def computer_turn(self, game_screen, mock_tiles):
+        """Make the current player a computer holding a red 10-12 run"""
+        player = MagicMock(spec=ComputerPlayer)
+        player.name = "Computer 1"
+        player.time_budget = 1.0
+        player.search = MagicMock()
+        tiles = {i: mock_tiles(i, 9 + i, "red") for i in (1, 2, 3)}
+        player.tiles = dict(tiles)
+        player.remove_tile.side_effect = lambda tile_id: player.tiles.pop(tile_id)
+        game_screen.game.players[0] = player
+        game_screen.board.add_tile.side_effect = lambda tile: game_screen.board.tiles.__setitem__(tile.id, tile)
+
+        specs = [TileSpec(i, 9 + i, "red") for i in (1, 2, 3)]
+        return player, tiles, Move([specs], specs)
+
+    def test_start_computer_turn(self, game_screen, computer_turn):
+        """Test a computer turn starts its search on the current table and what it sees of the others"""
+        player, _, _ = computer_turn
+        game_screen.game.players[1].initial_meld = True
+        game_screen.start_computer_turn()
+
+        player.start_turn.assert_called_once_with(game_screen.board.get_sets.return_value, [Opponent(0, True)])
+        game_screen.message_system.add_message.assert_called_once_with(
+            "Computer 1 is thinking...", color_name='highlight', duration=1.0
+        )
+
+    def test_computer_rack_hidden(self, game_screen, computer_turn):
+        """Test a computer player's rack is never drawn face-up"""
+        player, tiles, _ = computer_turn
+        game_screen.message_system.get_rects.return_value = []
+        for tile in tiles.values():
+            tile.draw_rect = pygame.Rect(500, 2200, 130, 200)
+        
+        with patch('pygame.display.update'):
+            game_screen.render()
+            game_screen.invalidate(pygame.Rect(450, 2150, 300, 300))
+            game_screen.render()
+        
+        player.draw.assert_not_called()
+        for tile in tiles.values():
+            tile.draw.assert_not_called()
+    
+    def test_play_computer_move_valid(self, game_screen, computer_turn):
+        """Test a computer move is laid out and validated like a human turn"""
+        player, tiles, move = computer_turn
+
+        with patch.object(game_screen, 'play_sound'):
+            game_screen.play_computer_move(player, move)
+
+        assert player.tiles == {}
+        game_screen.board.arrange_melds.assert_called_once_with([[tiles[1], tiles[2], tiles[3]]])
+        game_screen.board.update_sets.assert_called_once_with()
+        game_screen.game.validate_turn.assert_called_once()
+        game_screen.board.reset_board.assert_not_called()
+        game_screen.game.next_turn.assert_called_once()
+
+    def test_play_computer_move_invalid(self, game_screen, computer_turn):
+        """Test a computer move that fails validation is undone and the player draws"""
+        player, _, move = computer_turn
+        game_screen.game.validate_turn.return_value = False
+
+        with patch.object(game_screen, 'play_sound'):
+            game_screen.play_computer_move(player, move)
+
+        game_screen.board.reset_board.assert_called_once()
+        player.draw_tile.assert_called_once()
+        game_screen.game.next_turn.assert_called_once()
+
+    def test_update_plays_finished_search(self, game_screen, computer_turn):
+        """Test the move is played once the search is done, drawing when there is none"""
+        player, _, _ = computer_turn
+        player.is_thinking.return_value = True
+        player.search.done.return_value = False
+        game_screen.update()
+        player.finish_turn.assert_not_called()
+
+        player.search.done.return_value = True
+        player.finish_turn.return_value = None
+        with patch.object(game_screen, 'play_sound'):
+            game_screen.update()
+
+        player.draw_tile.assert_called_once()
+        game_screen.game.next_turn.assert_called_once()
+
+    def test_clicks_ignored_on_computer_turn(self, game_screen, computer_turn):
+        """Test buttons and tiles don't react to the mouse while a computer plays"""
+        game_screen.draw_button_rect = pygame.Rect(50, 50, 100, 50)
+        event = MagicMock()
+        event.type = pygame.MOUSEBUTTONDOWN
+
+        with patch('pygame.mouse.get_pos', return_value=(75, 75)):
+            game_screen.handle_events([event])
+
+        computer_turn[0].draw_tile.assert_not_called()
+        assert game_screen.dragged_tile is None
+
+    def test_draw_with_empty_deck_passes(self, game_screen):
+        """Test the turn passes without drawing once the deck is empty"""
+        game_screen.game.deck.__len__.return_value = 0
+        game_screen.draw_and_pass()
+
+        game_screen.game.players[0].draw_tile.assert_not_called()
+        game_screen.game.next_turn.assert_called_once()
+
     def test_update(self, game_screen):
         """Test the update method"""
         # Call update
@@ -860,24 +942,26 @@ class TestGameScreen:
         # Verify message_system.update was called
         game_screen.message_system.update.assert_called_once()
     
-    def test_render(self, game_screen, mock_theme_manager):
+    def test_render(self, game_screen, mock_theme_manager, mock_pygame):
         """Test the render method"""
         # Prepare mocks for pygame display
         with patch('pygame.display.update') as mock_update:
             # Call render
             game_screen.render()
             
-            # Verify screen.fill was called
-            game_screen.screen.fill.assert_called_once()
-            
-            # Verify screen.blit was called multiple times
-            assert game_screen.screen.blit.call_count > 0
+            # Verify the background layer was filled and blitted in one go
+            background = mock_pygame['surface'].convert.return_value
+            background.fill.assert_called_once()
+            game_screen.screen.fill.assert_not_called()
+            game_screen.screen.blit.assert_any_call(background, (0, 0))
             
             # Verify ThemeManager.render_text was called
             assert mock_theme_manager.render_text.call_count > 0
             
-            # Verify ThemeManager.draw_button was called for each button
-            assert mock_theme_manager.draw_button.call_count >= 3
+            # Verify a cached sprite was blitted for each button
+            assert mock_theme_manager.get_button_sprite.call_count == 3
+            game_screen.screen.blit.assert_any_call(
+                mock_theme_manager.get_button_sprite.return_value, game_screen.draw_button_rect)
             
             # Verify message_system.draw was called
             game_screen.message_system.draw.assert_called_once_with(game_screen.screen)
@@ -885,6 +969,158 @@ class TestGameScreen:
             # Verify pygame.display.update was called
             mock_update.assert_called_once()
     
+    def test_render_idle_skips_display_update(self, game_screen):
+        """Test nothing is repainted when nothing changed"""
+        game_screen.message_system.get_rects.return_value = []
+        with patch('pygame.display.update') as mock_update:
+            game_screen.render()
+            game_screen.screen.reset_mock()
+            mock_update.reset_mock()
+            
+            game_screen.render()
+            
+            mock_update.assert_not_called()
+            game_screen.screen.fill.assert_not_called()
+    
+    def test_render_dirty_rects(self, game_screen, mock_theme_manager):
+        """Test only invalidated regions are repainted and pushed to the display"""
+        game_screen.message_system.get_rects.return_value = []
+        game_screen.get_background()
+        game_screen.full_redraw = False
+        mock_theme_manager.reset_mock()
+        dirty = pygame.Rect(500, 500, 150, 220)
+        game_screen.invalidate(dirty)
+        
+        with patch('pygame.display.update') as mock_update:
+            game_screen.render()
+            
+            mock_update.assert_called_once_with([dirty])
+            game_screen.screen.set_clip.assert_any_call(dirty)
+            game_screen.screen.blit.assert_any_call(game_screen.background, dirty.topleft, dirty)
+            # The static layer is reused, not redrawn
+            mock_theme_manager.render_text.assert_not_called()
+            mock_theme_manager.get_button_sprite.assert_not_called()
+        
+        assert game_screen.dirty_rects == []
+    
+    def test_render_dirty_rect_draws_overlapping_tiles_only(self, game_screen):
+        """Test partial repaints only draw the tiles inside the region"""
+        game_screen.message_system.get_rects.return_value = []
+        game_screen.full_redraw = False
+        inside = MagicMock(draw_rect=pygame.Rect(500, 500, 130, 200))
+        outside = MagicMock(draw_rect=pygame.Rect(1500, 500, 130, 200))
+        game_screen.board.tiles = {1: inside, 2: outside}
+        game_screen.invalidate(pygame.Rect(450, 450, 100, 100))
+        
+        with patch('pygame.display.update'):
+            game_screen.render()
+        
+        inside.draw.assert_called_once_with(game_screen.screen)
+        outside.draw.assert_not_called()
+    
+    def test_render_message_areas_are_dirty(self, game_screen):
+        """Test message areas are repainted while shown and once after they expire"""
+        message_rect = pygame.Rect(1500, 100, 300, 40)
+        game_screen.full_redraw = False
+        
+        with patch('pygame.display.update') as mock_update:
+            game_screen.message_system.get_rects.return_value = [message_rect]
+            game_screen.render()
+            mock_update.assert_called_once_with([message_rect])
+            
+            mock_update.reset_mock()
+            game_screen.message_system.get_rects.return_value = []
+            game_screen.render()
+            mock_update.assert_called_once_with([message_rect])
+            
+            mock_update.reset_mock()
+            game_screen.render()
+            mock_update.assert_not_called()
+    
+    def test_background_rebuilt_on_turn_and_deck_change(self, game_screen, mock_theme_manager, mock_pygame):
+        """Test the background layer is only recomposited when its inputs change"""
+        layer = mock_pygame['surface'].convert.return_value
+        background = game_screen.get_background()
+        assert game_screen.get_background() is background
+        assert layer.fill.call_count == 1
+        game_screen.full_redraw = False
+        
+        # Drawing a tile shrinks the deck
+        game_screen.game.deck.__len__.return_value = 52
+        game_screen.get_background()
+        assert layer.fill.call_count == 2
+        assert game_screen.full_redraw
+        
+        game_screen.full_redraw = False
+        game_screen.game.current_turn = 1
+        game_screen.get_background()
+        assert layer.fill.call_count == 3
+        assert game_screen.full_redraw
+    
+    def test_hover_change_keeps_background(self, game_screen, mock_theme_manager, mock_pygame):
+        """Test hovering a button repaints only its sprite, not the background layer"""
+        layer = mock_pygame['surface'].convert.return_value
+        game_screen.draw_button_rect = pygame.Rect(3100, 2000, 200, 100)
+        game_screen.message_system.get_rects.return_value = []
+        with patch('pygame.display.update'):
+            game_screen.render()
+        mock_theme_manager.reset_mock()
+        
+        game_screen.draw_button_hover = True
+        game_screen.invalidate(game_screen.draw_button_rect)
+        with patch('pygame.display.update') as mock_update:
+            game_screen.render()
+        
+        assert layer.fill.call_count == 1
+        mock_update.assert_called_once_with([game_screen.draw_button_rect])
+        mock_theme_manager.get_button_sprite.assert_called_once_with(
+            game_screen.draw_button_rect.size, "Draw Tile", 'button_success', hover=True)
+    
+    def test_dirty(self, game_screen):
+        """Test the screen reports pending repaints and active message fades"""
+        game_screen.message_system.get_rects.return_value = []
+        game_screen.message_system.is_active.return_value = False
+        assert game_screen.dirty
+        
+        with patch('pygame.display.update'):
+            game_screen.render()
+        assert not game_screen.dirty
+        
+        game_screen.message_system.is_active.return_value = True
+        assert game_screen.dirty
+        
+        game_screen.message_system.is_active.return_value = False
+        game_screen.invalidate(pygame.Rect(0, 0, 10, 10))
+        assert game_screen.dirty
+    
+    def test_hover_change_invalidates_button(self, game_screen):
+        """Test hovering a button only marks that button dirty"""
+        game_screen.draw_button_rect = pygame.Rect(50, 50, 100, 50)
+        game_screen.end_button_rect = pygame.Rect(50, 150, 100, 50)
+        game_screen.reset_button_rect = pygame.Rect(50, 250, 100, 50)
+        
+        with patch('pygame.mouse.get_pos', return_value=(75, 75)):
+            game_screen.handle_events([])
+            assert game_screen.dirty_rects == [game_screen.draw_button_rect]
+            
+            # No change, nothing new to repaint
+            game_screen.handle_events([])
+            assert game_screen.dirty_rects == [game_screen.draw_button_rect]
+    
+    def test_drag_motion_invalidates_old_and_new_area(self, game_screen, mock_tiles):
+        """Test dragging marks where the tile was and where it moved to"""
+        tile = mock_tiles(1, 5, 'red', 100, 100)
+        old_rect = pygame.Rect(100, 100, 130, 200)
+        new_rect = pygame.Rect(200, 200, 130, 200)
+        type(tile).draw_rect = property(lambda self: new_rect if self.update_drag.called else old_rect)
+        game_screen.dragged_tile = tile
+        game_screen.dirty_rects = []
+        
+        with patch('pygame.mouse.get_pos', return_value=(5000, 5000)):
+            game_screen.handle_events([MagicMock(type=pygame.MOUSEMOTION)])
+        
+        assert game_screen.dirty_rects == [old_rect, new_rect]
+    
     def test_draw_player_tiles(self, game_screen):
         """Test drawing player tiles"""
         # Call draw_player_tiles
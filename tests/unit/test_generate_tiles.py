@@ -0,0 +1,127 @@
+# tests/unit/test_generate_tiles.py
+import importlib
+import os
+import pytest
+import numpy as np
+from unittest.mock import patch
+
+from rummikub.assets import generate_rummikub_tiles as generator
+
+class TestGenerateTiles:
+    """Unit tests for the tile asset generator"""
+
+    @pytest.mark.parametrize("scale", [1, 3])
+    def test_vectorized_base_matches_reference(self, scale):
+        """Test the NumPy shading pass is pixel-identical to the per-pixel loops"""
+        reference = generator.create_tile_base(scale, vectorized=False)
+        vectorized = generator.create_tile_base(scale, vectorized=True)
+
+        assert vectorized.mode == reference.mode
+        assert vectorized.size == reference.size
+        assert np.array_equal(np.array(vectorized), np.array(reference))
+
+    def test_vectorized_number_tile_matches_reference(self):
+        """Test finished number tiles are identical in both modes"""
+        color = generator.COLORS["blue"]
+        reference = generator.create_number_tile(12, "blue", color, vectorized=False)
+        vectorized = generator.create_number_tile(12, "blue", color)
+
+        assert np.array_equal(np.array(vectorized), np.array(reference))
+
+    def test_import_has_no_side_effects(self):
+        """Test importing the generator doesn't create the output folder"""
+        with patch('os.makedirs') as mock_makedirs:
+            importlib.reload(generator)
+            mock_makedirs.assert_not_called()
+
+    def test_parse_args_reference(self):
+        """Test the reference renderer is opt-in"""
+        assert generator.parse_args([]).reference is False
+        assert generator.parse_args(["--reference"]).reference is True
+
+    def test_generate_tiles_incremental(self, tmp_path):
+        """Test a rebuild only renders tiles whose inputs changed"""
+        colors = {"red": generator.COLORS["red"]}
+        paths, regenerated = generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1)
+
+        assert len(paths) == 15  # 13 numbers and two jokers
+        assert len(regenerated) == 15
+        assert all(os.path.exists(path) for path in paths)
+
+        # Nothing changed
+        _, regenerated = generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1)
+        assert regenerated == []
+
+        # A new shade of red only touches the red tiles
+        colors = {"red": (200, 30, 30)}
+        _, regenerated = generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1)
+        assert sorted(regenerated) == sorted(f"tile_{n}_red.png" for n in range(1, 14))
+
+        # Missing outputs are rebuilt even when the manifest matches
+        os.remove(os.path.join(str(tmp_path), "tile_joker_2.png"))
+        _, regenerated = generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1)
+        assert regenerated == ["tile_joker_2.png"]
+
+    def test_generate_tiles_version_and_force(self, tmp_path):
+        """Test bumping the generator version or forcing rebuilds everything"""
+        colors = {"blue": generator.COLORS["blue"]}
+        generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1)
+
+        _, regenerated = generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1, force=True)
+        assert len(regenerated) == 15
+
+        with patch.object(generator, 'GENERATOR_VERSION', generator.GENERATOR_VERSION + 1):
+            _, regenerated = generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1)
+        assert len(regenerated) == 15
+
+    def test_generate_tiles_process_pool(self, tmp_path):
+        """Test tiles rendered in worker processes match in-process rendering"""
+        colors = {"black": generator.COLORS["black"]}
+        pooled_dir = tmp_path / "pooled"
+        serial_dir = tmp_path / "serial"
+        generator.generate_tiles(str(pooled_dir), colors=colors, scale=1, workers=2)
+        generator.generate_tiles(str(serial_dir), colors=colors, scale=1, workers=1)
+
+        for name in os.listdir(serial_dir):
+            if name.endswith(".png"):
+                assert (pooled_dir / name).read_bytes() == (serial_dir / name).read_bytes()
+
+    def test_tiles_rendered_at_target_size(self):
+        """Test tiles can be rendered straight at the in-game size"""
+        number = generator.create_number_tile(5, "orange", generator.THEMES["classic"]["orange"], size=(130, 200))
+        joker = generator.create_joker_tile(None, size=(130, 200))
+
+        assert number.size == (130, 200)
+        assert joker.size == (130, 200)
+        # Rounded corners stay (mostly) transparent, the face is opaque
+        assert number.getpixel((0, 0))[3] < 64
+        assert number.getpixel((65, 20))[3] == 255
+
+    def test_size_is_part_of_the_cache_key(self, tmp_path):
+        """Test changing the tile size re-renders every tile"""
+        colors = {"red": generator.COLORS["red"]}
+        generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1, size=(30, 50))
+
+        _, regenerated = generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1, size=(39, 60))
+        assert len(regenerated) == 15
+
+    def test_joker_rendered_once(self, tmp_path):
+        """Test both joker files come from a single render"""
+        colors = {"red": generator.COLORS["red"]}
+        with patch.object(generator, 'create_joker_tile', wraps=generator.create_joker_tile) as mock_joker:
+            generator.generate_tiles(str(tmp_path), colors=colors, scale=1, workers=1)
+
+        mock_joker.assert_called_once()
+        assert (tmp_path / "tile_joker_1.png").read_bytes() == (tmp_path / "tile_joker_2.png").read_bytes()
+
+    def test_load_font_walks_font_candidates(self):
+        """Test rendering uses the same font chains the cache fingerprint hashes"""
+        missing = {True: ("no-such-font.ttf",), False: ("no-such-font.ttf",)}
+        with patch.object(generator, 'FONT_CANDIDATES', missing):
+            font, size = generator.load_font(30, bold=True)
+            assert size == 10
+            assert generator.font_fingerprint() == [None, None]
+
+        font, size = generator.load_font(30, bold=False)
+        assert size == 30
+        assert getattr(font, 'path', None) in generator.font_fingerprint()
@@ -0,0 +1,115 @@
+# tests/unit/test_image_cache.py
+import json
+import pygame
+from unittest.mock import MagicMock, patch
+
+from rummikub.image_cache import ImageCache, ATLAS_IMAGE, ATLAS_INDEX
+from rummikub.deck import Deck
+
+
+class TestImageCache:
+    """Unit tests for the shared image cache"""
+
+    def test_load_decodes_once(self):
+        """Test repeated loads of one path decode the file once"""
+        with patch('pygame.image.load', return_value=MagicMock()) as mock_load:
+            first = ImageCache.load("a.png")
+            second = ImageCache.load("a.png")
+
+            assert first is second
+            mock_load.assert_called_once_with("a.png")
+
+    def test_scaled_copies_are_shared_per_size(self):
+        """Test each (path, size) is scaled once and reuses the decoded original"""
+        original = MagicMock()
+        with patch('pygame.image.load', return_value=original) as mock_load, \
+             patch('pygame.transform.smoothscale', side_effect=lambda img, size: MagicMock()) as mock_scale:
+            small = ImageCache.load("a.png", (10, 20))
+            assert ImageCache.load("a.png", (10, 20)) is small
+            large = ImageCache.load("a.png", (30, 40))
+
+            assert large is not small
+            mock_load.assert_called_once_with("a.png")
+            assert mock_scale.call_count == 2
+            mock_scale.assert_any_call(original, (10, 20))
+
+    def test_converts_once_display_exists(self):
+        """Test scaled surfaces are converted to the display format when possible"""
+        scaled = MagicMock()
+        with patch('pygame.image.load'), \
+             patch('pygame.transform.smoothscale', return_value=scaled), \
+             patch('pygame.display.get_surface', return_value=MagicMock()):
+            surface = ImageCache.load("a.png", (10, 20))
+
+            scaled.convert_alpha.assert_called_once()
+            assert surface is scaled.convert_alpha.return_value
+
+    def test_clear(self):
+        """Test clearing the cache forces a reload"""
+        with patch('pygame.image.load') as mock_load:
+            ImageCache.load("a.png")
+            assert ImageCache.size() == 1
+
+            ImageCache.clear()
+            assert ImageCache.size() == 0
+
+            ImageCache.load("a.png")
+            assert mock_load.call_count == 2
+
+    def test_new_deck_shares_surfaces(self):
+        """Test duplicate tiles and later decks reuse the same surfaces"""
+        with patch('os.listdir', return_value=['tile_1_red.png', 'tile_joker_1.png']), \
+             patch('pygame.image.load', side_effect=lambda path: pygame.Surface((60, 100))) as mock_load:
+            first = Deck("rummikub/assets/tiles_2")
+            second = Deck("rummikub/assets/tiles_2")
+
+            # Two image files, each decoded exactly once across both decks
+            assert mock_load.call_count == 2
+            reds = [tile for tile in first.tiles + second.tiles if tile.color == "red"]
+            assert len({id(tile.image) for tile in reds}) == 1
+
+    def test_atlas_backed_deck(self, tmp_path):
+        """Test a deck built from an atlas opens one image file and uses subsurfaces"""
+        atlas = pygame.Surface((260, 200), pygame.SRCALPHA)
+        atlas.fill((255, 0, 0, 255), pygame.Rect(0, 0, 130, 200))
+        atlas.fill((0, 0, 255, 255), pygame.Rect(130, 0, 130, 200))
+        pygame.image.save(atlas, str(tmp_path / ATLAS_IMAGE))
+        index = {"image": ATLAS_IMAGE, "tiles": {
+            "tile_1_red.png": [0, 0, 130, 200],
+            "tile_joker_1.png": [130, 0, 130, 200],
+        }}
+        (tmp_path / ATLAS_INDEX).write_text(json.dumps(index))
+
+        real_load = pygame.image.load
+        with patch('os.listdir') as mock_listdir, \
+             patch('pygame.image.load', side_effect=real_load) as mock_load:
+            deck = Deck(str(tmp_path))
+
+            mock_listdir.assert_not_called()
+            mock_load.assert_called_once_with(str(tmp_path / ATLAS_IMAGE))
+
+        assert len(deck) == 3
+        joker = next(tile for tile in deck.tiles if tile.is_joker)
+        assert joker.original_image.get_parent() is not None
+        assert joker.image.get_at((0, 0)) == pygame.Color(0, 0, 255, 255)
+
+
+    def test_atlas_converted_once(self, tmp_path):
+        """Test the atlas is converted as a whole and tiles stay subsurfaces of it"""
+        atlas = pygame.Surface((260, 200), pygame.SRCALPHA)
+        pygame.image.save(atlas, str(tmp_path / ATLAS_IMAGE))
+        index = {"image": ATLAS_IMAGE, "tiles": {
+            "tile_1_red.png": [0, 0, 130, 200],
+            "tile_2_red.png": [130, 0, 130, 200],
+        }}
+        (tmp_path / ATLAS_INDEX).write_text(json.dumps(index))
+        ImageCache.register_atlas(str(tmp_path / ATLAS_INDEX))
+
+        with patch.object(ImageCache, '_optimize', side_effect=lambda surface: surface.copy()) as mock_optimize:
+            red_1 = ImageCache.load(str(tmp_path / "tile_1_red.png"), (130, 200))
+            red_2 = ImageCache.load(str(tmp_path / "tile_2_red.png"), (130, 200))
+
+        mock_optimize.assert_called_once()
+        converted = ImageCache.load(str(tmp_path / ATLAS_IMAGE))
+        assert red_1.get_parent() is converted
+        assert red_2.get_parent() is converted
@@ -5,6 +5,8 @@ import pygame_menu
 import os
 from unittest.mock import MagicMock, patch, call, ANY
 
+from pygame_menu.widgets import TextInput
+
 from rummikub.screens.menu import SetupMenu, TurnMenu
 from rummikub.player import Player
 from rummikub.deck import Deck
@@ -135,8 +137,7 @@ class TestMenus:
         """Create a SetupMenu instance with mocked dependencies"""
         # Patch the _add_tile_row method to avoid comparison issues
         with patch('rummikub.screens.menu.SetupMenu._add_tile_row') as mock_add_tile_row, \
-             patch('rummikub.screens.menu.Player'), \
-             patch('rummikub.screens.menu.Deck'):
+             patch('rummikub.screens.menu.Player'):
             
             # Create the setup menu
             menu = SetupMenu(mock_game)
@@ -184,28 +185,30 @@ class TestMenus:
             # Create the SetupMenu
             menu = SetupMenu(mock_game)
             
-            # Verify menu creation
+            # Verify only the main page is built up front
             assert menu.current_page == "MAIN"
-            assert "MAIN" in menu.menus
-            assert "RULES" in menu.menus
-            assert "EXAMPLES" in menu.menus
-            assert "SETUP" in menu.menus
+            assert list(menu.menus) == ["MAIN"]
+            mock_rules.assert_not_called()
+            mock_examples.assert_not_called()
+            mock_setup.assert_not_called()
+            mock_main.assert_called_once_with(None)  # No end_message
             
-            # Verify the menu creation methods were called
+            # Pages are built on first visit and reused afterwards
+            menu._show_rules()
+            menu._show_main()
+            menu._show_rules()
             mock_rules.assert_called_once()
-            mock_examples.assert_called_once()
-            mock_setup.assert_called_once()
-            mock_main.assert_called_once_with(None)  # No end_message
+            assert menu.menu is mock_rules.return_value
+            mock_examples.assert_not_called()
         
-        # Verify Menu constructor was called at least 4 times
-        assert mock_pygame_menu['Menu'].call_count >= 4  # MAIN, RULES, EXAMPLES, SETUP
+        # Verify Menu constructor was only called for the main page
+        assert mock_pygame_menu['Menu'].call_count == 1
     
     def test_setup_menu_initialization_with_end_message(self, mock_pygame, mock_pygame_menu, mock_game, mock_os_path_exists):
         """Test SetupMenu initialization with end message"""
         # Patch the _add_tile_row method to avoid comparison issues
         with patch('rummikub.screens.menu.SetupMenu._add_tile_row'), \
-             patch('rummikub.screens.menu.Player'), \
-             patch('rummikub.screens.menu.Deck'):
+             patch('rummikub.screens.menu.Player'):
             
             # Create the setup menu with end message
             end_message = "Player 1 wins the game!"
@@ -272,54 +275,20 @@ class TestMenus:
     
     def test_add_tile_row(self, mock_pygame, mock_pygame_menu, mock_os_path_exists):
         """Test adding a tile row to a menu"""
-        # Instead of using the fixture, we'll directly test the method
-        # by creating a minimal class with just what we need
-        class MockSetupMenu:
-            def _add_tile_row(self, menu, tile_filenames):
-                tile_width, tile_height = 100, 150
-                
-                # Create a surface to hold the tile row
-                total_width = (tile_width + 10) * len(tile_filenames)
-                surface = pygame.Surface((total_width, tile_height), pygame.SRCALPHA)
-                
-                # Add tiles to the surface
-                for i, filename in enumerate(tile_filenames):
-                    tile_path = os.path.join("./rummikub/assets/tiles_2/", filename)
-                    if os.path.exists(tile_path):
-                        image = pygame.image.load(tile_path)
-                        scaled_image = pygame.transform.scale(image, (tile_width, tile_height))
-                        surface.blit(scaled_image, (i * (tile_width + 10), 0))
-                
-                # Save the surface as a temporary image
-                temp_file = "./rummikub/assets/tiles_2/temp_row.png"
-                pygame.image.save(surface, temp_file)
-                
-                # Add the image to the menu
-                tile_row = pygame_menu.BaseImage(temp_file)
-                menu.add.image(tile_row)
-        
-        # Create instance with the method
-        mock_setup = MockSetupMenu()
-        
-        # Reset the mocks
-        mock_pygame['load'].reset_mock()
-        mock_pygame['surface_instance'].reset_mock()
-        mock_pygame['save'].reset_mock()
-        mock_pygame_menu['BaseImage'].reset_mock()
-        
-        # Create a test menu with a mock add.image method
+        # Create a test menu with a mock add.surface method
         test_menu = MagicMock()
-        test_menu.add = MagicMock()
-        test_menu.add.image = MagicMock()
         
         # Specify explicit tile filenames (actual strings)
         tile_filenames = ["tile_8_red.png", "tile_8_blue.png", "tile_8_black.png"]
         
-        # Call add_tile_row using our mock classes
-        mock_setup._add_tile_row(test_menu, tile_filenames)
-        
-        # Verify pygame.image.load was called for each tile filename
-        assert mock_pygame['load'].call_count == len(tile_filenames)
+        with patch('rummikub.screens.menu.ImageCache') as mock_cache:
+            SetupMenu._add_tile_row(MagicMock(), test_menu, tile_filenames)
+            
+            # Verify each tile was loaded at menu size through the image cache
+            assert mock_cache.load.call_args_list == [
+                call(os.path.join("./rummikub/assets/tiles_2/", name), (100, 150))
+                for name in tile_filenames
+            ]
         
         # Verify pygame.Surface was created
         mock_pygame['surface'].assert_called_once()
@@ -327,14 +296,10 @@ class TestMenus:
         # Verify surface.blit was called for each tile
         assert mock_pygame['surface_instance'].blit.call_count == len(tile_filenames)
         
-        # Verify pygame.image.save was called to save the temp image
-        mock_pygame['save'].assert_called_once()
-        
-        # Verify BaseImage was created from the temp file
-        mock_pygame_menu['BaseImage'].assert_called_once()
-        
-        # Verify the image was added to the menu
-        test_menu.add.image.assert_called_once()
+        # Verify the row never touches the disk and is handed to the menu directly
+        mock_pygame['save'].assert_not_called()
+        mock_pygame_menu['BaseImage'].assert_not_called()
+        test_menu.add.surface.assert_called_once_with(mock_pygame['surface_instance'])
     
     def test_submit_names_valid(self, mock_game, mock_pygame_menu):
         """Test submitting valid player names"""
@@ -350,8 +315,9 @@ class TestMenus:
                 names = [name.strip() for name in self.name_input.get_value().split(",") if name.strip()]
                 
                 if 2 <= len(names) <= 4:
-                    # Reset the game state
-                    self.game.deck = Deck("./rummikub/assets/tiles_2")
+                    # Reset the game state, reshuffling the tiles already loaded
+                    self.game.deck.reset()
+                    self.game.clear_table()
                     self.game.players = [Player(self.game, name) for name in names]
                     self.game.current_turn = 0
                     self.game.game_over = False
@@ -388,8 +354,7 @@ class TestMenus:
         
         # Mock dependencies
         with patch('rummikub.screens.menu.TurnMenu') as MockTurnMenu, \
-             patch('rummikub.screens.menu.Player') as MockPlayer, \
-             patch('rummikub.screens.menu.Deck') as MockDeck:
+             patch('rummikub.screens.menu.Player') as MockPlayer:
             
             # Configure mocks
             mock_turn_menu = MagicMock()
@@ -398,8 +363,9 @@ class TestMenus:
             # Call submit_names
             setup_menu.submit_names()
             
-            # Verify Deck was created
-            MockDeck.assert_called_once_with("./rummikub/assets/tiles_2")
+            # Verify the existing deck was reshuffled instead of reloaded
+            mock_game.deck.reset.assert_called_once_with()
+            mock_game.clear_table.assert_called_once_with()
             
             # Verify Player instances were created for each name (3 players)
             assert MockPlayer.call_count == 3
@@ -422,8 +388,9 @@ class TestMenus:
                 names = [name.strip() for name in self.name_input.get_value().split(",") if name.strip()]
                 
                 if 2 <= len(names) <= 4:
-                    # Reset the game state
-                    self.game.deck = Deck("./rummikub/assets/tiles_2")
+                    # Reset the game state, reshuffling the tiles already loaded
+                    self.game.deck.reset()
+                    self.game.clear_table()
                     self.game.players = [Player(self.game, name) for name in names]
                     self.game.current_turn = 0
                     self.game.game_over = False
@@ -623,6 +590,30 @@ class TestMenus:
         # Verify menu.draw was called with surface
         turn_menu.menu.draw.assert_called_once_with(surface)
     
+    def test_dirty_tracking(self, turn_menu):
+        """Test the menu only asks for a redraw after input or a menu change"""
+        assert turn_menu.dirty
+        
+        turn_menu.draw(MagicMock())
+        assert not turn_menu.dirty
+        
+        turn_menu.menu.update.return_value = False
+        turn_menu.handle_events([])
+        assert not turn_menu.dirty
+        
+        turn_menu.handle_events([MagicMock()])
+        assert turn_menu.dirty
+    
+    def test_focused_text_input_keeps_redrawing(self, turn_menu):
+        """Test a focused text input keeps the menu dirty so its cursor blinks"""
+        turn_menu.menu.get_selected_widget.return_value = MagicMock(spec=TextInput)
+        turn_menu.draw(MagicMock())
+        assert turn_menu.dirty
+        
+        turn_menu.menu.get_selected_widget.return_value = None
+        turn_menu.draw(MagicMock())
+        assert not turn_menu.dirty
+    
     def test_random_tips(self, mock_pygame_menu, mock_game):
         """Test that different tips can be displayed"""
         # Patch random.choice to return specific values
@@ -16,6 +16,7 @@ class TestMessage:
             # Mock the necessary methods
             mock_tm.get_font.return_value = MagicMock(spec=pygame.font.Font)
             mock_tm.get_font.return_value.render.return_value = MagicMock(spec=pygame.Surface)
+            mock_tm.render_text.return_value = MagicMock(spec=pygame.Surface)
             
             mock_tm.get_color.return_value = (255, 255, 255)  # White
             
@@ -111,18 +112,17 @@ class TestMessage:
         mock_surface.get_width.return_value = 800
         
         # Get mocked text surface
-        text_surf = mock_theme_manager.get_font.return_value.render.return_value
+        text_surf = mock_theme_manager.render_text.return_value
         text_surf.get_width.return_value = 200
         
         # Draw the message
         message.draw(mock_surface)
         
-        # Verify font and color were requested
-        mock_theme_manager.get_font.assert_called_once_with("normal")
-        mock_theme_manager.get_color.assert_called_once_with("text")
+        # Verify the text was taken from the shared text cache
+        mock_theme_manager.render_text.assert_called_once_with("Draw test", "normal", "text")
         
-        # Verify text surface was created and had alpha set
-        text_surf.set_alpha.assert_called_once_with(200)
+        # Verify the shared surface was faded for this blit only
+        assert text_surf.set_alpha.call_args_list == [((200,),), ((None,),)]
         
         # Verify surface was blitted at calculated position (centered)
         expected_x = 300  # (800 - 200) / 2
@@ -140,7 +140,7 @@ class TestMessage:
         mock_surface = MagicMock(spec=pygame.Surface)
         
         # Get mocked text surface
-        text_surf = mock_theme_manager.get_font.return_value.render.return_value
+        text_surf = mock_theme_manager.render_text.return_value
         
         # Draw the message
         message.draw(mock_surface)
@@ -150,6 +150,17 @@ class TestMessage:
         args, _ = mock_surface.blit.call_args
         assert args[1] == (50, 60)
 
+    
+    def test_message_get_rect(self, mock_theme_manager):
+        """Test the message area is measured without rendering"""
+        mock_theme_manager.get_font.return_value.size.return_value = (200, 40)
+        mock_surface = MagicMock(spec=pygame.Surface)
+        mock_surface.get_width.return_value = 800
+        
+        assert Message("Centered").get_rect(mock_surface, default_y=150) == pygame.Rect(300, 150, 200, 40)
+        assert Message("Fixed", position=(50, 60)).get_rect(mock_surface) == pygame.Rect(50, 60, 200, 40)
+        mock_theme_manager.get_font.return_value.render.assert_not_called()
+
 
 class TestMessageSystem:
     """Unit tests for the MessageSystem class"""
@@ -0,0 +1,100 @@
+# tests/unit/test_rules.py
+import subprocess
+import sys
+
+import pytest
+
+from rummikub import rules
+from rummikub.rules import TileSpec
+
+
+class TestRules:
+    """Unit tests for the headless rules engine"""
+
+    def test_rules_do_not_import_pygame(self):
+        """The rules package must be importable without pygame"""
+        code = "import sys, rummikub.rules; sys.exit('pygame' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=".")
+        assert result.returncode == 0
+
+    def test_to_spec_from_tile_like(self):
+        """Test building a TileSpec from any tile-like object"""
+        class FakeTile:
+            id, number, color = 7, 9, "blue"
+
+        spec = rules.to_spec(FakeTile())
+        assert spec == TileSpec(7, 9, "blue", False)
+        assert rules.to_spec(spec) is spec
+
+    def test_valid_group(self, spec):
+        """Test group validation with and without jokers"""
+        assert rules.is_valid_group([spec(8, "red"), spec(8, "blue"), spec(8, "black")])
+        assert rules.is_valid_group([spec(8, "red"), spec(8, "blue"), spec(0, "joker", True)])
+        assert not rules.is_valid_group([spec(8, "red"), spec(8, "red"), spec(8, "black")])
+        assert not rules.is_valid_group([spec(8, "red"), spec(9, "blue"), spec(8, "black")])
+        assert not rules.is_valid_group([spec(0, "joker", True)] * 3)
+
+    def test_valid_run(self, spec):
+        """Test run validation with gaps, jokers and duplicates"""
+        assert rules.is_valid_run([spec(3, "red"), spec(4, "red"), spec(5, "red")])
+        assert rules.is_valid_run([spec(3, "red"), spec(0, "joker", True), spec(5, "red")])
+        assert not rules.is_valid_run([spec(3, "red"), spec(5, "red"), spec(7, "red")])
+        assert not rules.is_valid_run([spec(3, "red"), spec(3, "red"), spec(4, "red")])
+        assert not rules.is_valid_run([spec(3, "red"), spec(4, "blue"), spec(5, "red")])
+
+    def test_validate_sets(self, spec):
+        """Test validating a whole table of sets"""
+        group = [spec(8, "red"), spec(8, "blue"), spec(8, "black")]
+        run = [spec(1, "orange"), spec(2, "orange"), spec(3, "orange")]
+        bad = [spec(1, "orange"), spec(9, "blue")]
+
+        assert rules.validate_sets([group, run])
+        assert not rules.validate_sets([group, bad, run])
+        assert rules.find_invalid_set([group, bad, run]) is bad
+
+    def test_run_joker_values(self):
+        """Test jokers fill gaps first, then extend downward, then upward"""
+        assert rules.run_joker_values([3, 5, 7], 2) == [4, 6]
+        assert rules.run_joker_values([3, 4, 5], 2) == [2, 1]
+        assert rules.run_joker_values([1, 2], 1) == [3]
+
+
+class TestMeldTable:
+    """Unit tests for the precomputed legal meld table"""
+
+    def test_table_matches_validators(self):
+        """Every random multiset from a real tile set is classified like the validators"""
+        import random
+        from rummikub.rules.encoding import COLORS
+
+        rng = random.Random(7)
+        full_set = [TileSpec(i, n, c) for i, (n, c) in enumerate(
+            (n, c) for c in COLORS for n in range(1, 14) for _ in range(2))]
+        full_set += [TileSpec(104, 0, "joker", True), TileSpec(105, 0, "joker", True)]
+        same_color = {c: [t for t in full_set if t.color == c] + full_set[-2:] for c in COLORS}
+
+        for _ in range(20000):
+            pool = same_color[rng.choice(COLORS)] if rng.random() < 0.5 else full_set
+            tiles = rng.sample(pool, rng.randint(1, 6))
+            kind = rules.meld_kind(tiles)
+            assert bool(kind & rules.GROUP) == rules.is_valid_group(tiles)
+            assert bool(kind & rules.RUN) == rules.is_valid_run(tiles)
+
+    def test_table_contains_every_legal_run(self):
+        """Long runs with joker gaps are present"""
+        joker = TileSpec(0, 0, "joker", True)
+        run = [TileSpec(0, n, "blue") for n in range(1, 14) if n not in (4, 9)]
+        assert rules.meld_kind(run + [joker, joker]) == rules.RUN
+        assert rules.meld_kind(run + [joker]) == 0
+
+    def test_signature_is_order_independent(self):
+        """Signatures are canonical over tile order"""
+        tiles = [TileSpec(0, 8, "red"), TileSpec(1, 8, "blue"), TileSpec(2, 0, "joker", True)]
+        assert rules.meld_signature(tiles) == rules.meld_signature(reversed(tiles))
+        assert rules.meld_kind(tiles) == rules.GROUP
+
+    def test_unencodable_tiles_are_not_legal(self):
+        """Tiles outside the standard set never form a legal meld"""
+        tiles = [TileSpec(0, 8, "green"), TileSpec(1, 8, "blue"), TileSpec(2, 8, "red")]
+        assert rules.meld_signature(tiles) is None
+        assert not rules.is_legal_meld(tiles)
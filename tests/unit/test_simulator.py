@@ -0,0 +1,96 @@
+# tests/unit/test_simulator.py
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from rummikub.simulator import GameResult, Simulator, SimulationReport, main
+
+
+class TestSimulator:
+    """Unit tests for the headless game simulator"""
+
+    @pytest.fixture
+    def simulator(self):
+        """Fast greedy players with a short turn limit"""
+        return Simulator(('greedy', 'greedy'), max_turns=200)
+
+    def test_simulator_does_not_import_pygame(self):
+        """The simulator must be importable without pygame, so worker processes stay light"""
+        code = "import sys, rummikub.simulator; sys.exit('pygame' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=".")
+        assert result.returncode == 0
+
+    def test_rejects_bad_seats(self):
+        """Test the seat count and strategy names are validated"""
+        with pytest.raises(ValueError):
+            Simulator(('greedy',))
+        with pytest.raises(ValueError):
+            Simulator(('greedy', 'random'))
+
+    def test_deal_is_seeded(self, simulator):
+        """Test the deal depends only on the seed"""
+        first = [tile.id for tile in simulator.deal(7).tiles]
+        assert first == [tile.id for tile in simulator.deal(7).tiles]
+        assert first != [tile.id for tile in simulator.deal(8).tiles]
+        assert sorted(first) == list(range(106))
+
+    def test_play_is_reproducible(self, simulator):
+        """Test a game plays out the same way from the same seed"""
+        result = simulator.play(3)
+
+        assert result == simulator.play(3)
+        assert result.turns <= 200
+        if result.winner is not None and result.turns < 200:
+            assert result.rack_points[result.winner] == min(result.rack_points)
+
+    def test_strategies_kept_between_games(self, simulator):
+        """Test seats keep their strategies across games but not into worker processes"""
+        strategies = simulator.get_strategies()
+        simulator.play(1)
+        assert simulator.get_strategies() is strategies
+
+        assert pickle.loads(pickle.dumps(simulator))._seat_strategies is None
+
+    def test_mcts_workers_option(self):
+        """Test the mcts worker count reaches mcts seats only"""
+        simulator = Simulator(('mcts', 'greedy'), mcts_workers=3)
+        mcts, greedy = simulator.get_strategies()
+
+        assert mcts.workers == 3
+        assert not hasattr(greedy, 'workers')
+
+    def test_report_aggregation(self):
+        """Test results are counted per seat and merged across chunks"""
+        results = [GameResult(0, 1, 40, 10, (12, 0)), GameResult(1, None, 200, 50, (5, 5))]
+        report = SimulationReport.from_results(results, seats=2)
+
+        assert report == SimulationReport(2, (0, 1), 1, 240, 60)
+        merged = report.merge(report._replace(elapsed=2.0))
+        assert merged.wins == (0, 2)
+        assert merged.games_per_second == 2.0
+        assert merged.mean_turns == 120
+
+    def test_process_pool_matches_in_process(self, simulator):
+        """Test worker processes produce the same totals as playing in-process"""
+        serial = simulator.run(6, seed=10, workers=1)
+        pooled = simulator.run(6, seed=10, workers=2, chunk_size=2)
+
+        assert serial.games == pooled.games == 6
+        assert serial._replace(elapsed=0) == pooled._replace(elapsed=0)
+        assert serial.elapsed > 0
+
+    def test_parallel_mcts_in_worker_processes(self):
+        """Test jobs that search on their own shared pool still exit cleanly"""
+        args = ["--games", "2", "--jobs", "2", "--strategies", "mcts", "greedy",
+                "--mcts-workers", "2", "--max-turns", "4", "--time-budget", "0.2"]
+        result = subprocess.run([sys.executable, "-m", "rummikub.simulator"] + args, cwd=".", timeout=60)
+        assert result.returncode == 0
+
+    def test_main(self, capsys):
+        """Test the command line reports games per second"""
+        report = main(["--games", "2", "--jobs", "1", "--strategies", "greedy", "greedy", "--max-turns", "50"])
+
+        assert report.games == 2
+        assert "games/s" in capsys.readouterr().out
@@ -0,0 +1,167 @@
+# tests/unit/test_solver.py
+import itertools
+import random
+import time
+
+import pytest
+
+from rummikub import rules
+from rummikub.rules import TileSpec, solve
+from rummikub.rules.encoding import COLORS
+
+
+def full_set():
+    """Every tile of a standard 106-tile game"""
+    tiles = [TileSpec(i, n, c) for i, (n, c) in enumerate(
+        (n, c) for c in COLORS for n in range(1, 14) for _ in range(2))]
+    return tiles + [TileSpec(104, 0, "joker", True), TileSpec(105, 0, "joker", True)]
+
+
+def partitionable(tiles):
+    """Brute force: can the tiles be split into valid sets?"""
+    if not tiles:
+        return True
+    first, rest = tiles[0], tiles[1:]
+    for size in range(2, len(rest) + 1):
+        for picked in itertools.combinations(range(len(rest)), size):
+            if rules.is_valid_set([first] + [rest[i] for i in picked]):
+                if partitionable([tile for i, tile in enumerate(rest) if i not in picked]):
+                    return True
+    return False
+
+
+class TestSolver:
+    """Unit tests for the move solver"""
+
+    def assert_solution(self, solution, table, rack):
+        """Every table tile and played tile is on the table exactly once, in valid sets"""
+        placed = [tile for meld in solution.melds for tile in meld]
+        assert rules.validate_sets(solution.melds)
+        assert sorted(t.id for t in placed) == sorted(t.id for t in list(table) + solution.played)
+        assert {t.id for t in solution.played} <= {t.id for t in rack}
+
+    def test_plays_run_and_group(self, spec):
+        """Test the rack is laid out as a run and a group"""
+        rack = [spec(3, "red"), spec(4, "red"), spec(5, "red"),
+                spec(9, "red"), spec(9, "blue"), spec(9, "black"), spec(12, "orange")]
+        solution = solve([], rack)
+
+        self.assert_solution(solution, [], rack)
+        assert len(solution.played) == 6
+        assert solution.points == 3 + 4 + 5 + 27
+
+    def test_rearranges_table(self, spec):
+        """Test table sets are split to fit rack tiles"""
+        table = [spec(n, "blue") for n in range(1, 8)]
+        rack = [spec(4, "red"), spec(4, "black")]
+        solution = solve(table, rack)
+
+        self.assert_solution(solution, table, rack)
+        assert len(solution.played) == 2
+
+    def test_jokers(self, spec):
+        """Test jokers fill gaps in runs and groups, including a table joker"""
+        table_joker = spec(0, "joker", True)
+        table = [spec(7, "black"), table_joker, spec(9, "black")]
+        rack = [spec(2, "orange"), spec(4, "orange"), spec(0, "joker", True),
+                spec(11, "red"), spec(11, "blue"), spec(11, "black")]
+        solution = solve(table, rack)
+
+        self.assert_solution(solution, table, rack)
+        assert len(solution.played) == 6
+
+    def test_table_tiles_must_stay_in_sets(self, spec):
+        """Test an impossible table has no solution"""
+        assert solve([spec(5, "red")], [spec(9, "blue")]) is None
+
+    def test_nothing_to_play(self, spec):
+        """Test a valid table with no playable rack tiles"""
+        table = [spec(1, "red"), spec(2, "red"), spec(3, "red")]
+        solution = solve(table, [spec(9, "blue")])
+
+        self.assert_solution(solution, table, [])
+        assert solution.played == []
+
+    def test_initial_meld_needs_thirty_points(self, spec):
+        """Test the initial meld ignores the table and needs 30 points from the rack"""
+        table = [spec(4, "black"), spec(5, "black"), spec(6, "black")]
+        low = [spec(1, "red"), spec(2, "red"), spec(3, "red"), spec(7, "black")]
+        assert solve(table, low, initial_meld=False).played == []
+
+        high = [spec(10, "red"), spec(11, "red"), spec(12, "red"), spec(1, "blue"), spec(2, "blue"), spec(3, "blue")]
+        solution = solve(table, high, initial_meld=False)
+        assert len(solution.played) == 6
+        assert solution.points == 39
+        assert all(tile.id not in {t.id for t in table} for meld in solution.melds for tile in meld)
+
+    def test_initial_meld_prefers_reaching_thirty(self, spec):
+        """Test a meld worth 30 beats playing more, cheaper tiles"""
+        rack = [spec(1, "red"), spec(2, "red"), spec(3, "red"), spec(4, "red"),
+                spec(10, "blue"), spec(10, "black"), spec(10, "orange")]
+        solution = solve([], rack, initial_meld=False)
+
+        assert solution.points >= rules.INITIAL_MELD_POINTS
+        assert len(solution.played) == 7
+
+    def test_points_objective(self, spec):
+        """Test the points objective prefers high tiles over more tiles"""
+        rack = [spec(1, "red"), spec(2, "red"), spec(3, "red"), spec(4, "red"),
+                spec(13, "red"), spec(13, "blue"), spec(0, "joker", True)]
+        by_tiles = solve([], rack)
+        by_points = solve([], rack, objective=rules.POINTS)
+
+        assert len(by_tiles.played) == 7
+        assert by_points.points >= by_tiles.points
+
+    def test_unknown_objective(self):
+        """Test the objective is validated"""
+        with pytest.raises(ValueError):
+            solve([], [], objective="speed")
+
+    def test_matches_brute_force(self):
+        """Test the solver plays as many tiles as an exhaustive search"""
+        rng = random.Random(11)
+        small_set = [TileSpec(i, n, c) for i, (n, c) in enumerate(
+            (n, c) for c in COLORS[:3] for n in range(1, 7) for _ in range(2))]
+        jokers = [TileSpec(900, 0, "joker", True), TileSpec(901, 0, "joker", True)]
+
+        for _ in range(40):
+            pool = small_set + (jokers if rng.random() < 0.5 else [])
+            rng.shuffle(pool)
+            table = [tile for meld in solve([], pool[:8]).melds for tile in meld]
+            rack = pool[8:8 + rng.randint(3, 6)]
+
+            best = max(size for size in range(len(rack) + 1)
+                       for subset in itertools.combinations(rack, size)
+                       if partitionable(table + list(subset)))
+            solution = solve(table, rack)
+            self.assert_solution(solution, table, rack)
+            assert len(solution.played) == best
+
+    def test_full_game_position(self):
+        """Test a late-game position from the full tile set is solved quickly"""
+        rng = random.Random(3)
+        tiles = full_set()
+        rng.shuffle(tiles)
+        table = [tile for meld in solve([], tiles[:70]).melds for tile in meld]
+        rack = tiles[70:90]
+
+        start = time.perf_counter()
+        solution = solve(table, rack)
+        elapsed = time.perf_counter() - start
+
+        self.assert_solution(solution, table, rack)
+        assert elapsed < 2.0
+
+    def test_deadline_stops_search_promptly(self):
+        """Test a search that can't finish in time gives up close to its deadline"""
+        rng = random.Random(3)
+        tiles = full_set()
+        rng.shuffle(tiles)
+        table = [tile for meld in solve([], tiles[:90]).melds for tile in meld]
+        rack = tiles[90:]
+
+        deadline = time.monotonic() + 0.15
+        with pytest.raises(TimeoutError):
+            solve(table, rack, deadline=deadline)
+        assert time.monotonic() - deadline < 0.03
@@ -128,6 +128,41 @@ class TestThemeManager:
         # Verify font.render was called with default parameters
         mock_font.render.assert_called_once_with("Test Text", True, ThemeManager.COLORS["text"])
     
+    def test_render_text_cached(self, reset_font_cache, mock_pygame_font):
+        """Test repeated renders of the same text are served from the cache"""
+        _, _, mock_font = mock_pygame_font
+        ThemeManager.initialize()
+        
+        first = ThemeManager.render_text("Cached", "heading", "highlight")
+        second = ThemeManager.render_text("Cached", "heading", "highlight")
+        
+        assert first is second
+        mock_font.render.assert_called_once()
+        assert ThemeManager.text_cache_hits == 1
+        assert ThemeManager.text_cache_misses == 1
+        
+        # A different color is a different entry
+        ThemeManager.render_text("Cached", "heading", "text")
+        assert mock_font.render.call_count == 2
+    
+    def test_render_text_cache_evicts_least_recently_used(self, reset_font_cache, mock_pygame_font):
+        """Test the text cache stays bounded and evicts the oldest entry"""
+        _, _, mock_font = mock_pygame_font
+        mock_font.render.side_effect = lambda *args: MagicMock(spec=pygame.Surface)
+        ThemeManager.initialize()
+        
+        with patch.object(ThemeManager, 'TEXT_CACHE_SIZE', 2):
+            ThemeManager.render_text("a")
+            ThemeManager.render_text("b")
+            ThemeManager.render_text("a")  # 'b' is now least recently used
+            ThemeManager.render_text("c")
+            
+            assert len(ThemeManager._text_cache) == 2
+            ThemeManager.render_text("a")
+            assert mock_font.render.call_count == 3
+            ThemeManager.render_text("b")
+            assert mock_font.render.call_count == 4
+    
     def test_draw_button(self, reset_font_cache, mock_pygame_font):
         """Test drawing a button"""
         _, _, mock_font = mock_pygame_font
@@ -147,6 +182,7 @@ class TestThemeManager:
         
         # Patch pygame.draw.rect to prevent it from being called with our mock
         with patch('pygame.draw.rect') as mock_draw_rect, \
+            patch('pygame.Surface'), \
             patch.object(ThemeManager, 'render_text', return_value=mock_text_surf) as mock_render:
             
             # Draw a button
@@ -159,6 +195,28 @@ class TestThemeManager:
             assert mock_surface.blit.called
             assert mock_draw_rect.call_count == 2
     
+    def test_draw_button_reuses_sprite(self, reset_font_cache, mock_pygame_font):
+        """Test each button state is rendered once and then only blitted"""
+        ThemeManager.initialize()
+        surface = pygame.Surface((400, 200))
+        rect = pygame.Rect(10, 10, 200, 100)
+        
+        with patch('pygame.draw.rect') as mock_draw_rect, \
+            patch.object(ThemeManager, 'render_text', return_value=pygame.Surface((50, 20))):
+            for _ in range(3):
+                ThemeManager.draw_button(surface, rect, "Draw Tile", color_name='button_success')
+            assert mock_draw_rect.call_count == 2
+            
+            # Hovering builds one more sprite
+            for _ in range(3):
+                ThemeManager.draw_button(surface, rect, "Draw Tile", color_name='button_success', hover=True)
+            assert mock_draw_rect.call_count == 4
+            
+            normal = ThemeManager.get_button_sprite((200, 100), "Draw Tile", 'button_success')
+            hover = ThemeManager.get_button_sprite((200, 100), "Draw Tile", 'button_success', hover=True)
+            assert normal is not hover
+            assert normal.get_size() == (200, 100)
+    
     def test_draw_button_hover(self, reset_font_cache, mock_pygame_font):
         """Test drawing a button with hover effect"""
         _, _, mock_font = mock_pygame_font
@@ -178,6 +236,7 @@ class TestThemeManager:
         
         # Patch pygame.draw.rect to prevent it from being called with our mock
         with patch('pygame.draw.rect') as mock_draw_rect, \
+            patch('pygame.Surface'), \
             patch.object(ThemeManager, 'render_text', return_value=mock_text_surf) as mock_render:
             
             # Draw a button with hover effect
@@ -214,6 +273,7 @@ class TestThemeManager:
         
         # Patch pygame.draw.rect to prevent it from being called with our mock
         with patch('pygame.draw.rect') as mock_draw_rect, \
+            patch('pygame.Surface'), \
             patch.object(ThemeManager, 'render_text', return_value=mock_text_surf) as mock_render:
             
             # Draw a button with custom colors
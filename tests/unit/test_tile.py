@@ -200,6 +200,30 @@ class TestTile:
         # Verify scaled image was blitted
         mock_screen.blit.assert_called_once()
     
+    def test_draw_dragging_reuses_scaled_image(self, test_tile, mock_transform):
+        """Test the enlarged drag sprite is only scaled on the first frame"""
+        mock_screen = MagicMock(spec=pygame.Surface)
+        test_tile.dragging = True
+        mock_transform.reset_mock()
+        
+        for _ in range(5):
+            test_tile.draw(mock_screen)
+        
+        assert mock_transform.call_count == 1
+        assert mock_screen.blit.call_count == 5
+    
+    def test_draw_highlighted_reuses_tinted_image(self, test_tile):
+        """Test the highlight tint is built once and blitted as a single sprite"""
+        mock_screen = MagicMock()
+        test_tile.set_highlight(True, "valid")
+        
+        with patch('pygame.Surface', return_value=MagicMock()) as mock_surface_class:
+            for _ in range(3):
+                test_tile.draw(mock_screen)
+            
+            mock_surface_class.assert_called_once()
+            assert mock_screen.blit.call_count == 3
+    
     def test_getters(self, test_tile):
         """Test all getter methods"""
         # Set up tile position
@@ -319,4 +343,35 @@ class TestTile:
         test_tile.reset_joker()
         
         # Verify tile was not affected
-        assert test_tile.number == 8
\ No newline at end of file
+        assert test_tile.number == 8
+    def test_tile_is_slotted_view_over_spec(self, test_tile):
+        """Test tiles carry no per-instance dict and expose their spec"""
+        from rummikub.rules import TileSpec
+
+        assert not hasattr(test_tile, '__dict__')
+        assert isinstance(test_tile.spec, TileSpec)
+        assert test_tile.spec == TileSpec(test_tile.id, test_tile.number, test_tile.color, test_tile.is_joker)
+
+        with pytest.raises(AttributeError):
+            test_tile.color = 'blue'
+        with pytest.raises(AttributeError):
+            test_tile.spec.number = 3
+
+    def test_joker_number_overrides_spec(self, joker_tile):
+        """Test assigning a joker's value leaves its spec untouched"""
+        from rummikub.rules import to_spec
+
+        joker_tile.number = 9
+        assert joker_tile.spec.number == 0
+        assert to_spec(joker_tile).number == 9
+
+    def test_from_spec(self, mock_image, mock_transform):
+        """Test building a drawable tile from a spec"""
+        from rummikub.rules import TileSpec
+
+        spec = TileSpec(7, 11, 'black', False)
+        with patch('pygame.image.load', return_value=mock_image):
+            tile = Tile.from_spec(spec, "path/to/tile_11_black.png")
+
+        assert tile.spec == spec
+        assert (tile.id, tile.number, tile.color, tile.is_joker) == (7, 11, 'black', False)
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import sys
 import io
 
-from rummikub.utils import Graph
+from rummikub.utils import Graph, segment_rows
 
 class TestGraph:
     """Unit tests for the Graph class in utils.py"""
@@ -30,12 +30,12 @@ class TestGraph:
         """Test graph initialization"""
         # Check graph dimensions
         assert test_graph.size == 10
-        assert test_graph.matrix.shape == (10, 10)
+        assert test_graph.cell_size == 200
         assert test_graph.vertex_data.shape == (10, 3)
         
-        # Check matrix initialization
-        np.testing.assert_equal(np.diag(test_graph.matrix), np.zeros(10))
-        assert np.all(test_graph.matrix[~np.eye(10, dtype=bool)] == np.inf)
+        # Check the spatial grid starts empty
+        assert test_graph.grid == {}
+        assert test_graph.cells == {}
         
         # Check vertex data initialization
         assert np.all(test_graph.vertex_data == -1)
@@ -67,9 +67,9 @@ class TestGraph:
         # Calculate expected distance
         expected_distance = np.sqrt((300-100)**2 + (400-200)**2)
         
-        # Check distance matrix
-        assert test_graph.matrix[1][2] == pytest.approx(expected_distance)
-        assert test_graph.matrix[2][1] == pytest.approx(expected_distance)
+        # Check distances
+        assert test_graph.distance(1, 2) == pytest.approx(expected_distance)
+        assert test_graph.distance(2, 1) == pytest.approx(expected_distance)
     
     def test_update_tile(self, test_graph, mock_tile):
         """Test updating a tile's position"""
@@ -91,9 +91,9 @@ class TestGraph:
         # Calculate expected new distance
         expected_distance = np.sqrt((300-150)**2 + (400-250)**2)
         
-        # Check distance matrix was updated
-        assert test_graph.matrix[1][2] == pytest.approx(expected_distance)
-        assert test_graph.matrix[2][1] == pytest.approx(expected_distance)
+        # Check distances were updated
+        assert test_graph.distance(1, 2) == pytest.approx(expected_distance)
+        assert test_graph.distance(2, 1) == pytest.approx(expected_distance)
     
     def test_update_all_tiles(self, test_graph, mock_tile):
         """Test updating all tiles at once"""
@@ -124,9 +124,9 @@ class TestGraph:
         # Calculate expected new distance
         expected_distance = np.sqrt((350-150)**2 + (450-250)**2)
         
-        # Check distance matrix was updated
-        assert test_graph.matrix[1][2] == pytest.approx(expected_distance)
-        assert test_graph.matrix[2][1] == pytest.approx(expected_distance)
+        # Check distances were updated
+        assert test_graph.distance(1, 2) == pytest.approx(expected_distance)
+        assert test_graph.distance(2, 1) == pytest.approx(expected_distance)
     
     def test_reset_tile_data(self, test_graph, mock_tile):
         """Test resetting a tile's data"""
@@ -143,13 +143,10 @@ class TestGraph:
         # Check vertex data was reset
         assert np.all(test_graph.vertex_data[1] == -1)
 
-        # Check distances were reset, accounting for diagonal element
-        # Create expected array with all inf except diagonal
-        expected = np.full(test_graph.matrix.shape[1], np.inf)
-        expected[1] = 0  # Diagonal element is 0
-        
-        # Compare with actual matrix row
-        assert np.array_equal(test_graph.matrix[1, :], expected)
+        # Check the tile left the grid and distances to it are infinite
+        assert not test_graph.is_active(1)
+        assert test_graph.grid == {}
+        assert test_graph.distance(1, 2) == np.inf
     
     def test_remove_tile_by_id(self, test_graph, mock_tile):
         """Test removing a tile by ID"""
@@ -198,6 +195,53 @@ class TestGraph:
         assert nearest_id == 3
         assert distance == pytest.approx(98.99, abs=0.1)
     
+    def test_grid_bucketing(self, test_graph, mock_tile):
+        """Test tiles are bucketed by cell and re-bucketed when they move"""
+        tile = mock_tile(1, 450, 120)
+        test_graph.add_tile(tile)
+        assert test_graph.cells[1] == (2, 0)
+        assert test_graph.grid == {(2, 0): {1}}
+        
+        # Move the tile into another cell
+        test_graph.update_tile(mock_tile(1, 50, 650))
+        assert test_graph.cells[1] == (0, 3)
+        assert test_graph.grid == {(0, 3): {1}}
+    
+    def test_get_neighbors(self, test_graph, mock_tile):
+        """Test neighbour queries only return tiles within range"""
+        test_graph.add_tile(mock_tile(1, 100, 100))
+        test_graph.add_tile(mock_tile(2, 250, 100))  # 150 away
+        test_graph.add_tile(mock_tile(3, 100, 390))  # 290 away
+        
+        neighbors = dict(test_graph.get_neighbors(1, 200))
+        assert neighbors == {2: pytest.approx(150)}
+        
+        neighbors = dict(test_graph.get_neighbors(1, 300))
+        assert set(neighbors) == {2, 3}
+    
+    def test_get_nearest_neighbor_far_away(self, test_graph, mock_tile):
+        """Test the nearest neighbour is found beyond the first ring of cells"""
+        tile1 = mock_tile(1, 0, 0)
+        test_graph.add_tile(tile1)
+        test_graph.add_tile(mock_tile(2, 1000, 0))
+        test_graph.add_tile(mock_tile(3, 0, 900))
+        
+        assert test_graph.get_nearest_neighbor(tile1) == (3, pytest.approx(900))
+    
+    def test_get_nearest_neighbor_alone(self, test_graph, mock_tile):
+        """Test a lone tile has no nearest neighbour"""
+        tile1 = mock_tile(1, 0, 0)
+        test_graph.add_tile(tile1)
+        
+        assert test_graph.get_nearest_neighbor(tile1) == (-1, np.inf)
+    
+    def test_tile_ids_beyond_max_size(self, test_graph, mock_tile):
+        """Test the graph grows for custom tile sets with larger ids"""
+        test_graph.add_tile(mock_tile(25, 100, 100))
+        
+        assert test_graph.size >= 26
+        assert test_graph.vertex_data[25][2] == 25
+    
     def test_kruskals_msf_single_component(self, test_graph, mock_tile):
         """Test Kruskal's algorithm with tiles close enough to form a single component"""
         # Create tiles in a cluster (all within 100 units)
@@ -265,6 +309,56 @@ class TestGraph:
         # Should return empty list
         assert forests == []
     
+    def test_components_merge_on_add(self, mock_tile):
+        """Test that a tile bridging two components merges them"""
+        graph = Graph(max_size=10)
+        graph.add_tile(mock_tile(1, 0, 0))
+        graph.add_tile(mock_tile(2, 400, 0))
+        assert sorted(graph.get_components()) == [[1], [2]]
+        
+        graph.add_tile(mock_tile(3, 200, 0))
+        assert graph.get_components() == [[1, 2, 3]]
+        assert graph.get_component(2) == [1, 2, 3]
+    
+    def test_components_split_on_remove(self, mock_tile):
+        """Test that removing a bridging tile splits its component"""
+        graph = Graph(max_size=10)
+        for tid, x in enumerate([0, 130, 260, 390, 520]):
+            graph.add_tile(mock_tile(tid, x, 0))
+        graph.add_tile(mock_tile(9, 0, 1000))  # Unrelated component
+        
+        graph.remove_tile_by_id(2)
+        assert sorted(graph.get_components()) == [[0, 1], [3, 4], [9]]
+        assert graph.get_component(2) == []
+    
+    def test_components_follow_moves(self, mock_tile):
+        """Test that moving a tile re-links it to its new neighbours"""
+        graph = Graph(max_size=10)
+        graph.add_tile(mock_tile(1, 0, 0))
+        graph.add_tile(mock_tile(2, 130, 0))
+        graph.add_tile(mock_tile(3, 0, 800))
+        
+        graph.update_tile(mock_tile(2, 130, 800))
+        assert sorted(graph.get_components()) == [[1], [2, 3]]
+    
+    def test_components_match_kruskals(self, mock_tile):
+        """Test incremental components agree with a from-scratch spanning forest"""
+        import random
+        rng = random.Random(3)
+        graph = Graph(max_size=60)
+        tiles = {}
+        for step in range(300):
+            tid = rng.randrange(60)
+            if tid in tiles and rng.random() < 0.3:
+                graph.remove_tile_by_id(tid)
+                del tiles[tid]
+            else:
+                tiles[tid] = mock_tile(tid, rng.randrange(0, 2000), rng.randrange(0, 1200))
+                graph.add_tile(tiles[tid])
+        
+        expected = sorted(sorted(v) for v, _ in graph.kruskals_msf(tiles, graph.link_distance))
+        assert sorted(graph.get_components()) == expected
+    
     def test_print_forests(self, test_graph, mock_tile, capsys):
         """Test printing forests"""
         # Set up a simple forest structure
@@ -284,4 +378,35 @@ class TestGraph:
         
         # Check output contains expected strings
         assert "Active Sets:" in captured.out
-        assert "[1, 2]" in captured.out
\ No newline at end of file
+        assert "[1, 2]" in captured.out
+
+
+class TestSegmentRows:
+    """Unit tests for row-aware meld segmentation"""
+    
+    def test_splits_rows_at_gaps(self):
+        """Test a row is split wherever the horizontal step exceeds max_step"""
+        positions = {1: (0, 0), 2: (130, 0), 3: (260, 0), 4: (700, 0), 5: (830, 0)}
+        
+        sets = segment_rows(positions, max_step=200)
+        
+        assert sorted(sets) == [[1, 2, 3], [4, 5]]
+    
+    def test_adjacent_rows_stay_separate(self):
+        """Test vertically adjacent rows are never merged"""
+        positions = {1: (0, 0), 2: (130, 0), 3: (0, 200), 4: (130, 200)}
+        
+        sets = segment_rows(positions, max_step=200)
+        
+        assert sorted(sets) == [[1, 2], [3, 4]]
+    
+    def test_orders_tiles_by_x(self):
+        """Test tiles within a row are returned left to right"""
+        positions = {7: (260, 50), 3: (0, 50), 5: (130, 50)}
+        
+        assert segment_rows(positions, max_step=200) == [[3, 5, 7]]
+    
+    def test_empty(self):
+        """Test an empty board has no sets"""
+        assert segment_rows({}, max_step=200) == []
+
@@ -0,0 +1,83 @@
+# tests/unit/test_vectorized.py
+import random
+
+import numpy as np
+import pytest
+
+from rummikub import rules
+from rummikub.rules import TileSpec
+from rummikub.rules.encoding import COLORS, JOKER_FLAG, EMPTY
+from rummikub.rules.vectorized import pack_melds, valid_groups, valid_runs, valid_sets
+
+
+class TestEncoding:
+    """Unit tests for the bit-packed tile encoding"""
+
+    def test_round_trip(self):
+        """Every regular tile survives encode/decode"""
+        for color in COLORS:
+            for number in range(1, 14):
+                code = rules.encode(number, color)
+                assert 0 < code < JOKER_FLAG
+                assert rules.decode(code) == (number, color, False)
+
+    def test_joker_ignores_assigned_number(self):
+        """Jokers encode to the bare flag whatever number they stand for"""
+        assert rules.encode_tile(TileSpec(1, 7, "joker", True)) == JOKER_FLAG
+        assert rules.decode(JOKER_FLAG) == (0, "joker", True)
+
+    def test_invalid_values(self):
+        """Unknown colors and out-of-range numbers are rejected"""
+        with pytest.raises(ValueError):
+            rules.encode(14, "red")
+        with pytest.raises(ValueError):
+            rules.encode(5, "green")
+
+
+class TestVectorized:
+    """Unit tests for the NumPy batch validators"""
+
+    @pytest.fixture
+    def random_melds(self):
+        """Random melds biased toward near-valid groups and runs"""
+        rng = random.Random(42)
+
+        def tile():
+            if rng.random() < 0.1:
+                return TileSpec(0, 0, "joker", True)
+            number = rng.randint(1, 13) if rng.random() < 0.5 else rng.choice([5, 6, 7])
+            color = rng.choice(COLORS) if rng.random() < 0.5 else "red"
+            return TileSpec(0, number, color)
+
+        return [[tile() for _ in range(rng.randint(1, 8))] for _ in range(5000)]
+
+    def test_pack_melds_pads_with_empty(self):
+        """Short melds are right-padded with EMPTY"""
+        packed = pack_melds([[TileSpec(0, 1, "red")], [TileSpec(0, 2, "red")] * 3])
+        assert packed.shape == (2, 3)
+        assert packed.dtype == np.uint8
+        assert list(packed[0, 1:]) == [EMPTY, EMPTY]
+
+    def test_pack_melds_width_too_small(self):
+        """Melds wider than the requested width are rejected"""
+        with pytest.raises(ValueError):
+            pack_melds([[TileSpec(0, 1, "red")] * 4], width=3)
+
+    def test_matches_scalar_rules(self, random_melds):
+        """Batch results agree with the scalar validators on every meld"""
+        packed = pack_melds(random_melds, width=8)
+
+        assert list(valid_groups(packed)) == [rules.is_valid_group(m) for m in random_melds]
+        assert list(valid_runs(packed)) == [rules.is_valid_run(m) for m in random_melds]
+        assert list(valid_sets(packed)) == [rules.is_valid_set(m) for m in random_melds]
+
+    def test_examples(self):
+        """Spot-check a few hand-written melds"""
+        joker = TileSpec(0, 0, "joker", True)
+        melds = [
+            [TileSpec(0, 8, "red"), TileSpec(0, 8, "blue"), joker],
+            [TileSpec(0, 3, "red"), joker, TileSpec(0, 5, "red")],
+            [TileSpec(0, 3, "red"), TileSpec(0, 5, "red"), TileSpec(0, 7, "red")],
+        ]
+        mask = valid_sets(pack_melds(melds))
+        assert list(mask) == [True, True, False]